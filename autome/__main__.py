@@ -0,0 +1,3 @@
+from autome.cli import cli
+
+cli()
@@ -2,6 +2,21 @@ from autome.automatas.finite_automata.machine import (
     DeterministicFiniteAutomata,
     NonDeterministicFiniteAutomata,
 )
+from autome.automatas.finite_automata.builder import AutomatonBuilder
+from autome.automatas.finite_automata.cache import (
+    OperationCache,
+    disable_cache,
+    enable_cache,
+    operation_cache,
+)
+from autome.automatas.finite_automata.closure import EpsilonClosureIndex
+from autome.automatas.finite_automata.compiled import CompiledAutomata
+from autome.automatas.finite_automata.cursor import DFACursor
+from autome.automatas.finite_automata.expression import Expression
+from autome.automatas.finite_automata.lazy import LazyDFA
+from autome.automatas.finite_automata.simulation import BitParallelNFA
 from autome.automatas.finite_automata.state import State
 from autome.automatas.finite_automata.transition import Transition
 from autome.automatas.finite_automata.parsers import JFlapConverter, JSONConverter
+from autome.automatas.finite_automata.scanner import FileScanner
+from autome.automatas.finite_automata.storage import AutomatonStore
@@ -0,0 +1,170 @@
+from array import array
+from typing import Callable, Dict, Hashable, List, Set, Tuple
+
+from autome.automatas.finite_automata.storage import AutomatonStore
+
+
+class AutomatonBuilder:
+    """
+    Incremental construction of a finite automata, with O(1) amortized adds.
+
+    States are integers returned by add_state, and transitions go straight into array columns,
+    while an index of the destinies of each (origin, symbol) pair is kept up to date to drop
+    duplicates (and, on deterministic builders, conflicting transitions). freeze() turns the
+    columns into an immutable AutomatonStore and the automata backed by it, which is a snapshot:
+    the automata itself can still be changed like any other, building its own objects and
+    leaving the store untouched.
+
+    Builders are usually created with DeterministicFiniteAutomata.builder() or
+    NonDeterministicFiniteAutomata.builder(), which set @factory.
+
+    Args:
+        deterministic (bool): whether each state may have a single transition by each symbol
+        factory (Callable[[AutomatonStore], object]): creates the frozen automata from its storage
+    """
+
+    def __init__(
+        self,
+        deterministic: bool = True,
+        factory: Callable[[AutomatonStore], object] = None,
+    ) -> None:
+        self.deterministic = deterministic
+        self.factory = factory
+        self.initial: int = None
+        self.accepting: List[int] = []
+        self.types: Dict[int, str] = {}
+        self.names: Dict[int, str] = {}
+        self.alphabet: List[Hashable] = []
+        self.symbol_ids: Dict[Hashable, int] = {}
+        self.origins = array("i")
+        self.symbols = array("i")
+        self.destinies = array("i")
+        self.index: Dict[Tuple[int, int], Set[int]] = {}
+        self.size = 0
+        self.frozen = False
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add_state(
+        self, initial=False, accept=False, type: str = None, name: str = None
+    ) -> int:
+        """Adds a new state
+
+        Args:
+            initial (bool): whether it's the initial state, there can only be one
+            accept (bool): whether it's an acceptance state
+            type (str): the type of the state
+            name (str): the name of the state, q{id} by default
+
+        Returns:
+            int: the id of the state
+        """
+        self._check()
+        state = self.size
+        self.size += 1
+
+        if initial:
+            if self.initial is not None:
+                raise ValueError("An automata can only have one initial state")
+
+            self.initial = state
+
+        if accept:
+            self.accepting.append(state)
+
+        if type is not None:
+            self.types[state] = type
+
+        if name is not None:
+            self.names[state] = name
+
+        return state
+
+    def add_transition(self, origin: int, destiny: int, symbol: Hashable) -> bool:
+        """Adds a new transition, unless it already exists
+
+        Args:
+            origin (int): id of the state from which the transition starts
+            destiny (int): id of the state where the transition ends
+            symbol (Hashable): trigger symbol of the transition
+
+        Returns:
+            bool: False if the transition already existed
+        """
+        self._check()
+
+        if not (0 <= origin < self.size and 0 <= destiny < self.size):
+            raise ValueError(f"Unknown state in transition {origin} → {destiny}")
+
+        symbol_id = self.symbol_ids.get(symbol)
+
+        if symbol_id is None:
+            symbol_id = self.symbol_ids[symbol] = len(self.alphabet)
+            self.alphabet.append(symbol)
+
+        destinies = self.index.setdefault((origin, symbol_id), set())
+
+        if destiny in destinies:
+            return False
+
+        if self.deterministic and destinies:
+            raise ValueError(
+                f"State {origin} already has a transition by {symbol!r} on a deterministic automata"
+            )
+
+        destinies.add(destiny)
+        self.origins.append(origin)
+        self.symbols.append(symbol_id)
+        self.destinies.append(destiny)
+
+        return True
+
+    def successors(self, origin: int, symbol: Hashable) -> Set[int]:
+        """The destinies of the transitions of @origin by @symbol"""
+        symbol_id = self.symbol_ids.get(symbol)
+
+        return set(self.index.get((origin, symbol_id), ()))
+
+    def freeze(self):
+        """Finishes the construction, no state or transition can be added to the builder afterwards.
+
+        Deterministic automatas are compiled at once, so they're ready to run. The automata is
+        not read only, but changing it never affects the frozen store (see AutomatonBuilder).
+
+        Returns:
+            DeterministicFiniteAutomata: the automata built by the factory, or the AutomatonStore if there's no factory
+        """
+        self._check()
+
+        if self.initial is None:
+            raise ValueError("An automata must have an initial state")
+
+        self.frozen = True
+        self.index = {}
+
+        store = AutomatonStore.from_arrays(
+            self.size,
+            self.origins,
+            self.symbols,
+            self.destinies,
+            self.alphabet,
+            self.accepting,
+            self.initial,
+            self.types,
+            self.names,
+        )
+
+        if self.factory is None:
+            return store
+
+        machine = self.factory(store)
+
+        if self.deterministic:
+            machine.compile()
+
+        return machine
+
+    def _check(self) -> None:
+        if self.frozen:
+            raise ValueError("The builder was already frozen")
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterator, Optional
+
+# Default number of results kept by an OperationCache before the least recently used is evicted
+CACHE_SIZE = 1024
+
+# The cache used by automata operations, None while caching is disabled
+_active: "OperationCache" = None
+
+
+class OperationCache:
+    """
+    Least recently used cache of the results of automata operations (products,
+    determinizations, minimizations and regex blocks).
+
+    Keys are built by each operation from the fingerprints (see canonical.py) of its operands, or
+    from their structure when the result doesn't only depend on their languages. Results are
+    never handed out directly: every call gets its own clone, so callers may change them freely.
+
+    Args:
+        max_size (int): maximum number of results kept
+    """
+
+    def __init__(self, max_size: int = CACHE_SIZE) -> None:
+        self.max_size = max(max_size, 1)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._results
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._results),
+        }
+
+    def lookup(self, key: Hashable, compute: Callable):
+        """Returns a clone of the result cached for @key, calling @compute to build it on a miss
+
+        Args:
+            key (Hashable): the operation and its operands
+            compute (Callable): builds the result, called without holding the cache lock
+
+        Returns:
+            DeterministicFiniteAutomata: the result of the operation
+        """
+        with self._lock:
+            result = self._results.get(key)
+
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+
+                return result.clone()
+
+            self.misses += 1
+
+        result = compute()
+
+        with self._lock:
+            self._results[key] = result.clone()
+            self._results.move_to_end(key)
+
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+def enable_cache(max_size: int = CACHE_SIZE) -> OperationCache:
+    """Starts caching automata operations on a new cache, which replaces the current one
+
+    Returns:
+        OperationCache: the new cache
+    """
+    global _active
+    _active = OperationCache(max_size)
+
+    return _active
+
+
+def disable_cache() -> None:
+    global _active
+    _active = None
+
+
+def active_cache() -> Optional[OperationCache]:
+    return _active
+
+
+@contextmanager
+def operation_cache(max_size: int = CACHE_SIZE) -> Iterator[OperationCache]:
+    """Caches automata operations within a with block, restoring the previous cache (or none) on exit"""
+    global _active
+    previous = _active
+    cache = enable_cache(max_size)
+
+    try:
+        yield cache
+    finally:
+        _active = previous
+
+
+def memoize(key: Callable[[], Hashable], compute: Callable):
+    """Runs @compute through the active cache, if there's one.
+
+    The key is only built when caching is enabled, since it usually requires fingerprints.
+
+    Args:
+        key (Callable[[], Hashable]): builds the cache key
+        compute (Callable): builds the result
+    """
+    cache = _active
+
+    if cache is None:
+        return compute()
+
+    return cache.lookup(key(), compute)
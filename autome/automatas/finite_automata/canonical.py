@@ -0,0 +1,115 @@
+from hashlib import sha256
+from typing import Dict, Hashable, List, Tuple
+
+from autome.automatas.finite_automata.compiled import CompiledAutomata
+from autome.automatas.finite_automata.minimization import hopcroft
+from autome.automatas.finite_automata.state import State
+from autome.automatas.finite_automata.transition import Transition
+
+# A state of the canonical form: whether it accepts, its type and its (symbol, destiny) pairs,
+# symbols being positions on the sorted alphabet
+Row = Tuple[bool, str, Tuple[Tuple[int, int], ...]]
+
+
+def canonical(table: CompiledAutomata) -> Tuple[List[Hashable], List[Row]]:
+    """Canonical form of the language of @table.
+
+    The table is minimized (Hopcroft, without sink) and its states are renumbered in breadth
+    first order from the initial state, visiting symbols in sorted order. The minimal automata
+    is unique up to the names of its states, and that numbering fixes the names, so two tables
+    get the same form if and only if they accept the same language (and agree on state types,
+    which minimization never merges).
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+
+    Returns:
+        Tuple[List[Hashable], List[Row]]: the sorted alphabet and the rows of each state, the initial one being 0
+    """
+    states, transitions = hopcroft(table)
+
+    alphabet = sorted(
+        set(transition.symbol for transition in transitions), key=_symbol_order
+    )
+    rank = {symbol: position for position, symbol in enumerate(alphabet)}
+
+    # Only the existing transitions are listed, so sparse automatas stay cheap to fingerprint
+    edges: Dict[int, List[Tuple[int, State]]] = {id(state): [] for state in states}
+
+    for transition in transitions:
+        edges[id(transition.origin)].append(
+            (rank[transition.symbol], transition.destiny)
+        )
+
+    for edge in edges.values():
+        edge.sort(key=lambda pair: pair[0])
+
+    order = [states[0]]
+    position = {id(states[0]): 0}
+
+    for state in order:
+        for _, reached in edges[id(state)]:
+            if id(reached) not in position:
+                position[id(reached)] = len(order)
+                order.append(reached)
+
+    rows = [
+        (
+            bool(state.accept),
+            state.type,
+            tuple(
+                (symbol, position[id(reached)]) for symbol, reached in edges[id(state)]
+            ),
+        )
+        for state in order
+    ]
+
+    return alphabet, rows
+
+
+def fingerprint(table: CompiledAutomata) -> str:
+    """A sha256 digest of the canonical form of @table, equal for tables accepting the same language
+
+    Returns:
+        str: the hex digest
+    """
+    alphabet, rows = canonical(table)
+
+    return sha256(repr((alphabet, rows)).encode("utf-8")).hexdigest()
+
+
+def structure(
+    states: List[State], transitions: List[Transition], deterministic: bool = True
+) -> str:
+    """A sha256 digest of the states and transitions of an automata, ignoring state names.
+
+    Unlike fingerprint, it tells apart automatas built differently for the same language, so it
+    keys operations whose results depend on structure, like determinize.
+
+    Returns:
+        str: the hex digest
+    """
+    index: Dict[State, int] = {}
+
+    for state in states:
+        index.setdefault(state, len(index))
+
+    data = (
+        deterministic,
+        [(bool(state.initial), bool(state.accept), state.type) for state in states],
+        [
+            (
+                index.get(transition.origin),
+                transition.symbol,
+                index.get(transition.destiny),
+            )
+            for transition in transitions
+        ],
+    )
+
+    return sha256(repr(data).encode("utf-8")).hexdigest()
+
+
+def _symbol_order(symbol: Hashable):
+    # Symbols of different types (such as str and int) can't be compared with each other
+    return (type(symbol).__name__, symbol)
@@ -0,0 +1,221 @@
+from typing import Dict, Hashable, Iterable, Iterator, List, Set, Tuple
+
+from autome.automatas.finite_automata.state import State
+from autome.automatas.finite_automata.transition import Transition
+
+# Translation table from 0 and 1 bytes to the "0" and "1" digits
+DIGITS = b"01" + bytes(254)
+
+
+class EpsilonClosureIndex:
+    """
+    Integer indexed view of a NonDeterministicFiniteAutomata with every epsilon closure precomputed.
+
+    Sets of states are Python ints used as bitsets (bit i is the state with id i). The closure of
+    each single state is computed once, over the strongly connected components of the epsilon
+    transitions: states of a component share the same closure, and components are visited in
+    reverse topological order, so each closure is the union of the closures of the components it
+    points to. The closure of any set of states is then the union of cached entries.
+
+    The successors of each state by each symbol are also kept as masks already closed under
+    epsilon transitions, which is everything a subset construction or a simulation needs.
+
+    Args:
+        states (Iterable[State]): states of the automata, the position of a state is its id
+        transitions (Iterable[Transition]): transitions of the automata
+        accept (bytearray): the accept bitmap of @states (see DeterministicFiniteAutomata.accept_bitmap), if known
+    """
+
+    def __init__(
+        self,
+        states: Iterable[State],
+        transitions: Iterable[Transition],
+        accept: bytearray = None,
+    ) -> None:
+        self.state_index: Dict[State, int] = {}
+        self.states: List[State] = []
+
+        for state in states:
+            if state not in self.state_index:
+                self.state_index[state] = len(self.states)
+                self.states.append(state)
+
+        epsilon: List[List[int]] = [[] for _ in self.states]
+        successors: Dict[Hashable, List[List[int]]] = {}
+
+        for transition in transitions:
+            origin = self.state_index.get(transition.origin)
+            destiny = self.state_index.get(transition.destiny)
+
+            if origin is None or destiny is None:
+                continue
+
+            if transition.symbol == "&":
+                epsilon[origin].append(destiny)
+            else:
+                if transition.symbol not in successors:
+                    successors[transition.symbol] = [[] for _ in self.states]
+                successors[transition.symbol][origin].append(destiny)
+
+        self.closures: List[int] = self._closures(epsilon)
+
+        # successor masks of each symbol, already closed under epsilon transitions
+        self.successors: Dict[Hashable, List[int]] = {}
+
+        for symbol, destinies in successors.items():
+            masks = []
+
+            for reached in destinies:
+                mask = 0
+                for destiny in reached:
+                    mask |= self.closures[destiny]
+                masks.append(mask)
+
+            self.successors[symbol] = masks
+
+        # the same masks, grouped by state
+        self.outgoing: List[Dict[Hashable, int]] = [{} for _ in self.states]
+
+        for symbol, masks in self.successors.items():
+            for state, mask in enumerate(masks):
+                if mask:
+                    self.outgoing[state][symbol] = mask
+
+        self.final = 0
+
+        if accept is not None and len(accept) == len(self.states):
+            # Reversed, the bitmap reads as the binary digits of the mask
+            self.final = int(accept[::-1].translate(DIGITS) or b"0", 2)
+        else:
+            for index, state in enumerate(self.states):
+                if state.accept:
+                    self.final |= 1 << index
+
+    @classmethod
+    def _components(cls, epsilon: List[List[int]]) -> Iterator[List[int]]:
+        """Tarjan's algorithm (iterative), yields the strongly connected components in reverse topological order"""
+        index = [-1] * len(epsilon)
+        low = [0] * len(epsilon)
+        on_stack = [False] * len(epsilon)
+        stack: List[int] = []
+        counter = 0
+
+        for root in range(len(epsilon)):
+            if index[root] != -1:
+                continue
+
+            work: List[Tuple[int, int]] = [(root, 0)]
+
+            while work:
+                node, child = work.pop()
+
+                if child == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+
+                edges = epsilon[node]
+                descended = False
+
+                while child < len(edges):
+                    destiny = edges[child]
+                    child += 1
+
+                    if index[destiny] == -1:
+                        work.append((node, child))
+                        work.append((destiny, 0))
+                        descended = True
+                        break
+
+                    if on_stack[destiny]:
+                        low[node] = min(low[node], index[destiny])
+
+                if descended:
+                    continue
+
+                if low[node] == index[node]:
+                    component = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    yield component
+
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+    @classmethod
+    def _closures(cls, epsilon: List[List[int]]) -> List[int]:
+        closures = [0] * len(epsilon)
+
+        for component in cls._components(epsilon):
+            mask = 0
+
+            for member in component:
+                mask |= 1 << member
+
+            # Components reached from this one were already yielded, so their closures are done
+            for member in component:
+                for destiny in epsilon[member]:
+                    mask |= closures[destiny]
+
+            for member in component:
+                closures[member] = mask
+
+        return closures
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def mask(self, states: Iterable[int]) -> int:
+        """Epsilon closure of a set of state ids, as a mask"""
+        mask = 0
+
+        for state in states:
+            mask |= self.closures[state]
+
+        return mask
+
+    def step(self, mask: int, symbol: Hashable) -> int:
+        """Mask of the states reached from the states in @mask by reading @symbol"""
+        masks = self.successors.get(symbol)
+        reached = 0
+
+        if masks is not None:
+            for state in self.ids(mask):
+                reached |= masks[state]
+
+        return reached
+
+    def moves(self, mask: int) -> Dict[Hashable, int]:
+        """Masks of the states reached from the states in @mask by every symbol at once"""
+        moves: Dict[Hashable, int] = {}
+
+        for state in self.ids(mask):
+            for symbol, reached in self.outgoing[state].items():
+                moves[symbol] = moves.get(symbol, 0) | reached
+
+        return moves
+
+    @classmethod
+    def ids(cls, mask: int) -> Iterator[int]:
+        """The state ids in @mask"""
+        # Scanning the binary representation skips runs of zeros in C, unlike shifting the mask
+        bits = bin(mask)[:1:-1]
+        state = bits.find("1")
+
+        while state != -1:
+            yield state
+            state = bits.find("1", state + 1)
+
+    def closure(self, states: Iterable[State]) -> Set[State]:
+        """Epsilon closure of a set of states"""
+        mask = self.mask(self.state_index[state] for state in states)
+        return {self.states[state] for state in self.ids(mask)}
@@ -0,0 +1,491 @@
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from autome.automatas.finite_automata.layout import DEAD, RowLayout
+from autome.automatas.finite_automata.state import State
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    numpy = None
+
+# Translation table swapping 0 and 1, used to flip accept flags
+FLIP = bytes([1, 0]) + bytes(254)
+
+# Characters encoded alone and in pairs by check_encoding, skipping those an encoding can't represent
+ENCODING_SAMPLES = "a+ç€あ"
+
+
+class CompiledAutomata:
+    """
+    Integer indexed transition table of a finite automata, built to run acceptance tests in O(|word|).
+
+    States are numbered from 0 to n - 1 and symbols that behave the same way on every state are
+    grouped into equivalence classes, numbered from 0 to k - 1 (see equivalence_classes). Each row
+    of the table is an array('i') holding the destiny of every class, or DEAD if there's no such
+    transition. The table is never modified after being built.
+
+    Acceptance tests run over a RowLayout (see layout.py), which keeps dense rows for narrow or
+    well filled states and sparse rows for the others, picked state by state. When some row is
+    sparse the dense rows are dropped: algorithms read the table state by state (see destiny and
+    edges), so a sparse table stays sparse.
+
+    Args:
+        states (List[State]): the state of each id
+        symbol_index (Dict[Hashable, int]): the class of each known symbol
+        rows (List[array]): the destiny of each class, for every state
+        accept (bytearray): 1 for acceptance states
+        initial (int): id of the initial state
+        layout (RowLayout): the layout of the rows, built from @rows if not given
+    """
+
+    def __init__(
+        self,
+        states: List[State],
+        symbol_index: Dict[Hashable, int],
+        rows: List[array],
+        accept: bytearray,
+        initial: int,
+        layout: RowLayout = None,
+    ) -> None:
+        self.states = states
+        self.symbol_index = symbol_index
+        self.accept = accept
+        self.initial = initial
+
+        if layout is None:
+            layout = RowLayout(rows, len(rows[0]) if rows else 0)
+
+        self.width = layout.width
+        self.layout = layout
+        # Rows of completed layouts keep DEAD for their missing transitions, so they can't be read directly
+        self._rows: List[array] = (
+            layout.rows if layout.dense and layout.missing == DEAD else None
+        )
+
+        # Byte level tables know every byte, so bytes can be translated into classes at once
+        self.translation: bytes = None
+
+        if len(symbol_index) == 256 and all(
+            isinstance(symbol, int) for symbol in symbol_index
+        ):
+            self.translation = bytes(symbol_index[byte] for byte in range(256))
+
+        self._vectorized = None
+        self._encoded: Dict[str, "CompiledAutomata"] = {}
+        self._complemented: "CompiledAutomata" = None
+
+    @classmethod
+    def build(cls, machine) -> "CompiledAutomata":
+        """Compiles the transitions of @machine into a dense table.
+
+        When a state has more than one transition by the same symbol the first one on the
+        transition list wins.
+
+        Args:
+            machine (DeterministicFiniteAutomata): the automata being compiled
+
+        Returns:
+            CompiledAutomata: the compiled table
+        """
+        state_index: Dict[State, int] = {}
+        states: List[State] = []
+
+        for state in machine.states:
+            if state not in state_index:
+                state_index[state] = len(states)
+                states.append(state)
+
+        symbols = []
+        symbol_index = {}
+
+        for transition in machine.transitions:
+            if transition.symbol not in symbol_index:
+                symbol_index[transition.symbol] = len(symbols)
+                symbols.append(transition.symbol)
+
+        empty = array("i", [DEAD]) * len(symbols)
+        rows = [array("i", empty) for _ in states]
+
+        for transition in machine.transitions:
+            origin = state_index.get(transition.origin)
+            destiny = state_index.get(transition.destiny)
+
+            if origin is None or destiny is None:
+                continue
+
+            row = rows[origin]
+            column = symbol_index[transition.symbol]
+
+            if row[column] == DEAD:
+                row[column] = destiny
+
+        if len(states) == len(machine.states):
+            # Without repeated states the ids are positions, so the bitmap of the automata is shared
+            accept = machine.accept_bitmap()
+        else:
+            accept = bytearray(1 if state.accept else 0 for state in states)
+
+        initial = state_index[machine.initial()]
+
+        return cls(states, *equivalence_classes(symbols, rows), accept, initial)
+
+    @property
+    def rows(self) -> List[array]:
+        """The dense rows of the table. When they were dropped they are rebuilt on every call,
+        which takes n·k memory: prefer destiny and edges on tables that may be sparse.
+        """
+        if self._rows is None:
+            return self.layout.dense_rows()
+
+        return self._rows
+
+    def destiny(self, state: int, column: int) -> int:
+        """The state reached from @state by the class @column, or DEAD"""
+        return self.layout.destiny(state, column)
+
+    def edges(self, state: int) -> Iterator[Tuple[int, int]]:
+        """The (class, destiny) pairs of the transitions of @state, in order of class"""
+        return self.layout.edges(state)
+
+    @property
+    def symbols(self) -> List[Hashable]:
+        return list(self.symbol_index)
+
+    @property
+    def classes(self) -> List[List[Hashable]]:
+        """The symbols of each equivalence class"""
+        classes = [[] for _ in range(self.width)]
+
+        for symbol, column in self.symbol_index.items():
+            classes[column].append(symbol)
+
+        return classes
+
+    def encoded(self, encoding: str = "utf-8") -> "CompiledAutomata":
+        """Builds (once) a version of the table that reads the bytes of the encoded input instead of characters.
+
+        Every transition by a character is expanded into a path over the bytes of its encoding,
+        which adds intermediate states (with no State object) for multi-byte characters. The
+        resulting table accepts a bytes object if and only if this one accepts its decoded text.
+
+        Args:
+            encoding (str): a stateless, prefix-free encoding, such as utf-8 (see check_encoding)
+
+        Returns:
+            CompiledAutomata: the byte level table, whose symbols are ints from 0 to 255
+
+        Raises:
+            ValueError: if @encoding is unknown, stateful, or not prefix-free over the symbols of the table
+        """
+        if encoding in self._encoded:
+            return self._encoded[encoding]
+
+        check_encoding(encoding)
+
+        states: List[State] = list(self.states)
+        accept = bytearray(self.accept)
+        edges: Dict[int, Dict[int, int]] = {state: {} for state in range(len(states))}
+
+        characters: List[List[str]] = [[] for _ in range(self.width)]
+        last: Set[Tuple[int, int]] = set()
+
+        for symbol, column in self.symbol_index.items():
+            if isinstance(symbol, str) and len(symbol) == 1:
+                characters[column].append(symbol)
+
+        for origin in range(len(self.states)):
+            for column, destiny in self.edges(origin):
+                for symbol in characters[column]:
+                    data = symbol.encode(encoding)
+                    current = origin
+
+                    for byte in data[:-1]:
+                        if (current, byte) in last:
+                            raise ValueError(_ambiguous(encoding))
+
+                        if byte not in edges[current]:
+                            edges[current][byte] = len(states)
+                            edges[len(states)] = {}
+                            states.append(None)
+                            accept.append(0)
+
+                        current = edges[current][byte]
+
+                    # The last byte may only be shared with characters of the same encoding
+                    if data[-1] in edges[current] and (
+                        (current, data[-1]) not in last
+                        or edges[current][data[-1]] != destiny
+                    ):
+                        raise ValueError(_ambiguous(encoding))
+
+                    edges[current][data[-1]] = destiny
+                    last.add((current, data[-1]))
+
+        # Every byte gets a column, unused bytes end up in the same class as any other dead column
+        empty = array("i", [DEAD]) * 256
+        rows = [array("i", empty) for _ in states]
+
+        for origin, edge in edges.items():
+            for byte, destiny in edge.items():
+                rows[origin][byte] = destiny
+
+        table = CompiledAutomata(
+            states, *equivalence_classes(range(256), rows), accept, self.initial
+        )
+        self._encoded[encoding] = table
+
+        return table
+
+    def complemented(self) -> "CompiledAutomata":
+        """Builds (once) the table of the complement, relative to the alphabet of this table: it
+        accepts every word over the known symbols that this table rejects.
+
+        The complement shares the states, symbols and rows of this table and only flips the
+        accept flags. Completion is done lazily: only when some row has missing transitions a
+        trap state (with no State object) is added, and the rows are still shared, their missing
+        transitions being read as the trap (see RowLayout.completed). Complementing a table costs
+        n bytes, plus the row of the trap.
+
+        Returns:
+            CompiledAutomata: the complement table, whose complement is this table again
+        """
+        if self._complemented is not None:
+            return self._complemented
+
+        trap = len(self.states)
+        states = self.states
+        layout = self.layout
+        accept = self.accept.translate(FLIP)
+
+        if not layout.complete():
+            states = list(states) + [None]
+            layout = layout.completed(trap)
+            accept.append(1)
+
+        table = CompiledAutomata(
+            states, self.symbol_index, None, accept, self.initial, layout
+        )
+        table._complemented = self
+        self._complemented = table
+
+        return table
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def accepts(self, word) -> bool:
+        """Runs the computation for @word walking over the table, without touching any State object
+
+        Args:
+            word (str): the input word
+
+        Returns:
+            bool: True if the automata stops in an acceptance state
+        """
+        return self.is_accepting(self.advance(self.initial, word))
+
+    def advance(self, state: int, word) -> int:
+        """Walks over the table starting from @state and reading every symbol in @word
+
+        Args:
+            state (int): the starting state id
+            word (str): the symbols to be read
+
+        Returns:
+            int: the id of the reached state, or DEAD if the computation got stuck
+        """
+        index = self.symbol_index
+
+        if state == DEAD:
+            return DEAD
+
+        if self._rows is None:
+            if self.translation is not None and isinstance(word, bytes):
+                return self.layout.advance(state, word.translate(self.translation))
+
+            return self.layout.advance(state, map(index.get, word))
+
+        rows = self._rows
+
+        if self.translation is not None and isinstance(word, bytes):
+            for column in word.translate(self.translation):
+                state = rows[state][column]
+
+                if state == DEAD:
+                    return DEAD
+
+            return state
+
+        for character in word:
+            column = index.get(character)
+
+            if column is None:
+                return DEAD
+
+            state = rows[state][column]
+
+            if state == DEAD:
+                return DEAD
+
+        return state
+
+    def is_accepting(self, state: int) -> bool:
+        return state != DEAD and self.accept[state] == 1
+
+    def vectorized(self):
+        """Builds (once) the NumPy version of the table used by accepts_many.
+
+        The dense table has two extra rows and columns: row n is a dead sink, column k is
+        taken by any unknown symbol (leading to the sink) and column k + 1 is the padding
+        used for short words, which keeps every state where it is.
+
+        Returns:
+            Tuple: the [state, column] -> state table, the accept vector and a code point -> column lookup
+        """
+        if numpy is None:
+            raise ImportError(
+                "accepts_many requires numpy, install it with `pip install autome[numpy]`"
+            )
+
+        if self._vectorized is not None:
+            return self._vectorized
+
+        sink = len(self.states)
+        unknown = self.width
+
+        table = numpy.full((sink + 1, unknown + 2), sink, dtype=numpy.intp)
+
+        if unknown > 0 and sink > 0:
+            rows = numpy.array([row.tolist() for row in self.rows], dtype=numpy.intp)
+            table[:sink, :unknown] = numpy.where(rows == DEAD, sink, rows)
+
+        table[:, unknown + 1] = numpy.arange(sink + 1)
+
+        accept = numpy.zeros(sink + 1, dtype=bool)
+        accept[:sink] = numpy.frombuffer(bytes(self.accept), dtype=numpy.uint8) == 1
+
+        # Only single character symbols may be read while iterating over a str
+        characters = {
+            ord(symbol): column
+            for symbol, column in self.symbol_index.items()
+            if isinstance(symbol, str) and len(symbol) == 1
+        }
+
+        lookup = numpy.full(max(characters, default=-1) + 2, unknown, dtype=numpy.intp)
+
+        for code, column in characters.items():
+            lookup[code] = column
+
+        self._vectorized = (table, accept, lookup)
+
+        return self._vectorized
+
+    def accepts_many(self, words: Iterable[str], batch_size: int = 4096):
+        """Runs the computation for many words at once.
+
+        Each batch of words is packed into a padded matrix of columns, one row per word, and the
+        whole batch is advanced one character at a time with a single NumPy gather.
+
+        Args:
+            words (Iterable[str]): the input words
+            batch_size (int): how many words are packed into the same matrix
+
+        Returns:
+            numpy.ndarray: boolean array, True for every accepted word
+        """
+        table, accept, lookup = self.vectorized()
+        padding = self.width + 1
+
+        words = list(words)
+        result = numpy.zeros(len(words), dtype=bool)
+
+        for start in range(0, len(words), batch_size):
+            batch = words[start : start + batch_size]
+
+            lengths = numpy.fromiter(
+                map(len, batch), dtype=numpy.intp, count=len(batch)
+            )
+            width = int(lengths.max())
+
+            codes = numpy.frombuffer(
+                "".join(batch).encode("utf-32-le"), dtype=numpy.uint32
+            )
+            columns = lookup[numpy.minimum(codes, len(lookup) - 1)]
+
+            matrix = numpy.full(
+                (len(batch), width), padding, dtype=numpy.intp, order="F"
+            )
+            matrix[numpy.arange(width) < lengths[:, None]] = columns
+
+            states = numpy.full(len(batch), self.initial, dtype=numpy.intp)
+
+            for position in range(width):
+                states = table[states, matrix[:, position]]
+
+            result[start : start + len(batch)] = accept[states]
+
+        return result
+
+
+def check_encoding(encoding: str) -> None:
+    """Checks that text in @encoding can be scanned byte by byte: encoding two characters one at a
+    time must give the same bytes as encoding them together, which rules out byte order marks and
+    stateful encodings. Prefix-freeness is checked by CompiledAutomata.encoded, over the symbols
+    of each table.
+
+    Raises:
+        ValueError: if @encoding is unknown or fails the check
+    """
+    samples = []
+
+    for character in ENCODING_SAMPLES:
+        try:
+            samples.append((character, character.encode(encoding)))
+        except UnicodeEncodeError:
+            continue
+        except LookupError:
+            raise ValueError(f"Unknown encoding {encoding}")
+
+    for first, data in samples:
+        for second, other in samples:
+            if not data or (first + second).encode(encoding) != data + other:
+                raise ValueError(
+                    f"Encoding {encoding} can't be scanned byte by byte, its characters depend on their context"
+                )
+
+
+def _ambiguous(encoding: str) -> str:
+    return f"Encoding {encoding} is not prefix-free over the symbols of the automata"
+
+
+def equivalence_classes(
+    symbols: Sequence[Hashable], rows: List[array]
+) -> Tuple[Dict[Hashable, int], List[array]]:
+    """Groups symbols into equivalence classes: two symbols are equivalent when they lead to the
+    same destiny from every state, so they can share a single column of the table.
+
+    Automatas over large alphabets (unicode text, bytes) usually have only a handful of classes,
+    which makes rows much shorter.
+
+    Args:
+        symbols (Sequence[Hashable]): the symbol of each column of @rows
+        rows (List[array]): the destiny of each symbol, for every state
+
+    Returns:
+        Tuple[Dict[Hashable, int], List[array]]: the class of each symbol and the rows indexed by class
+    """
+    signatures: Dict[Tuple[int, ...], int] = {}
+    representatives: List[int] = []
+    symbol_index: Dict[Hashable, int] = {}
+
+    for column, signature in enumerate(zip(*rows)):
+        if signature not in signatures:
+            signatures[signature] = len(representatives)
+            representatives.append(column)
+
+        symbol_index[symbols[column]] = signatures[signature]
+
+    rows = [array("i", [row[column] for column in representatives]) for row in rows]
+
+    return symbol_index, rows
@@ -0,0 +1,110 @@
+from collections import deque
+from typing import Deque, Iterable
+
+from autome.automatas.finite_automata.compiled import DEAD, CompiledAutomata
+from autome.automatas.finite_automata.state import State
+from autome.automatas.finite_automata.transition import Transition
+
+
+class DFACursor:
+    """
+    Resumable computation over a compiled automata, for inputs that arrive in chunks.
+
+    The cursor only keeps the id of the current state and how many symbols were read so far,
+    so memory usage doesn't depend on the size of the input. A computation can be resumed
+    later by creating a new cursor with the saved state and position.
+
+    All the state of a computation lives in the cursor, the compiled table is only read, so
+    any number of cursors (one per thread, for instance) can share the same table.
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        state (int): state id to start from, the initial state by default
+        position (int): how many symbols were already read
+        trace (int): size of the ring buffer keeping the last executed transitions, disabled if 0
+    """
+
+    def __init__(
+        self,
+        table: CompiledAutomata,
+        state: int = None,
+        position: int = 0,
+        trace: int = 0,
+    ):
+        self.table = table
+        self.state = table.initial if state is None else state
+        self.position = position
+        self.trace: Deque[Transition] = deque(maxlen=trace) if trace > 0 else None
+
+    def step(self, character) -> bool:
+        """Reads a single symbol, recording the executed transition when tracing is enabled
+
+        Returns:
+            bool: False once the computation got stuck
+        """
+        origin = self.state
+        self.position += 1
+        self.state = self.table.advance(origin, (character,))
+
+        if self.state == DEAD:
+            return False
+
+        if self.trace is not None:
+            states = self.table.states
+            self.trace.append(Transition(states[origin], states[self.state], character))
+
+        return True
+
+    def feed(self, chunk) -> bool:
+        """Reads every symbol of @chunk, continuing from where the last chunk stopped
+
+        Args:
+            chunk (str): next piece of the input
+
+        Returns:
+            bool: False once the computation got stuck, in which case no input will be accepted
+        """
+        if self.trace is not None:
+            for character in chunk:
+                if not self.step(character):
+                    break
+            return self.state != DEAD
+
+        self.position += len(chunk)
+        self.state = self.table.advance(self.state, chunk)
+
+        return self.state != DEAD
+
+    def feed_all(self, chunks: Iterable) -> bool:
+        """Feeds every chunk from @chunks (a file, a generator...), stopping early once the computation got stuck
+
+        Returns:
+            bool: the same result as finish()
+        """
+        for chunk in chunks:
+            if not self.feed(chunk):
+                break
+
+        return self.finish()
+
+    def finish(self) -> bool:
+        """Returns whether the input read so far is accepted. The cursor can still be fed afterwards."""
+        return self.table.is_accepting(self.state)
+
+    def reset(self) -> None:
+        self.state = self.table.initial
+        self.position = 0
+
+        if self.trace is not None:
+            self.trace.clear()
+
+    @property
+    def alive(self) -> bool:
+        return self.state != DEAD
+
+    @property
+    def current_state(self) -> State:
+        return None if self.state == DEAD else self.table.states[self.state]
+
+    def __repr__(self):
+        return f"DFACursor(state: {self.current_state}, position: {self.position})"
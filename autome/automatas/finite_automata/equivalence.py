@@ -0,0 +1,188 @@
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from autome.automatas.finite_automata.compiled import DEAD, CompiledAutomata
+from autome.automatas.finite_automata.product import move, symbol_groups
+
+
+class Verdict:
+    """
+    Result of a language check, truthy when the property holds. When it doesn't, @counterexample
+    is a word that proves it (accepted by one side and rejected by the other).
+
+    Args:
+        holds (bool): whether the property holds
+        counterexample (str): a word disproving it, or None
+    """
+
+    def __init__(self, holds: bool, counterexample: Optional[str] = None) -> None:
+        self.holds = holds
+        self.counterexample = counterexample
+
+    def __bool__(self) -> bool:
+        return self.holds
+
+    def __repr__(self) -> str:
+        if self.holds:
+            return "Verdict(holds=True)"
+
+        return f"Verdict(holds=False, counterexample={self.counterexample!r})"
+
+
+def equivalent(left: CompiledAutomata, right: CompiledAutomata) -> Verdict:
+    """Checks whether both tables accept the same language
+
+    Returns:
+        Verdict: truthy if they do, otherwise holding a word accepted by only one of them
+    """
+    return hopcroft_karp(
+        (left.initial, right.initial),
+        symbol_groups(left, right),
+        lambda state, key: _alive(move(left, state, key[0])),
+        lambda state, key: _alive(move(right, state, key[1])),
+        left.is_accepting,
+        right.is_accepting,
+    )
+
+
+def is_subset(left: CompiledAutomata, right: CompiledAutomata) -> Verdict:
+    """Checks whether every word accepted by @left is accepted by @right.
+
+    That's the case if and only if the union of both languages is the language of @right, so
+    the check compares the (implicit) union product against @right.
+
+    Returns:
+        Verdict: truthy if it is, otherwise holding a word accepted by @left but not by @right
+    """
+
+    def union(pair: Tuple[int, int], key: Tuple[int, int]):
+        reached = (move(left, pair[0], key[0]), move(right, pair[1], key[1]))
+
+        return None if reached == (DEAD, DEAD) else reached
+
+    return hopcroft_karp(
+        ((left.initial, right.initial), right.initial),
+        symbol_groups(left, right),
+        union,
+        lambda state, key: _alive(move(right, state, key[1])),
+        lambda pair: left.is_accepting(pair[0]) or right.is_accepting(pair[1]),
+        right.is_accepting,
+    )
+
+
+def is_empty(table: CompiledAutomata) -> Verdict:
+    """Checks whether @table accepts no word at all, with a breadth first search over the existing
+    transitions that stops at the first acceptance state
+
+    Returns:
+        Verdict: truthy if it is, otherwise holding the shortest word accepted by @table
+    """
+    classes = table.classes
+    trail: Dict[int, Tuple] = {table.initial: None}
+    queue = deque([table.initial])
+
+    while queue:
+        state = queue.popleft()
+
+        if table.is_accepting(state):
+            return Verdict(False, _word(trail, state))
+
+        for column, reached in table.edges(state):
+            if reached not in trail:
+                trail[reached] = (state, classes[column][0])
+                queue.append(reached)
+
+    return Verdict(True)
+
+
+def hopcroft_karp(
+    initial: Tuple[Hashable, Hashable],
+    groups: Dict[Tuple[int, int], List[Hashable]],
+    step_left: Callable,
+    step_right: Callable,
+    accept_left: Callable,
+    accept_right: Callable,
+) -> Verdict:
+    """Hopcroft and Karp's equivalence check, near linear in the number of states of both sides.
+
+    Starting from the pair of initial states, every pair of states reached by the same word is
+    assumed to be equivalent and merged on a union-find structure. A pair whose states already
+    belong to the same set is skipped, so at most n + m - 1 pairs are ever expanded, instead of
+    the n·m pairs of the full product. The assumption fails if and only if some pair disagrees
+    on acceptance, and the word that reached it is returned as counterexample.
+
+    States are any hashable values, with None standing for the dead state of both sides.
+
+    Args:
+        initial (Tuple[Hashable, Hashable]): the initial state of each side
+        groups (Dict[Tuple[int, int], List[Hashable]]): the symbols read on each step, by step key
+        step_left (Callable): (state, key) -> reached state of the left side, or None
+        step_right (Callable): (state, key) -> reached state of the right side, or None
+        accept_left (Callable): state -> whether a state of the left side is accepting
+        accept_right (Callable): state -> whether a state of the right side is accepting
+
+    Returns:
+        Verdict: truthy if both sides accept the same language
+    """
+    parent: Dict[Hashable, Hashable] = {}
+
+    def find(node: Hashable) -> Hashable:
+        parent.setdefault(node, node)
+
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+
+        return node
+
+    def merge(pair: Tuple[Hashable, Hashable]) -> bool:
+        # Dead states of both sides are the same node, they are always equivalent
+        left = find(None if pair[0] is None else (0, pair[0]))
+        right = find(None if pair[1] is None else (1, pair[1]))
+
+        if left == right:
+            return False
+
+        parent[left] = right
+
+        return True
+
+    trail: Dict[Tuple[Hashable, Hashable], Tuple] = {initial: None}
+    queue = deque([initial])
+    merge(initial)
+
+    while queue:
+        pair = queue.popleft()
+
+        left_accepts = pair[0] is not None and accept_left(pair[0])
+        right_accepts = pair[1] is not None and accept_right(pair[1])
+
+        if left_accepts != right_accepts:
+            return Verdict(False, _word(trail, pair))
+
+        for key, symbols in groups.items():
+            reached = (
+                None if pair[0] is None else step_left(pair[0], key),
+                None if pair[1] is None else step_right(pair[1], key),
+            )
+
+            if merge(reached):
+                trail[reached] = (pair, symbols[0])
+                queue.append(reached)
+
+    return Verdict(True)
+
+
+def _alive(state: int) -> Optional[int]:
+    return None if state == DEAD else state
+
+
+def _word(trail: Dict[Hashable, Tuple], node: Hashable) -> str:
+    """Follows the trail of states (or pairs) back to the initial one, collecting the symbols read"""
+    symbols = []
+
+    while trail[node] is not None:
+        node, symbol = trail[node]
+        symbols.append(symbol)
+
+    return "".join(reversed(symbols))
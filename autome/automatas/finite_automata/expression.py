@@ -0,0 +1,407 @@
+from array import array
+from typing import Dict, FrozenSet, Hashable, List, Tuple
+
+from autome.automatas.finite_automata.compiled import (
+    DEAD,
+    CompiledAutomata,
+    equivalence_classes,
+)
+from autome.automatas.finite_automata.equivalence import Verdict, hopcroft_karp
+from autome.automatas.finite_automata.product import OPERATIONS, hopeless
+from autome.automatas.finite_automata.state import State
+
+# State of a complement whose operand is DEAD: every word over the alphabet is accepted from it
+TRAP = -2
+
+
+class Expression:
+    """
+    Unevaluated expression over automatas, built with the |, &, -, ^ and ~ operators.
+
+    An expression is a DAG whose leaves are compiled automatas (see
+    DeterministicFiniteAutomata.expression) and whose nodes are products and complements. Nothing
+    is built up front: a state of the expression is a tree of states of its leaves, and queries
+    only compute the states they reach. Transitions computed from the root are cached, so running
+    many words over the same expression reuses them, and intermediate automatas are never built.
+
+    A state of any node is DEAD when no word is accepted from it anymore, which prunes the
+    exploration as early as the product construction does (see product.py). Complements are
+    relative to the alphabet of their operand: the symbols of the automatas below them.
+    """
+
+    def __init__(self) -> None:
+        self._transitions: Dict[Hashable, Dict[Hashable, Hashable]] = {}
+        self._leaves: List["Operand"] = None
+
+    @property
+    def alphabet(self) -> FrozenSet[Hashable]:
+        raise NotImplementedError()
+
+    def initial(self) -> Hashable:
+        raise NotImplementedError()
+
+    def step(self, state: Hashable, symbol: Hashable) -> Hashable:
+        """The state reached from @state by reading @symbol, without caching, or DEAD"""
+        raise NotImplementedError()
+
+    def accepting(self, state: Hashable) -> bool:
+        raise NotImplementedError()
+
+    def type(self, state: Hashable) -> str:
+        raise NotImplementedError()
+
+    def children(self) -> Tuple["Expression", ...]:
+        return ()
+
+    def leaves(self) -> List["Operand"]:
+        """The distinct automatas of the expression, in order of appearance"""
+        if self._leaves is None:
+            leaves: Dict[int, Operand] = {}
+            stack: List[Expression] = [self]
+
+            while stack:
+                node = stack.pop()
+
+                if isinstance(node, Operand):
+                    leaves.setdefault(id(node.table), node)
+
+                stack.extend(reversed(node.children()))
+
+            self._leaves = list(leaves.values())
+
+        return self._leaves
+
+    @property
+    def explored(self) -> int:
+        """How many states of the expression were expanded by queries so far"""
+        return len(self._transitions)
+
+    def move(self, state: Hashable, symbol: Hashable) -> Hashable:
+        """Same as step, caching the result"""
+        transitions = self._transitions.get(state)
+
+        if transitions is None:
+            transitions = self._transitions[state] = {}
+
+        reached = transitions.get(symbol)
+
+        if reached is None:
+            reached = transitions[symbol] = self.step(state, symbol)
+
+        return reached
+
+    def accepts(self, word) -> bool:
+        """Runs the computation for @word, expanding only the states it goes through
+
+        Args:
+            word (str): the input word
+
+        Returns:
+            bool: True if the expression accepts the word
+        """
+        state = self.initial()
+
+        for character in word:
+            state = self.move(state, character)
+
+            if state == DEAD:
+                return False
+
+        return self.accepting(state)
+
+    def symbol_groups(self) -> Dict[Tuple[int, ...], List[Hashable]]:
+        """Groups the symbols of the alphabet by their class on each automata of the expression,
+        symbols of the same group lead every state to the same state"""
+        leaves = self.leaves()
+        groups: Dict[Tuple[int, ...], List[Hashable]] = {}
+        seen = set()
+
+        for leaf in leaves:
+            for symbol in leaf.table.symbol_index:
+                if symbol in seen:
+                    continue
+
+                seen.add(symbol)
+                key = tuple(
+                    other.table.symbol_index.get(symbol, DEAD) for other in leaves
+                )
+                groups.setdefault(key, []).append(symbol)
+
+        return groups
+
+    def is_empty(self) -> Verdict:
+        """Checks whether the expression accepts no word at all, stopping at the first accepting
+        state found (see equivalence.hopcroft_karp)
+
+        Returns:
+            Verdict: truthy if it doesn't, otherwise holding the shortest accepted word
+        """
+        groups = self.symbol_groups()
+
+        def step(state: Hashable, key: Tuple[int, ...]) -> Hashable:
+            reached = self.move(state, groups[key][0])
+            return None if reached == DEAD else reached
+
+        return hopcroft_karp(
+            (self.initial(), None),
+            groups,
+            step,
+            lambda state, key: None,
+            self.accepting,
+            lambda state: False,
+        )
+
+    def compile(self) -> CompiledAutomata:
+        """Builds the transition table of every state reachable from the initial one, except DEAD states
+
+        Returns:
+            CompiledAutomata: the compiled expression
+        """
+        groups = self.symbol_groups()
+        initial = self.initial()
+
+        index: Dict[Hashable, int] = {initial: 0}
+        pending: List[Hashable] = [initial]
+        rows: List[array] = []
+
+        for state in pending:
+            row = array("i")
+
+            for symbols in groups.values():
+                reached = self.move(state, symbols[0])
+
+                if reached != DEAD and reached not in index:
+                    index[reached] = len(pending)
+                    pending.append(reached)
+
+                row.append(DEAD if reached == DEAD else index[reached])
+
+            rows.append(row)
+
+        # Groups are merged further when they behave the same on the reached states only
+        representatives = [symbols[0] for symbols in groups.values()]
+        classes, rows = equivalence_classes(representatives, rows)
+        symbol_index = {
+            symbol: classes[symbols[0]]
+            for symbols in groups.values()
+            for symbol in symbols
+        }
+
+        states = [
+            State(
+                initial=position == 0,
+                accept=self.accepting(state),
+                type=self.type(state),
+            )
+            for position, state in enumerate(pending)
+        ]
+        accept = bytearray(1 if state.accept else 0 for state in states)
+
+        return CompiledAutomata(states, symbol_index, rows, accept, 0)
+
+    def materialize(self):
+        """Builds the automata of the expression (see compile), its objects are created on demand
+
+        Returns:
+            DeterministicFiniteAutomata: an automata accepting the language of the expression
+        """
+        return self.leaves()[0].machine.from_table(self.compile())
+
+    def __or__(self, other) -> "Expression":
+        return self._combine("union", other)
+
+    def __and__(self, other) -> "Expression":
+        return self._combine("intersection", other)
+
+    def __sub__(self, other) -> "Expression":
+        return self._combine("difference", other)
+
+    def __xor__(self, other) -> "Expression":
+        return self._combine("symmetric_difference", other)
+
+    def __ror__(self, other) -> "Expression":
+        return self._combine("union", other, reflected=True)
+
+    def __rand__(self, other) -> "Expression":
+        return self._combine("intersection", other, reflected=True)
+
+    def __rsub__(self, other) -> "Expression":
+        return self._combine("difference", other, reflected=True)
+
+    def __rxor__(self, other) -> "Expression":
+        return self._combine("symmetric_difference", other, reflected=True)
+
+    def __invert__(self) -> "Expression":
+        return Complement(self)
+
+    def _combine(self, operation: str, other, reflected=False) -> "Expression":
+        if not isinstance(other, Expression):
+            if not hasattr(other, "expression"):
+                return NotImplemented
+
+            other = other.expression()
+
+        if reflected:
+            return Combination(operation, other, self)
+
+        return Combination(operation, self, other)
+
+
+class Operand(Expression):
+    """
+    Leaf of an expression, reading the compiled table of an automata. Its states are table ids.
+
+    Args:
+        machine (DeterministicFiniteAutomata): the automata
+    """
+
+    def __init__(self, machine) -> None:
+        super().__init__()
+        self.machine = machine
+        self.table: CompiledAutomata = machine.compile()
+
+    @property
+    def alphabet(self) -> FrozenSet[Hashable]:
+        return frozenset(self.table.symbol_index)
+
+    def initial(self) -> int:
+        return self.table.initial
+
+    def step(self, state: int, symbol: Hashable) -> int:
+        column = self.table.symbol_index.get(symbol)
+
+        if column is None:
+            return DEAD
+
+        return self.table.destiny(state, column)
+
+    def accepting(self, state: int) -> bool:
+        return self.table.is_accepting(state)
+
+    def type(self, state: int) -> str:
+        original = self.table.states[state]
+        return original.type if original is not None else None
+
+    def __repr__(self) -> str:
+        return f"Operand({len(self.table)} states)"
+
+
+class Complement(Expression):
+    """
+    Words over the alphabet of @operand that it rejects. States are the states of the operand,
+    or TRAP once the operand is DEAD.
+
+    Args:
+        operand (Expression): the complemented expression
+    """
+
+    def __init__(self, operand: Expression) -> None:
+        super().__init__()
+        self.operand = operand
+        self._alphabet: FrozenSet[Hashable] = None
+
+    @property
+    def alphabet(self) -> FrozenSet[Hashable]:
+        if self._alphabet is None:
+            self._alphabet = self.operand.alphabet
+
+        return self._alphabet
+
+    def children(self) -> Tuple[Expression, ...]:
+        return (self.operand,)
+
+    def initial(self) -> Hashable:
+        return self.operand.initial()
+
+    def step(self, state: Hashable, symbol: Hashable) -> Hashable:
+        if symbol not in self.alphabet:
+            return DEAD
+
+        if state == TRAP:
+            return TRAP
+
+        reached = self.operand.step(state, symbol)
+
+        return TRAP if reached == DEAD else reached
+
+    def accepting(self, state: Hashable) -> bool:
+        return state == TRAP or not self.operand.accepting(state)
+
+    def type(self, state: Hashable) -> str:
+        return None if state == TRAP else self.operand.type(state)
+
+    def __repr__(self) -> str:
+        return f"~{self.operand!r}"
+
+
+class Combination(Expression):
+    """
+    Synchronous product of two expressions under @operation, one of the keys of
+    product.OPERATIONS. States are pairs of states of both sides.
+
+    Args:
+        operation (str): "intersection", "union", "difference" or "symmetric_difference"
+        left (Expression): the first operand
+        right (Expression): the second operand
+    """
+
+    def __init__(self, operation: str, left: Expression, right: Expression) -> None:
+        super().__init__()
+        self.operation = operation
+        self.left = left
+        self.right = right
+        self._accepts = OPERATIONS[operation]
+        self._alphabet: FrozenSet[Hashable] = None
+
+        self._hopeless_left, self._hopeless_right = hopeless(operation)
+
+    @property
+    def alphabet(self) -> FrozenSet[Hashable]:
+        if self._alphabet is None:
+            self._alphabet = self.left.alphabet | self.right.alphabet
+
+        return self._alphabet
+
+    def children(self) -> Tuple[Expression, ...]:
+        return (self.left, self.right)
+
+    def initial(self) -> Tuple[Hashable, Hashable]:
+        return (self.left.initial(), self.right.initial())
+
+    def step(self, state: Tuple[Hashable, Hashable], symbol: Hashable) -> Hashable:
+        left, right = state
+
+        if left != DEAD:
+            left = self.left.step(left, symbol)
+
+            if left == DEAD and self._hopeless_left:
+                return DEAD
+
+        if right != DEAD:
+            right = self.right.step(right, symbol)
+
+            if right == DEAD and self._hopeless_right:
+                return DEAD
+
+        if left == DEAD and right == DEAD:
+            return DEAD
+
+        return (left, right)
+
+    def accepting(self, state: Tuple[Hashable, Hashable]) -> bool:
+        left, right = state
+
+        return self._accepts(
+            left != DEAD and self.left.accepting(left),
+            right != DEAD and self.right.accepting(right),
+        )
+
+    def type(self, state: Tuple[Hashable, Hashable]) -> str:
+        left, right = state
+
+        return (None if left == DEAD else self.left.type(left)) or (
+            None if right == DEAD else self.right.type(right)
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.operation}({self.left!r}, {self.right!r})"
@@ -0,0 +1,282 @@
+import sys
+from array import array
+from bisect import bisect_left
+from copy import copy
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Destiny used on transition tables when there's no transition for a (state, symbol) pair
+DEAD = -1
+
+DENSE = 0
+SORTED = 1
+HASH = 2
+
+NAMES = {DENSE: "dense", SORTED: "sorted", HASH: "hash"}
+
+# Rows with up to this many classes are always dense, they're small anyway and keep the plain table loop
+DENSE_WIDTH = 32
+
+# Sparse rows with up to this many transitions are binary searched, larger ones are hashed
+SORTED_FANOUT = 8
+
+
+class RowLayout:
+    """
+    Per state representation of the rows of a compiled table, chosen from the fan-out of each state.
+
+    Every row is one of:
+        - dense: the array('i') of the table, indexed by class. Reading it is a single index
+          operation, and it's the smallest layout for narrow or well filled rows.
+        - hash: a dict from class to destiny, holding only the live transitions. Lookups cost
+          about the same as dense rows, for a fraction of the memory on wide sparse rows.
+        - sorted: the live classes of the row, sorted, and their destinies, stored in two arrays
+          shared by every sorted row and binary searched. The most compact layout, kept for rows
+          with at most SORTED_FANOUT transitions, which take a few probes.
+
+    A row is dense when it has at most DENSE_WIDTH classes or when that takes no more memory than
+    hashing it, so tables over small alphabets (after grouping symbols into classes) stay fully
+    dense and run the plain table loop.
+
+    Missing transitions (DEAD on dense rows, absent classes on sparse rows) lead to @missing:
+    DEAD, or the trap state of a completed layout (see completed), so rows are shared as they are.
+
+    Args:
+        rows (List[array]): the dense rows of the table
+        width (int): number of classes of the table
+    """
+
+    def __init__(self, rows: List[array], width: int) -> None:
+        self.width = width
+        self.missing = DEAD
+        self.kinds = bytearray(len(rows))
+        self.rows: List[object] = []
+
+        # Sorted rows are the [lower[state], upper[state]) slice of the shared arrays, which are
+        # only allocated once some row is sorted
+        self.lower: array = None
+        self.upper: array = None
+        self.columns = array("i")
+        self.destinies = array("i")
+
+        for state, row in enumerate(rows):
+            if width <= DENSE_WIDTH:
+                self.rows.append(row)
+                continue
+
+            fanout = width - row.count(DEAD)
+
+            if _dense_bytes(width) <= _dict_bytes(fanout):
+                self.rows.append(row)
+                continue
+
+            live = [
+                (column, destiny)
+                for column, destiny in enumerate(row)
+                if destiny != DEAD
+            ]
+
+            if fanout <= SORTED_FANOUT:
+                if self.lower is None:
+                    self.lower = array("q", bytes(8 * len(rows)))
+                    self.upper = array("q", bytes(8 * len(rows)))
+
+                self.kinds[state] = SORTED
+                self.rows.append(None)
+                self.lower[state] = len(self.columns)
+                self.columns.extend(column for column, _ in live)
+                self.destinies.extend(destiny for _, destiny in live)
+                self.upper[state] = len(self.columns)
+            else:
+                self.kinds[state] = HASH
+                self.rows.append(dict(live))
+
+        self.dense = self.kinds.count(DENSE) == len(rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def completed(self, trap: int) -> "RowLayout":
+        """A copy of this layout where every missing transition leads to a new trap state, numbered
+        @trap, which loops on every class. Every row is shared as it is, only the trap row is added.
+
+        Args:
+            trap (int): id of the trap state, the number of rows
+
+        Returns:
+            RowLayout: the completed layout
+        """
+        layout = copy(self)
+        layout.missing = trap
+        layout.kinds = self.kinds + bytes([DENSE])
+        layout.rows = self.rows + [array("i", [trap]) * self.width]
+
+        return layout
+
+    def complete(self) -> bool:
+        """Whether every state has a transition by every class"""
+        if self.missing != DEAD:
+            return True
+
+        return not any(
+            kind != DENSE or DEAD in row for kind, row in zip(self.kinds, self.rows)
+        )
+
+    def kind(self, state: int) -> str:
+        """The layout chosen for @state: "dense", "sorted" or "hash" """
+        return NAMES[self.kinds[state]]
+
+    def destiny(self, state: int, column: int) -> int:
+        """The destiny of @state by the class @column, or @missing"""
+        kind = self.kinds[state]
+
+        if kind == DENSE:
+            destiny = self.rows[state][column]
+        elif kind == HASH:
+            destiny = self.rows[state].get(column, DEAD)
+        else:
+            lower, upper = self.lower[state], self.upper[state]
+            position = bisect_left(self.columns, column, lower, upper)
+
+            if position < upper and self.columns[position] == column:
+                destiny = self.destinies[position]
+            else:
+                destiny = DEAD
+
+        return self.missing if destiny == DEAD else destiny
+
+    def edges(self, state: int) -> Iterator[Tuple[int, int]]:
+        """The (class, destiny) pairs of the transitions of @state, in order of class"""
+        kind = self.kinds[state]
+
+        if self.missing != DEAD:
+            return (
+                (column, self.destiny(state, column)) for column in range(self.width)
+            )
+
+        if kind == DENSE:
+            row = self.rows[state]
+            return (
+                (column, destiny)
+                for column, destiny in enumerate(row)
+                if destiny != DEAD
+            )
+
+        if kind == HASH:
+            return iter(self.rows[state].items())
+
+        lower, upper = self.lower[state], self.upper[state]
+
+        return zip(self.columns[lower:upper], self.destinies[lower:upper])
+
+    def advance(self, state: int, columns: Iterable[Optional[int]]) -> int:
+        """Walks over the rows starting from @state and reading every class in @columns
+
+        Args:
+            state (int): the starting state id
+            columns (Iterable[Optional[int]]): the classes to be read, None for unknown symbols
+
+        Returns:
+            int: the id of the reached state, or DEAD if the computation got stuck
+        """
+        missing = self.missing
+        kinds = self.kinds
+        rows = self.rows
+        lower = self.lower
+        upper = self.upper
+        sorted_columns = self.columns
+        destinies = self.destinies
+
+        for column in columns:
+            if column is None or state == DEAD:
+                return DEAD
+
+            kind = kinds[state]
+
+            if kind == DENSE:
+                state = rows[state][column]
+            elif kind == HASH:
+                state = rows[state].get(column, DEAD)
+            else:
+                start = lower[state]
+                end = upper[state]
+                position = (
+                    start
+                    if end - start < 2
+                    else bisect_left(sorted_columns, column, start, end)
+                )
+
+                if position < end and sorted_columns[position] == column:
+                    state = destinies[position]
+                else:
+                    state = DEAD
+
+            if state == DEAD:
+                state = missing
+
+        return state
+
+    def dense_rows(self) -> List[array]:
+        """Rebuilds the dense rows of every state"""
+        empty = array("i", [self.missing]) * self.width
+        rows = []
+
+        for state, row in enumerate(self.rows):
+            if self.kinds[state] == DENSE:
+                if self.missing != DEAD and DEAD in row:
+                    row = array(
+                        "i",
+                        [
+                            self.missing if destiny == DEAD else destiny
+                            for destiny in row
+                        ],
+                    )
+
+                rows.append(row)
+                continue
+
+            dense = array("i", empty)
+
+            if self.kinds[state] == HASH:
+                for column, destiny in row.items():
+                    dense[column] = destiny
+            else:
+                for position in range(self.lower[state], self.upper[state]):
+                    dense[self.columns[position]] = self.destinies[position]
+
+            rows.append(dense)
+
+        return rows
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory taken by the rows, in bytes"""
+        total = sum(sys.getsizeof(row) for row in self.rows if row is not None) + sum(
+            sys.getsizeof(data)
+            for data in (self.lower, self.upper, self.columns, self.destinies)
+            if data is not None
+        )
+
+        return total
+
+    def report(self) -> Dict[str, int]:
+        """Which layout was chosen for how many states, and the memory it takes against a fully dense table
+
+        Returns:
+            Dict[str, int]: the number of "dense", "sorted" and "hash" rows, and the "bytes" and "dense_bytes" taken
+        """
+        report = {name: self.kinds.count(kind) for kind, name in NAMES.items()}
+        report["bytes"] = self.nbytes
+        report["dense_bytes"] = _dense_bytes(self.width) * len(self.rows)
+
+        return report
+
+
+@lru_cache(maxsize=None)
+def _dense_bytes(width: int) -> int:
+    return sys.getsizeof(array("i", bytes(4 * width)))
+
+
+@lru_cache(maxsize=None)
+def _dict_bytes(size: int) -> int:
+    return sys.getsizeof(dict.fromkeys(range(size)))
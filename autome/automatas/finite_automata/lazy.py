@@ -0,0 +1,120 @@
+from threading import Lock
+from typing import Dict, Hashable, List
+
+from autome.automatas.finite_automata.closure import EpsilonClosureIndex
+from autome.automatas.finite_automata.compiled import DEAD
+
+# Default number of subset states kept by a LazyDFA before its cache is flushed
+CACHE_SIZE = 10000
+
+
+class SubsetCache:
+    """
+    Subset states discovered by a LazyDFA, with the transitions already computed between them.
+    A full cache is never cleared, it's replaced by a new one, so computations still holding
+    the old one keep seeing consistent ids.
+    """
+
+    def __init__(self) -> None:
+        self.index: Dict[int, int] = {}
+        self.subsets: List[int] = []
+        self.accepting: List[bool] = []
+        self.transitions: List[Dict[Hashable, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.subsets)
+
+
+class LazyDFA:
+    """
+    Runs a NonDeterministicFiniteAutomata as a DFA built on the fly (lazy subset construction).
+
+    Subset states (masks of the closure index) are only created when the input reaches them,
+    and both the states and the transitions between them are cached, so after a warm up each
+    symbol costs a dict lookup. When the cache holds @cache_size states it's flushed and the
+    construction starts over from the current subset, which bounds memory even for automatas
+    whose determinization explodes.
+
+    The cache is shared by every call, and may be used from many threads at once.
+
+    Args:
+        index (EpsilonClosureIndex): closure index of the automata being simulated
+        initial (int): id of the initial state
+        cache_size (int): maximum number of subset states kept in cache
+    """
+
+    def __init__(
+        self, index: EpsilonClosureIndex, initial: int, cache_size: int = CACHE_SIZE
+    ) -> None:
+        self.index = index
+        self.cache_size = max(cache_size, 2)
+        self.flushes = 0
+        self.initial = index.closures[initial]
+        self.cache = SubsetCache()
+        self._lock = Lock()
+
+    def _add(self, cache: SubsetCache, subset: int) -> int:
+        if subset in cache.index:
+            return cache.index[subset]
+
+        # Readers don't take the lock, so the id is published only once its lists hold it
+        state = len(cache.subsets)
+        cache.subsets.append(subset)
+        cache.accepting.append(subset & self.index.final != 0)
+        cache.transitions.append({})
+        cache.index[subset] = state
+
+        return state
+
+    def _step(self, cache: SubsetCache, current: int, symbol: Hashable):
+        """Computes a missing transition, flushing the cache when it's full
+
+        Returns:
+            Tuple[SubsetCache, int]: the cache that holds the reached state and its id
+        """
+        with self._lock:
+            subset = self.index.step(cache.subsets[current], symbol)
+
+            if subset == 0:
+                cache.transitions[current][symbol] = DEAD
+                return (cache, DEAD)
+
+            if subset not in cache.index and len(cache) >= self.cache_size:
+                cache = SubsetCache()
+                self.cache = cache
+                self.flushes += 1
+                return (cache, self._add(cache, subset))
+
+            destiny = self._add(cache, subset)
+            cache.transitions[current][symbol] = destiny
+
+            return (cache, destiny)
+
+    def accepts(self, word) -> bool:
+        """Runs the computation for @word, computing only the subset states it reaches
+
+        Args:
+            word (str): the input word
+
+        Returns:
+            bool: True if any path of the automata stops in an acceptance state
+        """
+        cache = self.cache
+        state = cache.index.get(self.initial)
+
+        if state is None:
+            with self._lock:
+                state = self._add(cache, self.initial)
+
+        for character in word:
+            destiny = cache.transitions[state].get(character)
+
+            if destiny is None:
+                cache, destiny = self._step(cache, state, character)
+
+            if destiny == DEAD:
+                return False
+
+            state = destiny
+
+        return cache.accepting[state]
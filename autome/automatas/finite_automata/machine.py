@@ -1,9 +1,31 @@
-from copy import deepcopy
-import pdb
 from tabulate import tabulate
-from typing import Callable, Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
+from autome.automatas.finite_automata.builder import AutomatonBuilder
+from autome.automatas.finite_automata.closure import EpsilonClosureIndex
+from autome.automatas.finite_automata.compiled import CompiledAutomata
+from autome.automatas.finite_automata.cursor import DFACursor
+from autome.automatas.finite_automata.expression import Expression, Operand
+from autome.automatas.finite_automata.lazy import CACHE_SIZE, LazyDFA
+from autome.automatas.finite_automata.cache import memoize
+from autome.automatas.finite_automata.canonical import (
+    canonical,
+    fingerprint,
+    structure,
+)
+from autome.automatas.finite_automata.equivalence import (
+    Verdict,
+    equivalent,
+    is_empty,
+    is_subset,
+)
+from autome.automatas.finite_automata.minimization import MINIMIZERS
+from autome.automatas.finite_automata.product import OPERATIONS, product
+from autome.automatas.finite_automata.parallel import accepts_parallel
+from autome.automatas.finite_automata.simulation import BitParallelNFA
+from autome.automatas.finite_automata.storage import AutomatonStore
 from autome.automatas.finite_automata.state import State
 from autome.automatas.finite_automata.transition import Transition
+from autome.automatas.finite_automata.trimming import useful_states
 from autome.base_machine import BaseMachine
 
 
@@ -21,316 +43,695 @@ class DeterministicFiniteAutomata(BaseMachine):
         self.transitions: List[Transition] = list(transitions)
         self.title = title
         self.description = description
-        self.step_stack = []
+        self._compiled: CompiledAutomata = None
         self.create_transition_map()
 
+    @classmethod
+    def from_table(cls, table: CompiledAutomata) -> "DeterministicFiniteAutomata":
+        """Creates an automata backed by a compiled table, which is shared, not copied.
+
+        States, transitions and the transition map are only built from the table when first
+        accessed (see _materialize), so operations that just run or combine tables, like
+        complements of complements or products of clones, never pay for object graphs.
+
+        Args:
+            table (CompiledAutomata): the compiled automata
+
+        Returns:
+            DeterministicFiniteAutomata: the automata, with the same states and transitions of @table
+        """
+        machine = DeterministicFiniteAutomata.__new__(DeterministicFiniteAutomata)
+        machine.title = "FiniteAutomata"
+        machine.description = ""
+        machine._states = None
+        machine._clear_caches()
+        machine._compiled = table
+
+        return machine
+
+    @classmethod
+    def from_store(cls, store: AutomatonStore) -> "DeterministicFiniteAutomata":
+        """Creates an automata backed by a struct-of-arrays storage (see storage.py).
+
+        States, transitions and the transition map are views built on first access, so an
+        automata with tens of millions of transitions takes a few bytes per transition as long
+        as only the storage is used: acceptance tests run over it, and compile() builds the
+        dense table from it directly.
+
+        Args:
+            store (AutomatonStore): the storage
+
+        Returns:
+            DeterministicFiniteAutomata: the automata (or NFA, when called from its class)
+        """
+        machine = cls.__new__(cls)
+        machine.title = "FiniteAutomata"
+        machine.description = ""
+        machine._states = None
+        machine._clear_caches()
+        machine._store = store
+
+        return machine
+
+    def _materialize(self) -> None:
+        """Builds the State and Transition objects of an automata created from a storage or a compiled table"""
+        if self._store is not None:
+            store = self._store
+            states = list(store.views)
+            transitions = []
+            transition_map = {state: {} for state in states}
+
+            for origin, state in enumerate(states):
+                for symbol, destiny in store.edges(origin):
+                    transitions.append(Transition(state, states[destiny], symbol))
+                    transition_map[state].setdefault(symbol, set()).add(states[destiny])
+
+            self._states = states
+            self._transitions = transitions
+            self._transition_map = transition_map
+
+            return
+
+        table = self._compiled
+        states = [
+            State(
+                initial=state == table.initial,
+                accept=table.accept[state] == 1,
+                type=original.type if original is not None else None,
+            )
+            for state, original in enumerate(table.states)
+        ]
+
+        transitions = []
+        transition_map = {state: {} for state in states}
+
+        classes = table.classes
+
+        for origin, state in enumerate(states):
+            for column, destiny in table.edges(origin):
+                for symbol in classes[column]:
+                    transitions.append(Transition(state, states[destiny], symbol))
+                    transition_map[state][symbol] = {states[destiny]}
+
+        self._states = states
+        self._transitions = transitions
+        self._transition_map = transition_map
+
+        # The table keeps its layout, but its states are now the objects of this automata
+        self._compiled = CompiledAutomata(
+            states, table.symbol_index, None, table.accept, table.initial, table.layout
+        )
+
+    @property
+    def states(self) -> List[State]:
+        if self._states is None:
+            self._materialize()
+
+        return self._states
+
+    @states.setter
+    def states(self, states: List[State]) -> None:
+        self._states = states
+
+    @property
+    def transitions(self) -> List[Transition]:
+        if self._states is None:
+            self._materialize()
+
+        return self._transitions
+
+    @transitions.setter
+    def transitions(self, transitions: List[Transition]) -> None:
+        self._transitions = transitions
+
+    @property
+    def transition_map(self) -> Dict[State, Dict[str, Set[State]]]:
+        if self._states is None:
+            self._materialize()
+
+        return self._transition_map
+
+    @transition_map.setter
+    def transition_map(self, transition_map: Dict[State, Dict[str, Set[State]]]):
+        self._transition_map = transition_map
+
     def create_transition_map(self):
-        self.transition_map: Dict[State, Dict[str, Set[str]]] = dict()
+        self.invalidate()
+        self.transition_map = {state: {} for state in self.states}
 
-        for state in self.states:
-            if state not in self.transition_map:
-                self.transition_map[state] = {}
-
-            for transition in self.transitions:
-                if transition.origin == state:
-                    if transition.symbol not in self.transition_map[state]:
-                        self.transition_map[state][transition.symbol] = set()
-                    self.transition_map[state][transition.symbol].add(
-                        transition.destiny
-                    )
+        for transition in self.transitions:
+            symbols = self.transition_map.get(transition.origin)
+
+            if symbols is not None:
+                symbols.setdefault(transition.symbol, set()).add(transition.destiny)
+
+    def invalidate(self) -> None:
+        """Drops the compiled transition table, it will be rebuilt on the next call to compile().
+        Should be called after changing states or transitions without using add_state/add_transition.
+        """
+        if self._states is None:
+            self._materialize()
+
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        self._compiled: CompiledAutomata = None
+        self._store: AutomatonStore = None
+        self._fingerprint: str = None
+        self._structure: str = None
+        self._initial: State = None
+        self._final: List[State] = None
+        self._accept: bytearray = None
+
+    def __getstate__(self) -> Dict:
+        # Cached structures (which may hold locks) are rebuilt on demand by copies, except for
+        # the storage of automatas whose objects were never built
+        if self._states is None and self._store is None:
+            self._materialize()
+
+        state = self.__dict__.copy()
+
+        for key in ("_compiled", "_closures", "_lazy", "_simulator"):
+            if key in state:
+                state[key] = None
+
+        return state
+
+    def compile(self) -> CompiledAutomata:
+        """Compiles the automata into an integer indexed transition table, the result is cached
+        until the automata is changed.
+
+        Returns:
+            CompiledAutomata: the compiled transition table
+        """
+        if self._compiled is None:
+            if self._store is not None:
+                self._compiled = self._store.compile()
+            else:
+                self._compiled = CompiledAutomata.build(self)
+
+        return self._compiled
+
+    def store(self) -> AutomatonStore:
+        """Returns the struct-of-arrays storage of the automata (see storage.py), built once
+        until the automata changes. Its state views are the states of the automata.
+
+        Returns:
+            AutomatonStore: the storage
+        """
+        if self._store is None:
+            self._store = AutomatonStore.build(self.states, self.transitions)
+
+        return self._store
 
     def add_transition(self, origin: State, destiny: State, symbol: str) -> None:
-        """Adds a new transition the the automata
+        """Adds a new transition the the automata, unless it already exists.
+
+        The transition map is updated in place, so each call is O(1). Building large automatas
+        from scratch is better done with builder(), which skips State and Transition objects.
 
         Args:
             origin (State): state from which the transition starts
             destiny (State): state where the transition ends
             symbol (str): trigger symbol of the transition
         """
+        transition = Transition(origin=origin, destiny=destiny, symbol=symbol)
+        symbols = self.transition_map.get(origin)
 
-        self.transitions = list(
-            set(
-                self.transitions
-                + [Transition(origin=origin, destiny=destiny, symbol=symbol)]
-            )
-        )
+        if symbols is not None:
+            destinies = symbols.setdefault(symbol, set())
+
+            if destiny in destinies:
+                return
+
+            destinies.add(destiny)
+        elif transition in self.transitions:
+            # Transitions from unknown states are kept, but not indexed
+            return
+
+        self.transitions.append(transition)
+        self.invalidate()
 
     def add_state(self, state: State) -> None:
-        """Adds a new state the the automata
+        """Adds a new state the the automata, unless it already exists
 
         Args:
             state (State): new state
         """
+        if state in self.transition_map:
+            return
 
-        self.states = list(set(self.states + [state]))
+        self.states.append(state)
+        self.transition_map[state] = {}
+        self.invalidate()
 
-    def execute_transition(self, transition: Transition) -> None:
-        """
-        Executes a transition into the automata, moving reading head to the right and applying changes to the current state.
+    @classmethod
+    def builder(cls) -> AutomatonBuilder:
+        """Creates a builder (see builder.py) whose frozen result is an automata of this class
+
+        Returns:
+            AutomatonBuilder: an empty builder, deterministic unless called from NonDeterministicFiniteAutomata
         """
-        self.step_stack.append(transition)
-        self.current_state = transition.destiny
+        return AutomatonBuilder(
+            deterministic=not issubclass(cls, NonDeterministicFiniteAutomata),
+            factory=cls.from_store,
+        )
+
+    def _index_states(self) -> None:
+        """Finds the initial state and the acceptance states in a single pass over the states,
+        the result is kept until the automata is changed (see invalidate)"""
+        states = self.states
+        self._accept = bytearray(1 if state.accept else 0 for state in states)
+        self._final = [state for state, accept in zip(states, self._accept) if accept]
+        self._initial = next((state for state in states if state.initial), None)
 
     def final(self) -> List[State]:
-        return list(filter(lambda state: state.accept, self.states))
+        """The acceptance states, the list is shared until the automata changes and shouldn't be modified"""
+        if self._final is None:
+            self._index_states()
+
+        return self._final
 
     def initial(self) -> State:
-        return next(filter(lambda state: state.initial, self.states))
+        if self._final is None:
+            self._index_states()
+
+        if self._initial is None:
+            raise StopIteration("The automata has no initial state")
+
+        return self._initial
+
+    def accept_bitmap(self) -> bytearray:
+        """1 for each acceptance state, 0 for the others, in the order of states. The bitmap is
+        shared with the compiled tables and the closure index, so it must not be modified.
+        """
+        if self._accept is None:
+            self._index_states()
+
+        return self._accept
 
     def accepts(self, word: str, debug=False) -> bool:
         """
-        Resets the finite automata to an initial state and runs the computation for a given word.
+        Runs the computation for a given word over the compiled transition table.
+
+        The automata itself is never changed by a computation, every run keeps its own state
+        (see DFACursor), so the same automata can be shared between threads.
         """
-        self.current_state = self.initial()
+        if not debug:
+            if self._compiled is None and self._states is None:
+                # Automatas backed by a storage are run over it, without a dense table
+                return self._store.accepts(word)
 
-        if debug:
-            print(f"Starting at {self.current_state}")
+            return self.compile().accepts(word)
+
+        cursor = self.cursor(trace=1)
+
+        print(f"Starting at {cursor.current_state}")
 
         for character in word:
-            result = self.step(character)
-            if not result:
+            if not cursor.step(character):
                 return False
-            if debug:
-                print(
-                    f"Transition to {self.current_state} by {self.step_stack[-1].symbol}"
-                )
+            print(f"Transition to {cursor.current_state} by {cursor.trace[-1].symbol}")
 
-        return self.current_state.accept
+        return cursor.finish()
 
-    def step(self, character) -> bool:
+    def cursor(self, trace: int = 0) -> DFACursor:
         """
-        Runs one step of the computation for the current finite automata.
-
-        The step will take the current symbol from the reading head, compare with the list
-        of available transitions trying to find a match. If it doesn't find, the machine will
-        be pushed into a rejection state, where the computation will stop.
+        Creates a cursor over the compiled transition table, which reads the input chunk by chunk
+        using constant memory (see DFACursor.feed and DFACursor.finish).
 
-        However, if it does find a match shifts the current state of the machine
-        to the destiny of the found transition and moves the reading head.
+        If @trace is given, the cursor records the last @trace executed transitions.
         """
+        if trace > 0 and self._states is None:
+            # Traced transitions refer to the states of this automata, so they must exist
+            self._materialize()
 
-        condition: Callable[[Transition], bool] = (
-            lambda transition: character == transition.symbol
-            and self.current_state == transition.origin
-        )
+        return DFACursor(self.compile(), trace=trace)
 
-        matches = list(filter(condition, self.transitions))
+    def accepts_parallel(self, word: str, workers: int = None) -> bool:
+        """
+        Runs the computation for a (very long) word splitting it between a pool of processes,
+        each one simulating its chunk from every state at once (see parallel.accepts_parallel).
+        """
+        return accepts_parallel(self.compile(), word, workers=workers)
 
-        if len(list(matches)) == 0:
-            return False
-        else:
-            self.execute_transition(matches[0])
-            return True
+    def accepts_many(self, words: Iterable[str], batch_size: int = 4096):
+        """
+        Runs the computation for a batch of words using the vectorized (NumPy) transition table.
+
+        Returns a boolean NumPy array with the result for each word, in order.
+        """
+        return self.compile().accepts_many(words, batch_size=batch_size)
 
     def complement(self) -> "DeterministicFiniteAutomata":
-        """Generate the complement of a given automata. The algorithm is pretty straight-forward, just note
-        that we had to use Python's deepcopy to create a new object exactly equal to the old one but with different
-        memory address
+        """Generate the complement of a given automata, relative to its alphabet: the result accepts
+        every word over the symbols of the automata that the automata rejects.
+
+        Nothing is copied, the result shares the compiled table and only flips its accept flags
+        (see CompiledAutomata.complemented), objects are built only if the result is inspected.
 
         Returns:
             DeterministicFiniteAutomata: a new automata, representing the complement of the operand
         """
-        new = deepcopy(self)
-
-        for state in new.states:
-            state.accept = not state.accept
-
-        return new
+        return DeterministicFiniteAutomata.from_table(self.compile().complemented())
 
     def union(
         self, other: "DeterministicFiniteAutomata"
     ) -> "DeterministicFiniteAutomata":
-        """Generate an union between the AF, the original algorithm returns a NDFA, but for use purposes
-        we're determinizing the resulting machine before returning
+        """Generate an union between the AF through the product construction (see product.py)
 
         Returns:
             DeterministicFiniteAutomata: a new automata, representing the union between operands
         """
+        return self.product(other, "union")
 
-        old_initials = (
-            self.initial(),
-            other.initial(),
-        )  # Old initial states from self and other
-        old_finals = (
-            self.final() + other.final()
-        )  # Old final states from self and other
+    def cross_union(
+        self, other: "DeterministicFiniteAutomata"
+    ) -> "DeterministicFiniteAutomata":
+        builder = NonDeterministicFiniteAutomata.builder()
+        initial = builder.add_state(initial=True)
 
-        new_final = State("qnf", accept=True)
-        new_initial = State("qni", initial=True)
+        for operand in (self, other):
+            ids = {}
 
-        states = [new_final, new_initial] + self.states + other.states
+            for state in sorted(operand.states):
+                ids[state] = builder.add_state(accept=state.accept)
 
-        for state in states:
-            if state != new_initial:
-                state.initial = False
+            for transition in operand.transitions:
+                if transition.origin in ids and transition.destiny in ids:
+                    builder.add_transition(
+                        ids[transition.origin],
+                        ids[transition.destiny],
+                        transition.symbol,
+                    )
 
-        # From the new initial state, creates an epsilon transition to all the old initial states
-        new_to_old_initial = [
-            Transition(new_initial, old_initial, "&") for old_initial in old_initials
-        ]
+            builder.add_transition(initial, ids[operand.initial()], "&")
 
-        # From the old final states, creates and epsilon transition to the new final state
-        old_to_new_final = [
-            Transition(old_final, new_final, "&") for old_final in old_finals
-        ]
+        return builder.freeze().determinize()
 
-        transitions = (
-            self.transitions + other.transitions + new_to_old_initial + old_to_new_final
-        )
+    def intersection(
+        self, other: "DeterministicFiniteAutomata"
+    ) -> "DeterministicFiniteAutomata":
+        """Generate an intersection of the given automatas through the product construction
 
-        # Because we have epsilon transitions, the resultant is a NDFA
-        # that should be determinized before used
-        new = NonDeterministicFiniteAutomata(states=states, transitions=transitions)
-        new.create_transition_map()
+        Returns:
+            DeterministicFiniteAutomata: a new automata, representing the intersection between operands
+        """
+        return self.product(other, "intersection")
 
-        return new.determinize()
+    def difference(
+        self, other: "DeterministicFiniteAutomata"
+    ) -> "DeterministicFiniteAutomata":
+        """Generate an automata accepting the words accepted by self but not by @other
 
-    def cross_union(
+        Returns:
+            DeterministicFiniteAutomata: a new automata, representing the difference between operands
+        """
+        return self.product(other, "difference")
+
+    def symmetric_difference(
         self, other: "DeterministicFiniteAutomata"
     ) -> "DeterministicFiniteAutomata":
-        result = NonDeterministicFiniteAutomata()
+        """Generate an automata accepting the words accepted by exactly one of the operands
 
-        initial = State("q0", initial=True)
-        result.add_state(initial)
+        Returns:
+            DeterministicFiniteAutomata: a new automata, representing the symmetric difference between operands
+        """
+        return self.product(other, "symmetric_difference")
 
-        state_mapping = {}
-        index = 1
+    def product(
+        self, other: "DeterministicFiniteAutomata", operation: str
+    ) -> "DeterministicFiniteAutomata":
+        """Runs the synchronous product of the compiled tables of both operands, keeping only the
+        reachable pairs of states. Missing transitions lead to an implicit sink on either side, so
+        the operands don't need to be complete (nor deterministic, NFAs are compiled through
+        their determinized automata).
 
-        for state in sorted(self.states):
-            state_mapping[state] = State(f"q{index}", accept=state.accept)
-            result.add_state(state_mapping[state])
-            index += 1
+        Args:
+            operation (str): one of "intersection", "union", "difference" or "symmetric_difference"
 
-        result.create_transition_map()
+        Returns:
+            DeterministicFiniteAutomata: the product automata
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation {operation}, expected one of {', '.join(OPERATIONS)}"
+            )
 
-        symbols = list(set(map(lambda transition: transition.symbol, self.transitions)))
-        symbols.sort()
+        def compute():
+            states, transitions = product(self.compile(), other.compile(), operation)
+
+            return DeterministicFiniteAutomata(states, transitions)
+
+        # Fingerprints ignore symbols that only lead to dead states, but the alphabet of the
+        # product is the union of both, and complements are relative to it
+        return memoize(
+            lambda: (
+                operation,
+                self.fingerprint(),
+                other.fingerprint(),
+                frozenset(self.compile().symbols),
+                frozenset(other.compile().symbols),
+            ),
+            compute,
+        )
 
-        for state in sorted(self.states):
-            for symbol in symbols:
-                if symbol in self.transition_map[state]:
-                    destiny_states = self.transition_map[state][symbol]
-                    for destiny_state in destiny_states:
-                        result.add_transition(
-                            state_mapping[state], state_mapping[destiny_state], symbol
-                        )
+    def equivalent(self, other: "DeterministicFiniteAutomata") -> Verdict:
+        """Checks whether both automatas accept the same language, using Hopcroft and Karp's
+        algorithm (see equivalence.py). Unlike ==, which compares states and transitions, it
+        doesn't depend on how the automatas are built, and needs no minimization.
 
-        result.add_transition(initial, state_mapping[self.initial()], "&")
+        Returns:
+            Verdict: truthy if they do, otherwise holding a word accepted by only one of them
+        """
+        return equivalent(self.compile(), other.compile())
 
-        state_mapping = {}
+    def is_subset(self, other: "DeterministicFiniteAutomata") -> Verdict:
+        """Checks whether every word accepted by this automata is accepted by @other
 
-        for state in sorted(other.states):
-            state_mapping[state] = State(f"q{index}", accept=state.accept)
-            result.add_state(state_mapping[state])
-            index += 1
+        Returns:
+            Verdict: truthy if it is, otherwise holding a word accepted by this automata but not by @other
+        """
+        return is_subset(self.compile(), other.compile())
 
-        result.create_transition_map()
+    def is_empty(self) -> Verdict:
+        """Checks whether this automata accepts no word at all
 
-        symbols = list(set(map(lambda transition: transition.symbol, self.transitions)))
-        symbols.sort()
+        Returns:
+            Verdict: truthy if it doesn't, otherwise holding an accepted word
+        """
+        return is_empty(self.compile())
 
-        for state in sorted(other.states):
-            for symbol in symbols:
-                if symbol in other.transition_map[state]:
-                    destiny_states = other.transition_map[state][symbol]
-                    for destiny_state in destiny_states:
-                        result.add_transition(
-                            state_mapping[state], state_mapping[destiny_state], symbol
-                        )
+    def trim(self) -> "DeterministicFiniteAutomata":
+        """Removes, in place, the states unreachable from the initial state and the states that
+        can't reach an acceptance state, along with their transitions and any transition that
+        touches a state outside the automata (see trimming.py). The initial state is always kept,
+        so the automata of an empty language keeps a single state.
+
+        Returns:
+            DeterministicFiniteAutomata: the automata itself
+        """
+        states = self.states
+        ids: Dict[State, int] = {}
 
-        result.add_transition(initial, state_mapping[other.initial()], "&")
+        for state in states:
+            ids.setdefault(state, len(ids))
 
-        result.create_transition_map()
+        successors: List[List[int]] = [[] for _ in ids]
+        dangling = False
 
-        # pdb.set_trace()
+        for transition in self.transitions:
+            origin = ids.get(transition.origin)
+            destiny = ids.get(transition.destiny)
 
-        return result.determinize()
+            if origin is None or destiny is None:
+                dangling = True
+                continue
 
-    def intersection(
-        self, other: "DeterministicFiniteAutomata"
-    ) -> "DeterministicFiniteAutomata":
-        """Generate an intersection of the given automatas, the algorithm actually uses other
-        automata operation's to mount the new machine.
+            successors[origin].append(destiny)
+
+        keep = useful_states(
+            ids[self.initial()],
+            successors,
+            [ids[state] for state in self.final()],
+        )
+
+        if all(keep) and len(ids) == len(states) and not dangling:
+            return self
+
+        # Transitions from or to states that aren't in the automata are dropped too
+        self.states = [state for state in ids if keep[ids[state]]]
+        self.transitions = [
+            transition
+            for transition in self.transitions
+            if transition.origin in ids
+            and keep[ids[transition.origin]]
+            and transition.destiny in ids
+            and keep[ids[transition.destiny]]
+        ]
+        self.create_transition_map()
+
+        return self
+
+    def canonical(self) -> "DeterministicFiniteAutomata":
+        """Generates the canonical automata of the language: the minimal automata, with states
+        named q0, q1, ... in breadth first order over the sorted alphabet (see canonical.py).
+        Automatas accepting the same language have identical canonical automatas.
 
         Returns:
-            DeterministicFiniteAutomata: a new automata, representing the intersection between operands
+            DeterministicFiniteAutomata: the canonical automata
         """
-        a = self.complement()
-        b = other.complement()
+        alphabet, rows = canonical(self.compile())
 
-        result = (a | b).complement()
+        states = [
+            State(f"q{position}", initial=position == 0, accept=accept, type=type)
+            for position, (accept, type, _) in enumerate(rows)
+        ]
+        transitions = [
+            Transition(states[origin], states[destiny], alphabet[symbol])
+            for origin, (_, _, destinies) in enumerate(rows)
+            for symbol, destiny in destinies
+        ]
 
-        for state in result.states:
-            if state.accept and state.initial:
-                state.accept = False
+        return DeterministicFiniteAutomata(states, transitions)
+
+    def fingerprint(self) -> str:
+        """A sha256 digest of the canonical form, computed once until the automata changes. Two
+        automatas have the same fingerprint if and only if they accept the same language and agree
+        on state types (see canonical.py).
+
+        Returns:
+            str: the hex digest
+        """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self.compile())
+
+        return self._fingerprint
 
-        return result
+    def structure(self) -> str:
+        """A sha256 digest of the states and transitions, ignoring names (see canonical.py),
+        computed once until the automata changes.
+
+        Returns:
+            str: the hex digest
+        """
+        if self._structure is None:
+            self._structure = structure(
+                self.states,
+                self.transitions,
+                deterministic=not isinstance(self, NonDeterministicFiniteAutomata),
+            )
+
+        return self._structure
 
     def clone(self) -> "DeterministicFiniteAutomata":
-        mapping = {}
+        """Copies the automata. Deterministic automatas share their compiled table with the copy,
+        whose objects are only built when accessed, NFAs get new State and Transition objects.
+        Transitions from or to states outside the automata are left out, as they are when compiling.
+
+        Returns:
+            DeterministicFiniteAutomata: the copy, accepting the same language
+        """
+        if not isinstance(self, NonDeterministicFiniteAutomata):
+            new = DeterministicFiniteAutomata.from_table(self.compile())
+            new._fingerprint = self._fingerprint
 
-        new_states = []
-        new_transitions = []
+            return new
+
+        mapping = {}
 
         for original in self.states:
-            new = State(
+            mapping[original] = State(
                 accept=original.accept, initial=original.initial, type=original.type
             )
-            mapping[original] = new
-            new_states.append(new)
 
-        for original in self.transitions:
-            try:
-                new = Transition(
-                    mapping[original.origin], mapping[original.destiny], original.symbol
-                )
-                new_transitions.append(new)
-            except:
-                pass
+        transitions = [
+            Transition(
+                mapping[original.origin], mapping[original.destiny], original.symbol
+            )
+            for original in self.transitions
+            if original.origin in mapping and original.destiny in mapping
+        ]
 
-        return DeterministicFiniteAutomata(new_states, new_transitions)
+        new = NonDeterministicFiniteAutomata(list(mapping.values()), transitions)
 
-    def minimize(self) -> "DeterministicFiniteAutomata":
-        for state in self.states:
-            if not state.accept and len(self.transition_map[state]) == 0:
-                print(f"{state} is dead")
+        # The copy accepts the same language
+        new._fingerprint = self._fingerprint
 
-        visited = set()
+        return new
 
-        for transition in self.transitions:
-            visited.add(transition.destiny)
+    def minimize(
+        self, method: str = "hopcroft", complete=False
+    ) -> "DeterministicFiniteAutomata":
+        """Generates the minimal automata accepting the same language.
 
-        visited.add(self.initial())
+        States unreachable from the initial state are removed, as well as states from which no
+        acceptance state can be reached, unless @complete is set: in that case the result has
+        a transition by every symbol on every state, leading to a sink state when needed.
 
-        mapping = {}
-        states = []
-        transitions = []
+        Args:
+            method (str): the algorithm, one of "hopcroft", "valmari" or "brzozowski" (see minimization.py)
+            complete (bool): keep a sink state
 
-        for state in visited:
-            new = State(accept=state.accept, initial=state.initial, type=state.type)
-            mapping[state] = new
-            states.append(new)
+        Returns:
+            DeterministicFiniteAutomata: the minimal automata
+        """
+        if method not in MINIMIZERS:
+            raise ValueError(
+                f"Unknown minimization method {method}, expected one of {', '.join(MINIMIZERS)}"
+            )
 
-        for transition in self.transitions:
-            try:
-                new = Transition(
-                    mapping[transition.origin],
-                    mapping[transition.destiny],
-                    transition.symbol,
-                )
-                transitions.append(new)
-            except:
-                pass
+        def compute():
+            states, transitions = MINIMIZERS[method](self.compile(), complete=complete)
 
-        return DeterministicFiniteAutomata(states, transitions)
+            return DeterministicFiniteAutomata(states, transitions)
 
-    # Dunder methods to allow operator overloading
+        # The complete minimal automata also depends on the alphabet, as the sink reads all of it
+        return memoize(
+            lambda: (
+                "minimize",
+                method,
+                self.fingerprint(),
+                frozenset(self.compile().symbols) if complete else None,
+            ),
+            compute,
+        )
+
+    def expression(self) -> Operand:
+        """Starts a lazy expression over this automata (see expression.py): operators applied to
+        it build an unevaluated DAG instead of intermediate automatas, and queries on the DAG
+        only explore the product states they reach.
+
+        Returns:
+            Operand: the expression holding this automata
+        """
+        return Operand(self)
+
+    # Dunder methods to allow operator overloading, expressions take over when mixed with automatas
     def __or__(self, other):
-        return self.cross_union(other)
+        if isinstance(other, Expression):
+            return NotImplemented
+
+        return self.union(other)
 
     def __and__(self, other):
+        if isinstance(other, Expression):
+            return NotImplemented
+
         return self.intersection(other)
 
+    def __sub__(self, other):
+        if isinstance(other, Expression):
+            return NotImplemented
+
+        return self.difference(other)
+
+    def __xor__(self, other):
+        if isinstance(other, Expression):
+            return NotImplemented
+
+        return self.symmetric_difference(other)
+
     def __invert__(self):
         return self.complement()
 
@@ -342,9 +743,7 @@ class DeterministicFiniteAutomata(BaseMachine):
 
         data = []
 
-        self.states.sort()
-
-        for state in self.states:
+        for state in sorted(self.states):
             name = state.name
 
             if state.initial:
@@ -380,8 +779,70 @@ class DeterministicFiniteAutomata(BaseMachine):
 
 
 class NonDeterministicFiniteAutomata(DeterministicFiniteAutomata):
+    def _clear_caches(self) -> None:
+        super()._clear_caches()
+        self._closures: EpsilonClosureIndex = None
+        self._lazy: LazyDFA = None
+        self._simulator: BitParallelNFA = None
+
+    def closure_index(self) -> EpsilonClosureIndex:
+        """Returns the index with the epsilon closure of every state, computed once and shared by
+        e_closure, determinize, the lazy DFA and the bit parallel simulator until the automata changes.
+        """
+        if self._closures is None:
+            self._closures = EpsilonClosureIndex(
+                self.states, self.transitions, accept=self.accept_bitmap()
+            )
+
+        return self._closures
+
+    def compile(self) -> CompiledAutomata:
+        """Compiles the determinized automata, which is needed by cursors, batches and file scanners.
+        Simple acceptance tests don't need it, see accepts.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledAutomata.build(self.determinize())
+
+        return self._compiled
+
+    def lazy(self, cache_size: int = CACHE_SIZE) -> LazyDFA:
+        """Returns the lazy DFA used to run this automata, which is kept (along with its cache of
+        subset states) until the automata changes.
+        """
+        if self._lazy is None or self._lazy.cache_size != cache_size:
+            index = self.closure_index()
+            initial = index.state_index[self.initial()]
+            self._lazy = LazyDFA(index, initial, cache_size=cache_size)
+
+        return self._lazy
+
+    def simulator(self) -> BitParallelNFA:
+        """Returns the bit parallel simulator of this automata, kept until the automata changes.
+        Unlike lazy(), it never builds subset states, so its cost per symbol is the same on
+        automatas whose determinization explodes.
+        """
+        if self._simulator is None:
+            index = self.closure_index()
+            self._simulator = BitParallelNFA(index, index.state_index[self.initial()])
+
+        return self._simulator
+
+    def simulate(self, word: str) -> bool:
+        """Runs the computation for a given word with the bit parallel simulator"""
+        return self.simulator().accepts(word)
+
+    def accepts(self, word: str, debug=False) -> bool:
+        """
+        Runs the computation for a given word without determinizing the automata up front: subset
+        states are built as the input reaches them and cached between calls (see LazyDFA).
+        """
+        if debug:
+            return self.determinize().accepts(word, debug=True)
+
+        return self.lazy().accepts(word)
+
     def run(self, word):
-        return self.determinize().run(word)
+        return self.accepts(word)
 
     def e_closure(self, states: List[State]) -> Tuple[Set[State], bool]:
         """Calculates the sigma-closure of a given list of states in the current automata
@@ -394,84 +855,77 @@ class NonDeterministicFiniteAutomata(DeterministicFiniteAutomata):
             Set[State]: sigma-closure set, containing all the states reached by &-transitions
             from the original states passed
         """
-        closure = set()
-        accept = False
-
-        while states:
-            state = states.pop()
-            closure.add(state)
-
-            if state.accept:
-                accept = True
-
-            if "&" in self.transition_map[state]:
-                for destiny in self.transition_map[state]["&"]:
-                    if destiny not in closure:
-                        states.append(destiny)
+        closure = self.closure_index().closure(states)
+        accept = any(state.accept for state in closure)
 
         return (closure, accept)
 
     def determinize(self) -> "DeterministicFiniteAutomata":
         """Determinizes a NDFA, returning an equivalent DFA
 
+        Only subsets reachable from the closure of the initial state are explored. Subsets are
+        masks of the closure index, identified by integer ids through a dict, so the cost is
+        roughly linear in the size of the resulting DFA.
+
         Returns:
             DeterministicFiniteAutomata: the equivalente DFA to the operand
         """
-        symbols = list(set([transition.symbol for transition in self.transitions]))
-
-        new = DeterministicFiniteAutomata()
-
-        # Cria uma pilha com todos os estados
-        state_stack = [{state} for state in self.states]
-
-        # Enquanto possuir algo na pilha
-        while state_stack:
-            # Desempilha uma lista?
-            states = list(state_stack.pop())
-
-            # Calcula o sigma fecho dessa lista de estados
-            (state_closure, _) = self.e_closure(states)
-
-            # Cria um novo estado, com o join de todos os estados no sigma fecho
-            closure_state = State.join(list(state_closure))
-
-            # Adiciona o novo estado na lista de estados do autômato determinístico
-            new.add_state(closure_state)
-
-            # Pra cada simbolo do alfabeto
-            for symbol in symbols:
-                # Pula epsilon
-                if symbol == "&":
-                    continue
-
-                reached_from_closure = set()
-
-                # Pra cad estado no fecho original
-                for to_state in state_closure:
-                    # Se não existe nenhuma transição por esse estado, pula
-                    if symbol not in self.transition_map[to_state]:
-                        continue
-                    # Se existe, atualiza o conjunto anterior de transições com as transições
-                    # do autômato atual que partam do conjunto atual dentro do fecho, pelo simbolo atual
-                    reached_from_closure.update(self.transition_map[to_state][symbol])
-
-                # Se o conjunto estiver vazio, pula o simbolo
-                if len(reached_from_closure) == 0:
-                    continue
+        return memoize(lambda: ("determinize", self.structure()), self._determinize)
+
+    def _determinize(self) -> "DeterministicFiniteAutomata":
+        index = self.closure_index()
+        initial = index.closures[index.state_index[self.initial()]]
+
+        ids: Dict[int, int] = {initial: 0}
+        subsets: List[int] = [initial]
+        edges: List[List[Tuple[str, int]]] = []
+
+        # subsets works as a queue, every subset is visited once, in order of discovery
+        for subset in subsets:
+            edges.append([])
+
+            for symbol, reached in index.moves(subset).items():
+                if reached not in ids:
+                    ids[reached] = len(subsets)
+                    subsets.append(reached)
+
+                edges[-1].append((symbol, ids[reached]))
+
+        # Subsets that can't reach an acceptance subset are dropped, they're the same as DEAD
+        keep = useful_states(
+            0,
+            [[destiny for _, destiny in edge] for edge in edges],
+            [
+                position
+                for position, subset in enumerate(subsets)
+                if subset & index.final
+            ],
+        )
 
-                # Calcula um novo fecho
-                (closure, _) = self.e_closure(list(reached_from_closure))
+        builder = DeterministicFiniteAutomata.builder()
+        states: Dict[int, int] = {}
 
-                # Cria um novo estado a partir da união do novo fecho
-                new_state = State.join(list(closure))
+        for position, subset in enumerate(subsets):
+            if keep[position]:
+                states[position] = builder.add_state(
+                    initial=position == 0,
+                    accept=subset & index.final != 0,
+                    type=self._subset_type(index, subset),
+                )
 
-                # Se o novo estado criado não estiver na pilha, nem nos estados atuais, adiciona na pilha
-                if not (new_state in new.states) and not (new_state in state_stack):
-                    state_stack.append(closure)
+        for origin in states:
+            for symbol, destiny in edges[origin]:
+                if keep[destiny]:
+                    builder.add_transition(states[origin], states[destiny], symbol)
 
-                # Adiciona uma transição do estado fecho para o novo estado, pelo símbolo
-                new.add_transition(closure_state, new_state, symbol)
+        return builder.freeze()
 
-        new.create_transition_map()
+    @classmethod
+    def _subset_type(cls, index: EpsilonClosureIndex, subset: int) -> str:
+        """The type of the state of the determinized automata representing @subset: the first
+        type found among its states, in order of id"""
+        for state in index.ids(subset):
+            if index.states[state].type is not None:
+                return index.states[state].type
 
-        return new
+        return None
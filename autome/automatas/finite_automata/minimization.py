@@ -0,0 +1,462 @@
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+from autome.automatas.finite_automata.closure import EpsilonClosureIndex
+from autome.automatas.finite_automata.compiled import CompiledAutomata
+from autome.automatas.finite_automata.state import State
+from autome.automatas.finite_automata.transition import Transition
+from autome.automatas.finite_automata.trimming import useful_states
+
+
+def useful(table: CompiledAutomata, complete=False) -> List[bool]:
+    """Marks the states of @table that should be kept by a minimization (see trimming.useful_states).
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        complete (bool): keep reachable states even if they can't reach an acceptance state
+
+    Returns:
+        List[bool]: True for each state that should be kept
+    """
+    successors = [
+        [destiny for _, destiny in table.edges(state)] for state in range(len(table))
+    ]
+
+    # Every reachable state reaches itself, so marking all of them as goals keeps them all
+    if complete:
+        accepting = range(len(table))
+    else:
+        accepting = [state for state in range(len(table)) if table.accept[state]]
+
+    return useful_states(table.initial, successors, accepting)
+
+
+def hopcroft(
+    table: CompiledAutomata, complete=False
+) -> Tuple[List[State], List[Transition]]:
+    """Hopcroft's partition refinement, O(n·k·log n) for n states and k symbol classes.
+
+    Unreachable states (and, unless @complete is set, states that can't reach an acceptance
+    state) are trimmed first. The remaining automata is completed with a sink state, states are
+    partitioned by acceptance and type, and blocks are split until every block is stable.
+
+    Missing transitions lead to the sink implicitly: the block of the sink is never used as a
+    splitter (any one block may be left out), so only the existing transitions are indexed and
+    the cost on sparse tables grows with them instead of with n·k.
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        complete (bool): keep a sink state, so every state has a transition by every symbol
+
+    Returns:
+        Tuple[List[State], List[Transition]]: states and transitions of the minimal automata
+    """
+    members, sink, outgoing = _completed(table, complete)
+
+    inverse: List[Dict[int, List[int]]] = [{} for _ in range(table.width)]
+    incoming: Dict[int, Set[int]] = {}
+
+    for state in members:
+        for column, reached in outgoing[state]:
+            inverse[column].setdefault(reached, []).append(state)
+            incoming.setdefault(reached, set()).add(column)
+
+    blocks: List[Set[int]] = [set(group) for group in _groups(table, members, sink)]
+    block_of: Dict[int, int] = {}
+
+    for block, group in enumerate(blocks):
+        for state in group:
+            block_of[state] = block
+
+    # Splitters without transitions leading to them split nothing, and are left out
+    pending: Set[Tuple[int, int]] = set(
+        (block, column)
+        for block in range(len(blocks))
+        if block != block_of[sink]
+        for state in blocks[block]
+        for column in incoming.get(state, ())
+    )
+
+    while pending:
+        splitter, column = pending.pop()
+
+        touched: Dict[int, Set[int]] = {}
+
+        for state in blocks[splitter]:
+            for origin in inverse[column].get(state, ()):
+                touched.setdefault(block_of[origin], set()).add(origin)
+
+        for block, inside in touched.items():
+            if len(inside) == len(blocks[block]):
+                continue
+
+            # The smaller half becomes the new block, so each state moves O(log n) times,
+            # unless it holds the sink, which must stay out of the splitters
+            moved = inside if 2 * len(inside) <= len(blocks[block]) else None
+
+            if moved is None or sink in moved:
+                moved = blocks[block] - inside
+
+            if sink in moved:
+                moved = inside
+
+            blocks[block] -= moved
+
+            new = len(blocks)
+            blocks.append(moved)
+
+            for state in moved:
+                block_of[state] = new
+
+                for other in incoming.get(state, ()):
+                    pending.add((new, other))
+
+    return _quotient(table, blocks, block_of, outgoing, complete)
+
+
+def valmari(
+    table: CompiledAutomata, complete=False
+) -> Tuple[List[State], List[Transition]]:
+    """Valmari and Lehtinen's partition refinement, O(n + m·log m) for n states and m transitions.
+
+    Both the states and the transitions are kept on refinable partitions: blocks of states are
+    split by the cords (groups of transitions with the same class) that lead to them, and cords
+    are split by the blocks of their destinies. Only the existing transitions are ever visited,
+    so unlike hopcroft the cost doesn't grow with the missing ones, which makes it the better
+    choice for sparse automatas over large alphabets. When @complete is set, the missing
+    transitions are added towards the sink, as the result has them all anyway.
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        complete (bool): keep a sink state, so every state has a transition by every symbol
+
+    Returns:
+        Tuple[List[State], List[Transition]]: states and transitions of the minimal automata
+    """
+    members, sink, outgoing = _completed(table, complete)
+    local = {state: position for position, state in enumerate(members)}
+
+    tails: List[int] = []
+    labels: List[List[int]] = [[] for _ in range(table.width)]
+    incoming: List[List[int]] = [[] for _ in members]
+
+    for state in members:
+        targets = outgoing[state]
+
+        # Transitions to the sink are implicit, unless the result must be complete
+        if complete:
+            targets = _row(targets, table.width, sink)
+
+        for column, reached in targets:
+            incoming[local[reached]].append(len(tails))
+            labels[column].append(len(tails))
+            tails.append(local[state])
+
+    blocks = RefinablePartition(len(members))
+
+    for group in _groups(table, members, sink)[1:]:
+        for state in group:
+            blocks.mark(local[state])
+
+        blocks.split()
+
+    cords = RefinablePartition(len(tails))
+
+    for label in labels[1:]:
+        for transition in label:
+            cords.mark(transition)
+
+        cords.split()
+
+    block, cord = 1, 0
+
+    while cord < len(cords):
+        for transition in cords.members(cord):
+            blocks.mark(tails[transition])
+
+        blocks.split()
+        cord += 1
+
+        while block < len(blocks):
+            for state in blocks.members(block):
+                for transition in incoming[state]:
+                    cords.mark(transition)
+
+            cords.split()
+            block += 1
+
+    partition = [
+        set(members[state] for state in blocks.members(block))
+        for block in range(len(blocks))
+    ]
+    block_of = {members[state]: blocks.set_of[state] for state in range(len(members))}
+
+    return _quotient(table, partition, block_of, outgoing, complete)
+
+
+def brzozowski(
+    table: CompiledAutomata, complete=False
+) -> Tuple[List[State], List[Transition]]:
+    """Brzozowski's algorithm: reverse and determinize, twice.
+
+    The subset construction over the reversed automata may blow up exponentially, but it
+    needs no partition at all and tends to win on small automatas, or on automatas that come
+    straight out of an NFA with many redundant states. State types are not taken into account,
+    states with different types may end up merged.
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        complete (bool): add a sink state, so every state has a transition by every symbol
+
+    Returns:
+        Tuple[List[State], List[Transition]]: states and transitions of the minimal automata
+    """
+    edges = [list(table.edges(state)) for state in range(len(table))]
+    edges, accept = _reverse_determinize(edges, table.accept, table.initial)
+    edges, accept = _reverse_determinize(edges, accept, 0)
+
+    if not any(accept):
+        edges = [_row([], table.width, 0) if complete else []]
+    elif complete and any(len(row) < table.width for row in edges):
+        sink = len(edges)
+        edges = [_row(row, table.width, sink) for row in edges + [[]]]
+        accept.append(False)
+
+    states = [
+        State(initial=state == 0, accept=accept[state]) for state in range(len(edges))
+    ]
+    transitions = [
+        Transition(states[origin], states[reached], symbol)
+        for origin, row in enumerate(edges)
+        for column, reached in row
+        for symbol in table.classes[column]
+    ]
+
+    return states, transitions
+
+
+def _reverse_determinize(
+    edges: List[List[Tuple[int, int]]], accept: Sequence, initial: int
+):
+    """Subset construction over the reverse of a deterministic table, given by the (class, destiny)
+    pairs of the transitions of each state, starting from its acceptance states
+
+    Returns:
+        Tuple[List[List[Tuple[int, int]]], List[bool]]: the transitions and acceptance of the resulting table, whose initial state is 0
+    """
+    predecessors: List[Dict[int, int]] = [{} for _ in edges]
+
+    for origin, row in enumerate(edges):
+        for column, reached in row:
+            predecessors[reached][column] = (
+                predecessors[reached].get(column, 0) | 1 << origin
+            )
+
+    start = 0
+
+    for state in range(len(edges)):
+        if accept[state]:
+            start |= 1 << state
+
+    if start == 0:
+        return [[]], [False]
+
+    index = {start: 0}
+    subsets = [start]
+    result: List[List[Tuple[int, int]]] = []
+
+    for subset in subsets:
+        reached: Dict[int, int] = {}
+
+        for state in EpsilonClosureIndex.ids(subset):
+            for column, origins in predecessors[state].items():
+                reached[column] = reached.get(column, 0) | origins
+
+        row = []
+
+        for column in sorted(reached):
+            if reached[column] not in index:
+                index[reached[column]] = len(subsets)
+                subsets.append(reached[column])
+
+            row.append((column, index[reached[column]]))
+
+        result.append(row)
+
+    return result, [subset >> initial & 1 == 1 for subset in subsets]
+
+
+# Available minimization algorithms, by name
+MINIMIZERS: Dict[str, Callable] = {
+    "hopcroft": hopcroft,
+    "valmari": valmari,
+    "brzozowski": brzozowski,
+}
+
+
+class RefinablePartition:
+    """
+    Partition of the integers 0 to n - 1 into sets, which supports splitting every set in
+    time proportional to the number of its marked elements.
+
+    Elements are kept in a single list where every set is a contiguous range, with the marked
+    elements moved to the beginning of their range. When a set is split the smaller half gets
+    a new index, so each element changes sets O(log n) times.
+
+    Args:
+        size (int): the number of elements, all of them start on set 0
+    """
+
+    def __init__(self, size: int) -> None:
+        self.elements = list(range(size))
+        self.location = list(range(size))
+        self.set_of = [0] * size
+        self.first = [0] if size else []
+        self.past = [size] if size else []
+        self.marked = [0] if size else []
+        self.touched: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.first)
+
+    def members(self, index: int) -> List[int]:
+        return self.elements[self.first[index] : self.past[index]]
+
+    def mark(self, element: int) -> None:
+        index = self.set_of[element]
+        position = self.location[element]
+        boundary = self.first[index] + self.marked[index]
+
+        other = self.elements[boundary]
+        self.elements[position] = other
+        self.location[other] = position
+        self.elements[boundary] = element
+        self.location[element] = boundary
+
+        if self.marked[index] == 0:
+            self.touched.append(index)
+
+        self.marked[index] += 1
+
+    def split(self) -> None:
+        """Splits the marked elements of every touched set from the unmarked ones"""
+        while self.touched:
+            index = self.touched.pop()
+            boundary = self.first[index] + self.marked[index]
+            self.marked[index] = 0
+
+            if boundary == self.past[index]:
+                continue
+
+            if boundary - self.first[index] <= self.past[index] - boundary:
+                first, past = self.first[index], boundary
+                self.first[index] = boundary
+            else:
+                first, past = boundary, self.past[index]
+                self.past[index] = boundary
+
+            new = len(self.first)
+            self.first.append(first)
+            self.past.append(past)
+            self.marked.append(0)
+
+            for position in range(first, past):
+                self.set_of[self.elements[position]] = new
+
+
+def _completed(table: CompiledAutomata, complete: bool):
+    """Trims @table and completes it with a sink state, numbered n, which takes every missing transition
+
+    Returns:
+        Tuple: the ids of the kept states (sink included), the sink and the (class, destiny)
+        pairs of the transitions of each kept state that don't lead to the sink
+    """
+    sink = len(table)
+    keep = useful(table, complete)
+    members = [state for state in range(len(table)) if keep[state]] + [sink]
+    outgoing: Dict[int, List[Tuple[int, int]]] = {sink: []}
+
+    for state in members[:-1]:
+        outgoing[state] = [
+            (column, reached) for column, reached in table.edges(state) if keep[reached]
+        ]
+
+    return members, sink, outgoing
+
+
+def _row(
+    targets: List[Tuple[int, int]], width: int, sink: int
+) -> List[Tuple[int, int]]:
+    """Completes the (class, destiny) pairs of a state with the transitions to @sink it's missing"""
+    reached = dict(targets)
+
+    return [(column, reached.get(column, sink)) for column in range(width)]
+
+
+def _groups(table: CompiledAutomata, members: List[int], sink: int) -> List[List[int]]:
+    """The initial partition: states are only equivalent when they agree on acceptance and type"""
+    groups: Dict[Tuple, List[int]] = {}
+
+    for state in members:
+        if state == sink:
+            key = (False, None)
+        else:
+            key = (table.accept[state] == 1, _type(table.states[state]))
+
+        groups.setdefault(key, []).append(state)
+
+    return list(groups.values())
+
+
+def _quotient(table, blocks, block_of, outgoing, complete):
+    """Builds the automata whose states are the blocks of a partition, numbered in breadth first order"""
+    sink = len(table)
+    classes = table.classes
+    initial = block_of[table.initial]
+
+    order = [initial]
+    position = {initial: 0}
+    states: List[State] = []
+    transitions: List[Transition] = []
+    edges = []
+
+    for block in order:
+        representative = next(iter(blocks[block]))
+
+        if representative == sink:
+            states.append(State(initial=block == initial))
+        else:
+            states.append(
+                State(
+                    initial=block == initial,
+                    accept=table.accept[representative] == 1,
+                    type=_type(table.states[representative]),
+                )
+            )
+
+        targets = outgoing[representative]
+
+        if complete:
+            targets = _row(targets, table.width, sink)
+
+        for column, destiny in targets:
+            reached = block_of[destiny]
+
+            if not complete and reached == block_of[sink]:
+                continue
+
+            if reached not in position:
+                position[reached] = len(order)
+                order.append(reached)
+
+            edges.append((position[block], column, position[reached]))
+
+    for origin, column, reached in edges:
+        for symbol in classes[column]:
+            transitions.append(Transition(states[origin], states[reached], symbol))
+
+    return states, transitions
+
+
+def _type(state: State):
+    # Intermediate states of byte level tables have no State object
+    return state.type if state is not None else None
@@ -0,0 +1,187 @@
+import mmap
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Union
+
+from autome.automatas.finite_automata.compiled import DEAD, CompiledAutomata
+
+# How many bytes of its range a worker reads at once
+CHUNK_SIZE = 1 << 20
+
+# Table used by the worker processes, sent once per process by the pool initializer
+_table: CompiledAutomata = None
+
+
+def transfer(
+    table: CompiledAutomata, chunks: Iterable, starts: Sequence[int] = None
+) -> array:
+    """Runs the automata over the input from every state in @starts at the same time (speculative simulation).
+
+    Starting states that reach the same state are merged into a single group, so the cost of
+    each symbol is the number of distinct states still alive, which usually drops to one after
+    a few symbols; from there on the plain table walk is used.
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        chunks (Iterable): consecutive pieces of the input
+        starts (Sequence[int]): starting states, every state of the table by default
+
+    Returns:
+        array: for each state of the table, the state reached from it (DEAD if it wasn't a start)
+    """
+    if starts is None:
+        starts = range(len(table))
+
+    groups: Dict[int, List[int]] = {state: [state] for state in starts}
+    index = table.symbol_index
+
+    for chunk in chunks:
+        if len(groups) == 1:
+            ((state, members),) = groups.items()
+            state = table.advance(state, chunk)
+            groups = {state: members} if state != DEAD else {}
+            continue
+
+        for position, character in enumerate(chunk):
+            column = index.get(character)
+
+            if column is None:
+                groups = {}
+                break
+
+            merged: Dict[int, List[int]] = {}
+
+            for state, members in groups.items():
+                destiny = table.destiny(state, column)
+
+                if destiny == DEAD:
+                    continue
+
+                if destiny in merged:
+                    merged[destiny].extend(members)
+                else:
+                    merged[destiny] = members
+
+            groups = merged
+
+            if len(groups) <= 1:
+                if len(groups) == 1:
+                    ((state, members),) = groups.items()
+                    state = table.advance(state, chunk[position + 1 :])
+                    groups = {state: members} if state != DEAD else {}
+                break
+
+        if not groups:
+            break
+
+    result = array("i", [DEAD]) * len(table)
+
+    for state, members in groups.items():
+        for member in members:
+            result[member] = state
+
+    return result
+
+
+def combine(table: CompiledAutomata, maps: Iterable[array]) -> bool:
+    """Chains the state maps of consecutive chunks, starting from the initial state"""
+    state = table.initial
+
+    for mapping in maps:
+        state = mapping[state]
+
+        if state == DEAD:
+            return False
+
+    return table.is_accepting(state)
+
+
+def _initialize(table: CompiledAutomata) -> None:
+    global _table
+    _table = table
+
+
+def _transfer_data(data, first: bool) -> array:
+    return transfer(_table, [data], [_table.initial] if first else None)
+
+
+def _transfer_file(path: Path, start: int, end: int, first: bool) -> array:
+    def chunks():
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for offset in range(start, end, CHUNK_SIZE):
+                    yield data[offset : min(offset + CHUNK_SIZE, end)]
+
+    return transfer(_table, chunks(), [_table.initial] if first else None)
+
+
+def _bounds(size: int, pieces: int) -> List[range]:
+    step = max(1, -(-size // pieces))
+    return [range(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def accepts_parallel(
+    table: CompiledAutomata, word, workers: int = None, chunks: int = None
+) -> bool:
+    """Splits @word in chunks, computes the state map of each chunk on a process pool and
+    reduces them into the final result.
+
+    Args:
+        table (CompiledAutomata): the compiled automata
+        word (str | bytes): the input, bytes must be used with a byte level table
+        workers (int): number of processes, all the cpus by default
+        chunks (int): number of chunks, four per worker by default
+
+    Returns:
+        bool: the same result as table.accepts(word)
+    """
+    workers = workers or cpu_count() or 1
+    bounds = _bounds(len(word), chunks or workers * 4)
+
+    if len(bounds) <= 1:
+        return table.accepts(word)
+
+    with ProcessPoolExecutor(
+        workers, initializer=_initialize, initargs=(table,)
+    ) as pool:
+        maps = pool.map(
+            _transfer_data,
+            [word[bound.start : bound.stop] for bound in bounds],
+            [index == 0 for index in range(len(bounds))],
+        )
+
+        return combine(table, maps)
+
+
+def accepts_file_parallel(
+    table: CompiledAutomata,
+    path: Union[str, Path],
+    workers: int = None,
+    chunks: int = None,
+) -> bool:
+    """Same as accepts_parallel, but each worker maps its own range of the file at @path,
+    so the file content is never sent between processes.
+
+    Args:
+        table (CompiledAutomata): a byte level table (see CompiledAutomata.encoded)
+    """
+    workers = workers or cpu_count() or 1
+    bounds = _bounds(Path(path).stat().st_size, chunks or workers * 4)
+
+    if len(bounds) == 0:
+        return table.is_accepting(table.initial)
+
+    with ProcessPoolExecutor(
+        workers, initializer=_initialize, initargs=(table,)
+    ) as pool:
+        maps = pool.map(
+            _transfer_file,
+            [path] * len(bounds),
+            [bound.start for bound in bounds],
+            [bound.stop for bound in bounds],
+            [index == 0 for index in range(len(bounds))],
+        )
+
+        return combine(table, maps)
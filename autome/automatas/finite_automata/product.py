@@ -0,0 +1,159 @@
+from operator import and_, or_, xor
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from autome.automatas.finite_automata.compiled import DEAD, CompiledAutomata
+from autome.automatas.finite_automata.state import State
+from autome.automatas.finite_automata.transition import Transition
+
+# How the acceptance of a pair of states follows from the acceptance of each side
+OPERATIONS: Dict[str, Callable[[bool, bool], bool]] = {
+    "intersection": and_,
+    "union": or_,
+    "difference": lambda left, right: left and not right,
+    "symmetric_difference": xor,
+}
+
+
+def product(
+    left: CompiledAutomata, right: CompiledAutomata, operation: str
+) -> Tuple[List[State], List[Transition]]:
+    """Synchronous product of two compiled automatas, exploring only the pairs reachable from the initial pair.
+
+    Each state of the result is a pair (p, q) of states of the operands, and reads a symbol by
+    moving both sides at once. A side without a transition (or which doesn't know the symbol)
+    becomes DEAD, a sink that rejects everything, so the operands don't need to be complete.
+    Pairs that can never reach an accepting pair under @operation, such as any pair with a
+    DEAD side on an intersection, are left out.
+
+    Symbols are grouped by the pair of classes they have on the operands, so each pair of
+    states is expanded once per group instead of once per symbol, and only by the groups where
+    some side has a transition: the others lead to (DEAD, DEAD).
+
+    Args:
+        left (CompiledAutomata): the first operand
+        right (CompiledAutomata): the second operand
+        operation (str): one of "intersection", "union", "difference" or "symmetric_difference"
+
+    Returns:
+        Tuple[List[State], List[Transition]]: states and transitions of the product automata
+    """
+    accepts = OPERATIONS[operation]
+    hopeless_left, hopeless_right = hopeless(operation)
+
+    groups = symbol_groups(left, right)
+    order = {key: position for position, key in enumerate(groups)}
+    by_left: Dict[int, List[Tuple[int, int]]] = {}
+    by_right: Dict[int, List[Tuple[int, int]]] = {}
+
+    for key in groups:
+        by_left.setdefault(key[0], []).append(key)
+        by_right.setdefault(key[1], []).append(key)
+
+    def keys(pair: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """The groups by which some side of @pair has a transition, in order"""
+        found = set()
+
+        if pair[0] != DEAD:
+            for column, _ in left.edges(pair[0]):
+                found.update(by_left.get(column, ()))
+
+        if pair[1] != DEAD:
+            for column, _ in right.edges(pair[1]):
+                found.update(by_right.get(column, ()))
+
+        return sorted(found, key=order.__getitem__)
+
+    def alive(pair: Tuple[int, int]) -> bool:
+        if pair[0] == DEAD:
+            return pair[1] != DEAD and not hopeless_left
+
+        return pair[1] != DEAD or not hopeless_right
+
+    def accepting(pair: Tuple[int, int]) -> bool:
+        return accepts(left.is_accepting(pair[0]), right.is_accepting(pair[1]))
+
+    initial = (left.initial, right.initial)
+    index = {initial: 0}
+    pairs = [initial]
+    edges: List[Tuple[int, int, Tuple[int, int]]] = []
+
+    for origin, pair in enumerate(pairs):
+        for key in keys(pair):
+            reached = (move(left, pair[0], key[0]), move(right, pair[1], key[1]))
+
+            if not alive(reached):
+                continue
+
+            if reached not in index:
+                index[reached] = len(pairs)
+                pairs.append(reached)
+
+            edges.append((origin, index[reached], key))
+
+    states = [
+        State(
+            initial=position == 0,
+            accept=accepting(pair),
+            type=_type(left, pair[0]) or _type(right, pair[1]),
+        )
+        for position, pair in enumerate(pairs)
+    ]
+    transitions = [
+        Transition(states[origin], states[destiny], symbol)
+        for origin, destiny, key in edges
+        for symbol in groups[key]
+    ]
+
+    return states, transitions
+
+
+def hopeless(operation: str) -> Tuple[bool, bool]:
+    """Whether a pair can still reach an accepting pair under @operation once its left (or right)
+    side is DEAD: from then on acceptance only depends on the other side, or on nothing at all.
+
+    Returns:
+        Tuple[bool, bool]: True if pairs with a DEAD left side, and with a DEAD right side, can be dropped
+    """
+    accepts = OPERATIONS[operation]
+
+    return (
+        not accepts(False, True) and not accepts(False, False),
+        not accepts(True, False) and not accepts(False, False),
+    )
+
+
+def symbol_groups(
+    left: CompiledAutomata, right: CompiledAutomata
+) -> Dict[Tuple[int, int], List[Hashable]]:
+    """Groups the symbols of both tables by their pair of classes, DEAD standing for a symbol a table doesn't know
+
+    Returns:
+        Dict[Tuple[int, int], List[Hashable]]: the symbols of each pair of classes
+    """
+    groups: Dict[Tuple[int, int], List[Hashable]] = {}
+
+    for symbol in list(left.symbol_index) + [
+        symbol for symbol in right.symbol_index if symbol not in left.symbol_index
+    ]:
+        key = (
+            left.symbol_index.get(symbol, DEAD),
+            right.symbol_index.get(symbol, DEAD),
+        )
+        groups.setdefault(key, []).append(symbol)
+
+    return groups
+
+
+def move(table: CompiledAutomata, state: int, column: int) -> int:
+    """A single step on @table, where DEAD states and classes always lead to DEAD"""
+    if state == DEAD or column == DEAD:
+        return DEAD
+
+    return table.destiny(state, column)
+
+
+def _type(table: CompiledAutomata, state: int):
+    if state == DEAD or table.states[state] is None:
+        return None
+
+    return table.states[state].type
@@ -0,0 +1,102 @@
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Tuple, Union
+
+from autome.automatas.finite_automata.compiled import DEAD, CompiledAutomata
+from autome.automatas.finite_automata.parallel import accepts_file_parallel
+
+# How many bytes are read from the mapped file on each step of a whole file scan
+CHUNK_SIZE = 1 << 20
+
+
+class FileScanner:
+    """
+    Runs a finite automata directly over the bytes of a file, mapping it into memory with mmap
+    instead of reading and decoding it into a str.
+
+    The automata is compiled into a byte level table (see CompiledAutomata.encoded), so the
+    results are the same as decoding the file with @encoding and calling accepts.
+
+    Args:
+        machine (DeterministicFiniteAutomata): the automata used to scan files
+        encoding (str): encoding of the scanned files
+    """
+
+    def __init__(self, machine, encoding: str = "utf-8") -> None:
+        self.machine = machine
+        self.encoding = encoding
+
+    @property
+    def table(self) -> CompiledAutomata:
+        return self.machine.compile().encoded(self.encoding)
+
+    @classmethod
+    @contextmanager
+    def open(cls, path: Union[str, Path]):
+        """Maps the file at @path into memory (read only). Empty files, which can't be mapped, yield an empty bytes object."""
+        with open(path, "rb") as file:
+            if Path(path).stat().st_size == 0:
+                yield b""
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def accepts(
+        self, path: Union[str, Path], chunk_size: int = CHUNK_SIZE, workers: int = None
+    ) -> bool:
+        """Returns whether the whole content of the file at @path is accepted by the automata
+
+        The file is read @chunk_size bytes at a time and the scan stops as soon as the
+        computation gets stuck. With more than one worker the file is split between a pool
+        of processes instead (see parallel.accepts_file_parallel).
+        """
+        table = self.table
+
+        if workers is not None and workers > 1:
+            return accepts_file_parallel(table, path, workers=workers)
+        state = table.initial
+
+        with self.open(path) as data:
+            for start in range(0, len(data), chunk_size):
+                state = table.advance(state, data[start : start + chunk_size])
+
+                if state == DEAD:
+                    return False
+
+        return table.is_accepting(state)
+
+    def lines(self, path: Union[str, Path]) -> Iterator[Tuple[int, int, bool]]:
+        """Runs the automata over each line of the file at @path. Lines are split by b"\\n",
+        which is never part of the scanned line.
+
+        Yields:
+            Tuple[int, int, bool]: start and end offsets of the line and whether it was accepted
+        """
+        table = self.table
+
+        with self.open(path) as data:
+            start = 0
+            size = len(data)
+
+            while start < size:
+                end = data.find(b"\n", start)
+
+                if end == -1:
+                    end = size
+
+                state = table.advance(table.initial, data[start:end])
+
+                yield (start, end, table.is_accepting(state))
+
+                start = end + 1
+
+    def matches(self, path: Union[str, Path]) -> Iterator[Tuple[int, int]]:
+        """
+        Yields:
+            Tuple[int, int]: start and end offsets of every accepted line of the file at @path
+        """
+        for start, end, accepted in self.lines(path):
+            if accepted:
+                yield (start, end)
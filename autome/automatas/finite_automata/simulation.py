@@ -0,0 +1,85 @@
+import re
+from typing import Dict, Hashable
+
+from autome.automatas.finite_automata.closure import EpsilonClosureIndex
+
+# Finds the bytes of a state mask which have at least one active state
+ACTIVE_BYTES = re.compile(rb"[^\x00]")
+
+
+class BitParallelNFA:
+    """
+    Simulates a NonDeterministicFiniteAutomata directly, without any kind of determinization.
+
+    The set of active states is a Python int used as a bitset (bit i is the state with id i).
+    The closure index has, for every symbol and state, the mask of states reached by reading the
+    symbol and then following epsilon transitions, so a step is the union of the masks of the
+    active states. Those unions are memoized for each byte of the mask (8 states at a time), so
+    a step costs one big int operation per active byte.
+
+    Args:
+        index (EpsilonClosureIndex): closure index of the automata being simulated
+        initial (int): id of the initial state
+    """
+
+    def __init__(self, index: EpsilonClosureIndex, initial: int) -> None:
+        self.index = index
+        self.size = (len(index) + 7) // 8
+        self.initial = index.closures[initial]
+        self._chunks: Dict[Hashable, Dict[int, int]] = {
+            symbol: {} for symbol in index.successors
+        }
+
+    def _chunk(self, symbol: Hashable, position: int, byte: int) -> int:
+        """Union of the successor masks of the states active in @byte, the byte at @position of a mask"""
+        masks = self.index.successors[symbol]
+        mask = 0
+
+        for bit in range(8):
+            if byte >> bit & 1:
+                mask |= masks[position * 8 + bit]
+
+        self._chunks[symbol][position << 8 | byte] = mask
+
+        return mask
+
+    def step(self, active: int, symbol: Hashable) -> int:
+        """Returns the mask of states reached from the @active ones by reading @symbol"""
+        chunks = self._chunks.get(symbol)
+
+        if chunks is None:
+            return 0
+
+        reached = 0
+        data = active.to_bytes(self.size, "little")
+
+        for match in ACTIVE_BYTES.finditer(data):
+            position = match.start()
+            key = position << 8 | data[position]
+            mask = chunks.get(key)
+
+            if mask is None:
+                mask = self._chunk(symbol, position, data[position])
+
+            reached |= mask
+
+        return reached
+
+    def accepts(self, word) -> bool:
+        """Runs the computation for @word over every path of the automata at once
+
+        Args:
+            word (str): the input word
+
+        Returns:
+            bool: True if any path of the automata stops in an acceptance state
+        """
+        active = self.initial
+
+        for character in word:
+            active = self.step(active, character)
+
+            if active == 0:
+                return False
+
+        return active & self.index.final != 0
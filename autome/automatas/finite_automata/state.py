@@ -1,7 +1,5 @@
-from os import stat
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from itertools import count
-from time import time
 from uuid import uuid4
 
 
@@ -10,8 +8,14 @@ class State:
 
     """
     A possible State of a Finite Automata.
+
+    States are compact records: there's no instance dict, the name defaults to q{id} and the
+    uid (only needed to serialize the automata) is generated on first access. Equality and
+    hashing go through the name.
     """
 
+    __slots__ = ("initial", "accept", "id", "type", "parts", "_name", "_uid")
+
     def __init__(
         self,
         name: str = None,
@@ -19,23 +23,37 @@ class State:
         accept=False,
         type=None,
         uid=None,
-        parts=[],
+        parts=(),
     ) -> None:
         self.initial: bool = initial
         self.accept: bool = accept
-        self.id = next(self._ids)
+        self.id: int = next(self._ids)
         self.type: str = type
-        self.parts: List[float] = parts
+        self.parts: Tuple[str, ...] = tuple(parts)
+        self._name: str = name
+        self._uid: str = uid
 
-        if uid is not None:
-            self.uid = uid
-        else:
-            self.uid = str(uuid4())
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = f"q{self.id}"
 
-        if name is None:
-            self.name = f"q{self.id}"
-        else:
-            self.name: str = name
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def uid(self) -> str:
+        if self._uid is None:
+            self._uid = str(uuid4())
+
+        return self._uid
+
+    @uid.setter
+    def uid(self, uid: str) -> None:
+        self._uid = uid
 
     @classmethod
     def parse(cls, model: dict) -> "State":
@@ -118,4 +136,5 @@ class State:
         return self.name == other.name
 
     def __hash__(self) -> int:
+        # The name is built once, and str objects cache their own hash
         return hash(self.name)
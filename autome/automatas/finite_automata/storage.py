@@ -0,0 +1,298 @@
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+from autome.automatas.finite_automata.compiled import (
+    DEAD,
+    CompiledAutomata,
+    equivalence_classes,
+)
+from autome.automatas.finite_automata.state import State
+from autome.automatas.finite_automata.transition import Transition
+
+
+class AutomatonStore:
+    """
+    Struct-of-arrays storage of a finite automata, for automatas too large to be kept as objects.
+
+    States are the integers 0 to n - 1 and symbols are ids into @alphabet. Transitions live in
+    two parallel array columns (symbol and destiny), sorted by origin, and the transitions of
+    state i are the positions offsets[i] to offsets[i + 1] (compressed sparse rows). Acceptance
+    is a bitmap and types are only kept for the states that have one. A transition takes 8
+    bytes and a state 8 bytes and 1 bit, against a few hundred bytes as objects.
+
+    The same storage fits deterministic and nondeterministic automatas: the transitions of a
+    state keep their original order, and deterministic runs take the first match, as the
+    compiled table does.
+
+    State objects are views, created on demand (see StateViews).
+
+    Args:
+        alphabet (List[Hashable]): the symbol of each symbol id
+        offsets (array): where the transitions of each state start, plus the total at the end
+        symbols (array): symbol id of each transition
+        destinies (array): destiny of each transition
+        accept (bytearray): bitmap with the acceptance states
+        initial (int): the initial state
+        types (Dict[int, str]): types of the states that have one
+        names (Dict[int, str]): names of the states that have one, the others get the default q{id}
+    """
+
+    def __init__(
+        self,
+        alphabet: List[Hashable],
+        offsets: array,
+        symbols: array,
+        destinies: array,
+        accept: bytearray,
+        initial: int,
+        types: Dict[int, str] = None,
+        names: Dict[int, str] = None,
+    ) -> None:
+        self.alphabet = alphabet
+        self.symbol_ids: Dict[Hashable, int] = {
+            symbol: index for index, symbol in enumerate(alphabet)
+        }
+        self.offsets = offsets
+        self.symbols = symbols
+        self.destinies = destinies
+        self.accept = accept
+        self.initial = initial
+        self.types: Dict[int, str] = types or {}
+        self.names: Dict[int, str] = names or {}
+        self.views = StateViews(self)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        size: int,
+        origins: Sequence[int],
+        symbols: Sequence[int],
+        destinies: Sequence[int],
+        alphabet: List[Hashable],
+        accepting: Iterable[int],
+        initial: int,
+        types: Dict[int, str] = None,
+        names: Dict[int, str] = None,
+    ) -> "AutomatonStore":
+        """Builds the storage from unsorted transition columns, with a stable counting sort by origin.
+
+        Args:
+            size (int): the number of states
+            origins (Sequence[int]): origin of each transition
+            symbols (Sequence[int]): symbol id of each transition
+            destinies (Sequence[int]): destiny of each transition
+            alphabet (List[Hashable]): the symbol of each symbol id
+            accepting (Iterable[int]): the acceptance states
+            initial (int): the initial state
+            types (Dict[int, str]): types of the states that have one
+            names (Dict[int, str]): names of the states that have one
+
+        Returns:
+            AutomatonStore: the storage
+        """
+        offsets = array("q", [0]) * (size + 1)
+
+        for origin in origins:
+            offsets[origin + 1] += 1
+
+        for state in range(size):
+            offsets[state + 1] += offsets[state]
+
+        position = array("q", offsets[:size])
+        sorted_symbols = array("i", [0]) * len(origins)
+        sorted_destinies = array("i", [0]) * len(origins)
+
+        for origin, symbol, destiny in zip(origins, symbols, destinies):
+            target = position[origin]
+            sorted_symbols[target] = symbol
+            sorted_destinies[target] = destiny
+            position[origin] = target + 1
+
+        accept = bytearray((size + 7) // 8)
+
+        for state in accepting:
+            accept[state >> 3] |= 1 << (state & 7)
+
+        return cls(
+            alphabet,
+            offsets,
+            sorted_symbols,
+            sorted_destinies,
+            accept,
+            initial,
+            types,
+            names,
+        )
+
+    @classmethod
+    def build(
+        cls, states: Iterable[State], transitions: Iterable[Transition]
+    ) -> "AutomatonStore":
+        """Stores an automata given as objects, which become the views of its states.
+
+        Transitions from or to states outside the automata are left out, as they are when compiling.
+
+        Returns:
+            AutomatonStore: the storage
+        """
+        state_index: Dict[State, int] = {}
+        objects: List[State] = []
+
+        for state in states:
+            if state not in state_index:
+                state_index[state] = len(objects)
+                objects.append(state)
+
+        alphabet: List[Hashable] = []
+        symbol_ids: Dict[Hashable, int] = {}
+        origins, symbols, destinies = array("i"), array("i"), array("i")
+
+        for transition in transitions:
+            origin = state_index.get(transition.origin)
+            destiny = state_index.get(transition.destiny)
+
+            if origin is None or destiny is None:
+                continue
+
+            if transition.symbol not in symbol_ids:
+                symbol_ids[transition.symbol] = len(alphabet)
+                alphabet.append(transition.symbol)
+
+            origins.append(origin)
+            symbols.append(symbol_ids[transition.symbol])
+            destinies.append(destiny)
+
+        store = cls.from_arrays(
+            len(objects),
+            origins,
+            symbols,
+            destinies,
+            alphabet,
+            [index for index, state in enumerate(objects) if state.accept],
+            state_index[next(filter(lambda state: state.initial, objects))],
+            {index: state.type for index, state in enumerate(objects) if state.type},
+        )
+        store.views = StateViews(store, objects)
+
+        return store
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the arrays, which doesn't include views or types"""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.offsets, self.symbols, self.destinies)
+        ) + len(self.accept)
+
+    def is_accepting(self, state: int) -> bool:
+        return state != DEAD and self.accept[state >> 3] >> (state & 7) & 1 == 1
+
+    def edges(self, state: int) -> Iterator[Tuple[Hashable, int]]:
+        """The (symbol, destiny) pairs of the transitions of @state, in their original order"""
+        start, end = self.offsets[state], self.offsets[state + 1]
+
+        for position in range(start, end):
+            yield (self.alphabet[self.symbols[position]], self.destinies[position])
+
+    def step(self, state: int, symbol: Hashable) -> int:
+        """The destiny of the first transition of @state by @symbol, or DEAD"""
+        symbol_id = self.symbol_ids.get(symbol)
+
+        if symbol_id is None or state == DEAD:
+            return DEAD
+
+        try:
+            position = self.symbols.index(
+                symbol_id, self.offsets[state], self.offsets[state + 1]
+            )
+        except ValueError:
+            return DEAD
+
+        return self.destinies[position]
+
+    def accepts(self, word) -> bool:
+        """Runs the computation for @word over the stored rows, taking the first match on each step
+
+        Args:
+            word (str): the input word
+
+        Returns:
+            bool: True if the automata stops in an acceptance state
+        """
+        state = self.initial
+
+        for character in word:
+            state = self.step(state, character)
+
+            if state == DEAD:
+                return False
+
+        return self.is_accepting(state)
+
+    def compile(self) -> CompiledAutomata:
+        """Builds the dense transition table of the automata, whose states are the views of this storage
+
+        Returns:
+            CompiledAutomata: the compiled table
+        """
+        empty = array("i", [DEAD]) * len(self.alphabet)
+        rows = []
+
+        for state in range(len(self)):
+            row = array("i", empty)
+
+            for position in range(self.offsets[state], self.offsets[state + 1]):
+                column = self.symbols[position]
+
+                if row[column] == DEAD:
+                    row[column] = self.destinies[position]
+
+            rows.append(row)
+
+        accept = bytearray(self.is_accepting(state) for state in range(len(self)))
+
+        return CompiledAutomata(
+            self.views, *equivalence_classes(self.alphabet, rows), accept, self.initial
+        )
+
+
+class StateViews(Sequence):
+    """
+    The State objects of an AutomatonStore, created the first time each one is requested and
+    kept afterwards, so the same id always gives the same object.
+
+    Args:
+        store (AutomatonStore): the storage
+        objects (List[State]): objects already available for the first states
+    """
+
+    def __init__(self, store: AutomatonStore, objects: List[State] = None) -> None:
+        self.store = store
+        self.objects: Dict[int, State] = dict(enumerate(objects or []))
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index: int) -> State:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("state id out of range")
+
+        if index not in self.objects:
+            self.objects[index] = State(
+                self.store.names.get(index),
+                initial=index == self.store.initial,
+                accept=self.store.is_accepting(index),
+                type=self.store.types.get(index),
+            )
+
+        return self.objects[index]
+
+    def __iter__(self) -> Iterator[State]:
+        for index in range(len(self)):
+            yield self[index]
@@ -1,3 +1,4 @@
+from sys import intern
 from autome.automatas.finite_automata.state import State
 from typing import Callable, Dict, List
 
@@ -6,8 +7,13 @@ class Transition:
     """
     A transition between two states in a Finite Automata. Any Transition has an origin state, a
     destiny origin and a trigger symbol.
+
+    Transitions have no instance dict, and string symbols are interned, so every transition by
+    the same symbol shares a single string.
     """
 
+    __slots__ = ("origin", "destiny", "symbol")
+
     def __init__(
         self,
         origin: State,
@@ -16,7 +22,7 @@ class Transition:
     ) -> None:
         self.origin = origin
         self.destiny = destiny
-        self.symbol = symbol
+        self.symbol = intern(symbol) if type(symbol) is str else symbol
 
     def __repr__(self):
         return f"Transition({self.origin.name} → {self.destiny.name}) : {self.symbol}"
@@ -63,5 +69,4 @@ class Transition:
         )
 
     def __hash__(self) -> int:
-        concat = f"{self.destiny.__hash__()}.{self.origin.__hash__()}.{self.symbol.__hash__()}"
-        return hash(concat)
+        return hash((self.origin, self.destiny, self.symbol))
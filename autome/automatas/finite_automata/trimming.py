@@ -0,0 +1,52 @@
+from collections import deque
+from typing import Iterable, List, Sequence
+
+
+def useful_states(
+    initial: int, successors: Sequence[Iterable[int]], accepting: Iterable[int]
+) -> List[bool]:
+    """Marks the states reachable from the initial state which can also reach an acceptance state.
+
+    Works on any automata given as adjacency lists (epsilon transitions and multiple destinies
+    included): a breadth first search from the initial state records the predecessors of every
+    reached state, and a second one walks them backward from the reachable acceptance states,
+    so the cost is linear in the number of transitions. The initial state is always kept.
+
+    Args:
+        initial (int): id of the initial state
+        successors (Sequence[Iterable[int]]): the destinies of the transitions of each state
+        accepting (Iterable[int]): ids of the acceptance states
+
+    Returns:
+        List[bool]: True for each state that should be kept
+    """
+    reachable = [False] * len(successors)
+    reachable[initial] = True
+    queue = deque([initial])
+    predecessors: List[List[int]] = [[] for _ in successors]
+
+    while queue:
+        state = queue.popleft()
+
+        for destiny in successors[state]:
+            predecessors[destiny].append(state)
+
+            if not reachable[destiny]:
+                reachable[destiny] = True
+                queue.append(destiny)
+
+    alive = [False] * len(successors)
+    queue = deque(state for state in accepting if reachable[state])
+
+    for state in queue:
+        alive[state] = True
+
+    while queue:
+        for origin in predecessors[queue.popleft()]:
+            if not alive[origin]:
+                alive[origin] = True
+                queue.append(origin)
+
+    alive[initial] = True
+
+    return alive
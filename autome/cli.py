@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import click
+
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    JFlapConverter,
+    JSONConverter,
+)
+from autome.automatas.finite_automata.compiled import check_encoding
+from autome.automatas.finite_automata.scanner import FileScanner
+
+
+def load(path: Path) -> DeterministicFiniteAutomata:
+    """Parses a finite automata from a .jff (JFlap) or .json (this project's schema) file"""
+    if path.suffix == ".jff":
+        return JFlapConverter.parse(source=path)
+
+    return JSONConverter.parse(source=path)
+
+
+def encoding_option(context, parameter, value: str) -> str:
+    """Rejects encodings that files can't be scanned in byte by byte (see compiled.check_encoding)"""
+    try:
+        check_encoding(value)
+    except ValueError as error:
+        raise click.BadParameter(str(error))
+
+    return value
+
+
+@click.group()
+def cli():
+    """Automata simulation with Python"""
+
+
+@cli.command()
+@click.argument("machine", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--lines", "mode", flag_value="lines", help="Test each line of FILE.")
+@click.option(
+    "--matches", "mode", flag_value="matches", help="Print offsets of accepted lines."
+)
+@click.option(
+    "--encoding", default="utf-8", show_default=True, callback=encoding_option
+)
+@click.option(
+    "--workers", type=int, help="Processes used to test the whole FILE in parallel."
+)
+def scan(machine: Path, file: Path, mode: str, encoding: str, workers: int):
+    """Runs the automata in MACHINE over the content of FILE, without loading it into memory"""
+    scanner = FileScanner(load(machine), encoding=encoding)
+
+    if mode == "lines":
+        for number, (_, _, accepted) in enumerate(scanner.lines(file), start=1):
+            click.echo(f"{number}\t{'accepted' if accepted else 'rejected'}")
+    elif mode == "matches":
+        for start, end in scanner.matches(file):
+            click.echo(f"{start}:{end}")
+    else:
+        accepted = scanner.accepts(file, workers=workers)
+        click.echo("accepted" if accepted else "rejected")
+
+        if not accepted:
+            raise SystemExit(1)
@@ -51,3 +51,5 @@ class ConcatenationAutomata(NonDeterministicFiniteAutomata):
         transitions = temp_a.transitions + temp_b.transitions + new
 
         super().__init__(states, transitions)
+
+        self.trim()
@@ -39,3 +39,5 @@ class KleeneAutomata(NonDeterministicFiniteAutomata):
         transitions = temp_a.transitions + new_transitions
 
         super().__init__(states, transitions)
+
+        self.trim()
@@ -48,3 +48,5 @@ class UnionAutomata(NonDeterministicFiniteAutomata):
         transitions = temp_a.transitions + temp_b.transitions + new_transitions
 
         super().__init__(states, transitions)
+
+        self.trim()
@@ -4,4 +4,4 @@ from autome.regex.nodes import ParserNode
 
 class Interpreter:
     def run(self, node: ParserNode) -> NDFA:
-        return node.apply()
+        return node.build()
@@ -9,6 +9,7 @@ from autome.regex.blocks import (
 )
 
 from autome.automatas import NDFA
+from autome.automatas.finite_automata.cache import memoize
 
 
 @dataclass
@@ -16,6 +17,10 @@ class ParserNode:
     def apply(self) -> "NDFA":
         raise NotImplementedError()
 
+    def build(self) -> "NDFA":
+        """Runs apply through the operation cache (when enabled), keyed by the expression of the node"""
+        return memoize(lambda: ("regex", repr(self)), self.apply)
+
 
 @dataclass
 class SymbolNode(ParserNode):
@@ -36,7 +41,7 @@ class ConcatNode(ParserNode):
 
     def apply(self):
         # print(f'Entrou no concat {self.node_a} . {self.node_b}')
-        return ConcatenationAutomata(self.node_a.apply(), self.node_b.apply())
+        return ConcatenationAutomata(self.node_a.build(), self.node_b.build())
 
     def __repr__(self) -> str:
         return f"({self.node_a} . {self.node_b})"
@@ -49,7 +54,7 @@ class UnionNode(ParserNode):
 
     def apply(self):
         # print(f'Entrou no union {self.node_a} | {self.node_b}')
-        return UnionAutomata(self.node_a.apply(), self.node_b.apply())
+        return UnionAutomata(self.node_a.build(), self.node_b.build())
 
     def __repr__(self) -> str:
         return f"({self.node_a} | {self.node_b})"
@@ -61,7 +66,7 @@ class KleeneClosureNode(ParserNode):
 
     def apply(self):
         # print(f'Entrou no kleene {self.node}')
-        return KleeneAutomata(self.node.apply())
+        return KleeneAutomata(self.node.build())
 
     def __repr__(self) -> str:
         return f"({self.node})*"
@@ -72,7 +77,7 @@ class PositiveClosureNode(ParserNode):
     node: any
 
     def apply(self):
-        return PositiveClosureNode(self.node.apply())
+        return PositiveClosureNode(self.node.build())
 
     def __repr__(self) -> str:
         return f"({self.node})+"
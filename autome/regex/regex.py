@@ -10,9 +10,14 @@ class Regex:
         self.parser = Parser(self.tokens)
         self.tree = self.parser.parse()
         self.interpreter = Interpreter()
+        self.machine: NDFA = None
 
     def match(self, test) -> bool:
-        return self.interpreter.run(self.tree).determinize().accepts(test)
+        # The automata is built once and run lazily, so repeated matches share its subset cache
+        if self.machine is None:
+            self.machine = self.automata()
+
+        return self.machine.accepts(test)
 
     def automata(self) -> NDFA:
         return self.interpreter.run(self.tree)
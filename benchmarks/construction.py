@@ -0,0 +1,55 @@
+"""
+Measures incremental construction, through add_state and add_transition on an automata and
+through AutomatonBuilder, on chains of growing length. Both should grow linearly.
+
+Usage (from the project root): python -m benchmarks.construction [states]
+"""
+
+import sys
+from time import perf_counter
+
+from autome.automatas.finite_automata import DeterministicFiniteAutomata, State
+
+
+def incremental(size: int) -> float:
+    states = [State(f"s{index}", initial=index == 0) for index in range(size)]
+    machine = DeterministicFiniteAutomata()
+
+    start = perf_counter()
+
+    for state in states:
+        machine.add_state(state)
+
+    for origin, destiny in zip(states, states[1:]):
+        machine.add_transition(origin, destiny, "a")
+        machine.add_transition(origin, destiny, "a")
+
+    return perf_counter() - start
+
+
+def built(size: int) -> float:
+    start = perf_counter()
+
+    builder = DeterministicFiniteAutomata.builder()
+    states = [builder.add_state(initial=index == 0) for index in range(size)]
+
+    for origin, destiny in zip(states, states[1:]):
+        builder.add_transition(origin, destiny, "a")
+        builder.add_transition(origin, destiny, "a")
+
+    builder.freeze()
+
+    return perf_counter() - start
+
+
+def main(size: int = 32000):
+    for count in [size // 8, size // 4, size // 2, size]:
+        print(
+            f"{count:>7} states | "
+            f"add_state/add_transition {incremental(count):7.3f}s | "
+            f"builder {built(count):7.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
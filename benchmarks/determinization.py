@@ -0,0 +1,113 @@
+"""
+Compares NonDeterministicFiniteAutomata.determinize with the subset construction it replaced
+(worklist seeded with every singleton, closures searched again on every call, linear membership
+checks, State.join names), on NFAs built from regular expressions.
+
+Usage (from the project root): python -m benchmarks.determinization [n]
+"""
+
+import sys
+from random import Random
+from time import perf_counter
+
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    NonDeterministicFiniteAutomata,
+    State,
+)
+from autome.regex.regex import Regex
+
+
+def legacy_e_closure(machine: NonDeterministicFiniteAutomata, states):
+    """The previous implementation of e_closure, a fresh search over the & transitions on every call"""
+    closure = set()
+    accept = False
+
+    while states:
+        state = states.pop()
+        closure.add(state)
+
+        if state.accept:
+            accept = True
+
+        if "&" in machine.transition_map[state]:
+            for destiny in machine.transition_map[state]["&"]:
+                if destiny not in closure:
+                    states.append(destiny)
+
+    return (closure, accept)
+
+
+def legacy_determinize(machine: NonDeterministicFiniteAutomata):
+    """The previous implementation of determinize, kept only for comparison"""
+    symbols = list(set([transition.symbol for transition in machine.transitions]))
+    new = DeterministicFiniteAutomata()
+    state_stack = [{state} for state in machine.states]
+
+    while state_stack:
+        states = list(state_stack.pop())
+        state_closure, _ = legacy_e_closure(machine, states)
+        closure_state = State.join(list(state_closure))
+        new.add_state(closure_state)
+
+        for symbol in symbols:
+            if symbol == "&":
+                continue
+
+            reached_from_closure = set()
+
+            for to_state in state_closure:
+                if symbol not in machine.transition_map[to_state]:
+                    continue
+                reached_from_closure.update(machine.transition_map[to_state][symbol])
+
+            if len(reached_from_closure) == 0:
+                continue
+
+            closure, _ = legacy_e_closure(machine, list(reached_from_closure))
+            new_state = State.join(list(closure))
+
+            if not (new_state in new.states) and not (new_state in state_stack):
+                state_stack.append(closure)
+
+            new.add_transition(closure_state, new_state, symbol)
+
+    new.create_transition_map()
+
+    return new
+
+
+def measure(title: str, expression: str):
+    machine = Regex(expression).automata()
+
+    start = perf_counter()
+    legacy = legacy_determinize(machine)
+    before = perf_counter() - start
+
+    start = perf_counter()
+    result = machine.determinize()
+    after = perf_counter() - start
+
+    print(
+        f"{title:<28} NFA {len(machine.states):>4} states | "
+        f"before {before:8.3f}s ({len(legacy.states):>5} states) | "
+        f"after {after:8.3f}s ({len(result.states):>5} states)"
+    )
+
+
+def main(n: int = 12):
+    generator = Random(1)
+    words = [
+        " ".join(generator.choice("abcdef") for _ in range(generator.randint(4, 8)))
+        for _ in range(n * 10)
+    ]
+
+    measure("(a|b)* (c|d)*", "(a|b)* (c|d)*")
+    measure(f"n-th symbol from the end", "(a|b)* a" + " (a|b)" * (n - 1))
+    measure(f"{n} concatenated closures", " ".join(["(a|b|c)*"] * n))
+    measure(f"{n * 4} letters", " ".join("abcd" * n))
+    measure(f"{n * 10} word dictionary", "(" + "|".join(words) + ")*")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,104 @@
+"""
+Compares the precomputed epsilon closure index against the stack walk previously done by
+NonDeterministicFiniteAutomata.e_closure, on a Thompson NFA for ((a|b)*)^n.
+
+Usage (from the project root): python -m benchmarks.epsilon_closure [fragments] [queries]
+"""
+
+import sys
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Set
+
+from autome.automatas.finite_automata import EpsilonClosureIndex, State, Transition
+
+
+def thompson(fragments: int):
+    """States and transitions of the Thompson construction of ((a|b)*)^fragments"""
+    states: List[State] = [State(initial=True)]
+    transitions: List[Transition] = []
+    last = states[0]
+
+    for _ in range(fragments):
+        start, loop, left, right, left_end, right_end, join, end = [
+            State() for _ in range(8)
+        ]
+        states += [start, loop, left, right, left_end, right_end, join, end]
+        transitions += [
+            Transition(last, start, "&"),
+            Transition(start, loop, "&"),
+            Transition(start, end, "&"),
+            Transition(loop, left, "&"),
+            Transition(loop, right, "&"),
+            Transition(left, left_end, "a"),
+            Transition(right, right_end, "b"),
+            Transition(left_end, join, "&"),
+            Transition(right_end, join, "&"),
+            Transition(join, loop, "&"),
+            Transition(join, end, "&"),
+        ]
+        last = end
+
+    last.accept = True
+
+    return states, transitions
+
+
+def stack_walk(epsilon: Dict[State, List[State]], states: List[State]) -> Set[State]:
+    """The closure algorithm used before the index existed"""
+    closure = set()
+
+    while states:
+        state = states.pop()
+        closure.add(state)
+
+        for destiny in epsilon.get(state, ()):
+            if destiny not in closure:
+                states.append(destiny)
+
+    return closure
+
+
+def main(fragments: int = 1500, queries: int = 200):
+    states, transitions = thompson(fragments)
+    print(f"{len(states)} states, {len(transitions)} transitions")
+
+    random = Random(0)
+    samples = [random.sample(states, 3) for _ in range(queries)]
+
+    epsilon: Dict[State, List[State]] = {}
+    for transition in transitions:
+        if transition.symbol == "&":
+            epsilon.setdefault(transition.origin, []).append(transition.destiny)
+
+    start = perf_counter()
+    expected = [stack_walk(epsilon, list(sample)) for sample in samples]
+    walk = perf_counter() - start
+
+    start = perf_counter()
+    index = EpsilonClosureIndex(states, transitions)
+    build = perf_counter() - start
+
+    start = perf_counter()
+    result = [index.closure(sample) for sample in samples]
+    lookup = perf_counter() - start
+
+    start = perf_counter()
+    masks = [
+        index.mask(index.state_index[state] for state in sample) for sample in samples
+    ]
+    mask_lookup = perf_counter() - start
+
+    assert result == expected
+    assert all(
+        bin(mask).count("1") == len(closure) for mask, closure in zip(masks, expected)
+    )
+
+    print(f"stack walk:          {walk:.3f}s for {queries} closures")
+    print(f"index build:         {build:.3f}s (once per automata)")
+    print(f"index, as State set: {lookup:.3f}s for {queries} closures")
+    print(f"index, as bitset:    {mask_lookup:.5f}s for {queries} closures")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
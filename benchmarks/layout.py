@@ -0,0 +1,69 @@
+"""
+Compares acceptance throughput and memory of the per state row layouts picked by compiled
+tables (see layout.py) against fully dense tables, on tries over alphabets of growing size.
+
+Usage (from the project root): python -m benchmarks.layout [words]
+"""
+
+import sys
+from copy import copy
+from random import Random
+from time import perf_counter
+
+from autome.automatas.finite_automata import DeterministicFiniteAutomata
+
+
+def trie(words):
+    """A DFA accepting exactly @words, built as a prefix tree"""
+    builder = DeterministicFiniteAutomata.builder()
+    root = builder.add_state(initial=True)
+    paths = {"": root}
+
+    for word in words:
+        for end in range(1, len(word) + 1):
+            if word[:end] not in paths:
+                paths[word[:end]] = builder.add_state(accept=end == len(word))
+                builder.add_transition(
+                    paths[word[: end - 1]], paths[word[:end]], word[end - 1]
+                )
+
+    return builder.freeze()
+
+
+def run(table, words) -> float:
+    start = perf_counter()
+
+    for word in words:
+        table.accepts(word)
+
+    return perf_counter() - start
+
+
+def main(count: int = 5000):
+    generator = Random(1)
+
+    for size in [2, 26, 256, 4096]:
+        alphabet = [chr(0x400 + symbol) for symbol in range(size)]
+        words = {
+            "".join(generator.choice(alphabet) for _ in range(generator.randint(3, 12)))
+            for _ in range(count)
+        }
+        table = trie(words).compile()
+        report = table.layout.report()
+        chosen = run(table, words)
+
+        # The same table, forced to run the plain loop over the rebuilt dense rows
+        full = copy(table)
+        full._rows = table.rows
+        dense = run(full, words)
+
+        print(
+            f"{size:>5} symbols {len(table):>7} states | "
+            f"dense {report['dense']:>6} sorted {report['sorted']:>6} hash {report['hash']:>5} | "
+            f"{report['bytes'] / 2 ** 20:8.2f} MiB vs {report['dense_bytes'] / 2 ** 20:8.2f} MiB dense | "
+            f"{chosen:.3f}s vs {dense:.3f}s dense"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
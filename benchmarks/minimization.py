@@ -0,0 +1,88 @@
+"""
+Compares the minimization algorithms (DeterministicFiniteAutomata.minimize(method=...)) on
+random DFAs, DFAs built from regular expressions and the sample machines in machines/.
+
+Usage (from the project root): python -m benchmarks.minimization [size]
+"""
+
+import sys
+from pathlib import Path
+from random import Random
+from string import ascii_lowercase
+from time import perf_counter
+
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    JFlapConverter,
+    JSONConverter,
+)
+from autome.automatas.finite_automata.minimization import MINIMIZERS
+from autome.regex.regex import Regex
+from tests import helpers
+
+
+def random_machine(size: int, alphabet: str, density: float, seed: int = 1):
+    """A random DFA where each (state, symbol) pair has a transition with probability @density"""
+    return helpers.random_machine(
+        Random(seed), size, alphabet, accept=0.2, density=density
+    )
+
+
+def measure(title: str, machine: DeterministicFiniteAutomata, methods=MINIMIZERS):
+    # Compiling and building the resulting automata are the same for every method, so only
+    # the algorithms themselves are measured, over the compiled table
+    table = machine.compile()
+    columns = []
+
+    for method in methods:
+        start = perf_counter()
+        states, _ = MINIMIZERS[method](table)
+        columns.append(
+            f"{method} {perf_counter() - start:8.3f}s ({len(states):>5} states)"
+        )
+
+    print(f"{title:<36} {len(machine.states):>6} states | " + " | ".join(columns))
+
+
+def samples():
+    """The sample machines that can be parsed, by file name"""
+    for path in sorted(Path("./machines").iterdir()):
+        try:
+            if path.suffix == ".json":
+                yield path.name, JSONConverter.parse(source=path)
+            elif path.suffix == ".jff":
+                yield path.name, JFlapConverter.parse(path)
+        except Exception as error:
+            print(f"{path.name:<36} skipped ({type(error).__name__})")
+
+
+def main(size: int = 1000):
+    # The subset constructions of brzozowski blow up on random automatas, even with a few dozen states
+    measure("random, 2 symbols", random_machine(30, "ab", 1.0))
+    measure("random, 26 symbols", random_machine(12, ascii_lowercase, 1.0))
+
+    partition = ["hopcroft", "valmari"]
+    measure("random, 2 symbols", random_machine(size, "ab", 1.0), partition)
+    measure("random, 26 symbols", random_machine(size, ascii_lowercase, 1.0), partition)
+    measure(
+        "random sparse, 26 symbols",
+        random_machine(size, ascii_lowercase, 0.3),
+        partition,
+    )
+
+    n = 7
+    for title, expression in [
+        ("(a|b)* (c|d)*", "(a|b)* (c|d)*"),
+        ("n-th symbol from the end", "(a|b)* a" + " (a|b)" * (n - 1)),
+        (f"{n} concatenated closures", " ".join(["(a|b|c)*"] * n)),
+        (f"{n * 4} letters", " ".join("abcd" * n)),
+    ]:
+        measure(title, Regex(expression).automata().determinize())
+
+    for name, machine in samples():
+        if isinstance(machine, DeterministicFiniteAutomata):
+            measure(name, machine)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,38 @@
+from itertools import product
+from random import Random
+
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+
+
+def words(alphabet, length):
+    """Every word over @alphabet with up to @length symbols, shortest first"""
+    for size in range(length + 1):
+        for letters in product(alphabet, repeat=size):
+            yield "".join(letters)
+
+
+def random_machine(
+    generator: Random,
+    size: int,
+    alphabet: str = "ab",
+    accept: float = 0.3,
+    density: float = 0.75,
+):
+    """A random partial DFA, where states accept with probability @accept and each (state,
+    symbol) pair has a transition with probability @density"""
+    states = [
+        State(str(state), initial=state == 0, accept=generator.random() < accept)
+        for state in range(size)
+    ]
+    transitions = [
+        Transition(origin, generator.choice(states), symbol)
+        for origin in states
+        for symbol in alphabet
+        if generator.random() < density
+    ]
+
+    return DeterministicFiniteAutomata(states=states, transitions=transitions)
@@ -0,0 +1,27 @@
+import pytest
+from pathlib import Path
+from autome.automatas.finite_automata import JSONConverter
+from autome.regex.regex import Regex
+
+
+def test_accepts_many():
+    """
+    Test case for the vectorized batch acceptance, which should agree with accepts word by word
+    """
+    pytest.importorskip("numpy")
+
+    machine = JSONConverter.parse(
+        source=Path("./machines/deterministic-cross-machine.json")
+    )
+
+    words = ["", "a", "ab", "aaaaaaaaaaaa", "abba", "b", "c", "aba", "ção"]
+    result = machine.accepts_many(words, batch_size=4)
+
+    assert result.dtype == bool
+    assert list(result) == [machine.accepts(word) for word in words]
+
+    machine = Regex("(a|b)* (c|d)*").automata().determinize()
+    words = ["", "abcd", "acbd", "ddddbbbccccaaaa", "cccccddddd", "abbababa", "e"]
+
+    assert list(machine.accepts_many(words)) == [machine.accepts(w) for w in words]
+    assert len(machine.accepts_many([])) == 0
@@ -0,0 +1,51 @@
+from string import ascii_lowercase, digits
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+
+
+def identifier() -> DeterministicFiniteAutomata:
+    """Recognizer of identifiers: a letter followed by letters or digits"""
+    states = [State("0", initial=True), State("1", accept=True)]
+
+    transitions = [
+        Transition(states[0], states[1], letter) for letter in ascii_lowercase
+    ]
+    transitions += [
+        Transition(states[1], states[1], symbol) for symbol in ascii_lowercase + digits
+    ]
+
+    return DeterministicFiniteAutomata(states=states, transitions=transitions)
+
+
+def test_alphabet_classes():
+    """
+    Test case for grouping symbols with the same behaviour into a single column of the table
+    """
+    machine = identifier()
+    table = machine.compile()
+
+    assert table.width == 2
+    assert sorted(map(sorted, table.classes)) == [
+        sorted(digits),
+        sorted(ascii_lowercase),
+    ]
+    assert len(table.symbols) == 36
+    assert all(len(row) == 2 for row in table.rows)
+
+    assert machine.accepts("a1")
+    assert machine.accepts("abc123")
+    assert not machine.accepts("1a")
+    assert not machine.accepts("")
+    assert not machine.accepts("a-1")
+
+    # Every byte that never shows up falls into a single dead class
+    encoded = table.encoded()
+
+    assert encoded.width == 3
+    assert encoded.translation is not None
+    assert encoded.accepts(b"abc123")
+    assert not encoded.accepts(b"1abc")
+    assert not encoded.accepts(b"a\xff")
@@ -0,0 +1,121 @@
+import pytest
+
+from autome.automatas.finite_automata import (
+    AutomatonBuilder,
+    AutomatonStore,
+    DeterministicFiniteAutomata,
+    NonDeterministicFiniteAutomata,
+    State,
+)
+from autome.regex.regex import Regex
+
+
+def test_automaton_builder():
+    """
+    Test case for building a DFA incrementally, which comes out compiled, as a snapshot of the builder
+    """
+    builder = DeterministicFiniteAutomata.builder()
+
+    even = builder.add_state(initial=True, accept=True, name="even")
+    odd = builder.add_state(type="odd")
+
+    assert builder.add_transition(even, odd, "a")
+    assert not builder.add_transition(even, odd, "a")
+    builder.add_transition(odd, even, "a")
+    builder.add_transition(even, even, "b")
+    builder.add_transition(odd, odd, "b")
+
+    assert builder.successors(even, "a") == {odd}
+    assert builder.successors(even, "c") == set()
+
+    with pytest.raises(ValueError):
+        builder.add_transition(even, even, "a")
+
+    machine = builder.freeze()
+
+    assert isinstance(machine, DeterministicFiniteAutomata)
+    assert machine._compiled is not None
+
+    for word in ["", "a", "aa", "ab", "aba", "bbabab", "c"]:
+        assert machine.accepts(word) == (
+            set(word) <= {"a", "b"} and word.count("a") % 2 == 0
+        )
+
+    assert machine.initial().name == "even"
+    assert [state.type for state in machine.states] == [None, "odd"]
+    assert len(machine.transitions) == 4
+
+    with pytest.raises(ValueError):
+        builder.add_state()
+
+    # The automata is an ordinary one, changing it leaves the storage it was built on untouched
+    store = machine.store()
+    machine.add_transition(machine.states[0], machine.states[0], "c")
+
+    assert machine.accepts("c")
+    assert machine.store() is not store
+    assert not DeterministicFiniteAutomata.from_store(store).accepts("c")
+
+
+def test_nondeterministic_automaton_builder():
+    """
+    Test case for building an NFA, and for builders without a factory
+    """
+    builder = NonDeterministicFiniteAutomata.builder()
+    initial = builder.add_state(initial=True)
+    final = builder.add_state(accept=True)
+
+    builder.add_transition(initial, initial, "a")
+    builder.add_transition(initial, final, "a")
+
+    machine = builder.freeze()
+
+    assert isinstance(machine, NonDeterministicFiniteAutomata)
+    assert machine.accepts("aaa")
+    assert not machine.accepts("")
+
+    raw = AutomatonBuilder(deterministic=False)
+    raw.add_state(initial=True)
+    assert isinstance(raw.freeze(), AutomatonStore)
+
+    with pytest.raises(ValueError):
+        AutomatonBuilder().freeze()
+
+
+def test_incremental_construction():
+    """
+    Test case for add_state and add_transition, which should keep the transition map up to date
+    """
+    states = [State(f"s{index}", initial=index == 0) for index in range(2000)]
+    machine = DeterministicFiniteAutomata()
+
+    for state in states:
+        machine.add_state(state)
+
+    for origin, destiny in zip(states, states[1:]):
+        machine.add_transition(origin, destiny, "a")
+        machine.add_transition(origin, destiny, "a")
+
+    assert len(machine.states) == 2000
+    assert len(machine.transitions) == 1999
+    assert all(
+        machine.transition_map[origin] == {"a": {destiny}}
+        for origin, destiny in zip(states, states[1:])
+    )
+    assert machine.transition_map[states[-1]] == {}
+    assert machine.accepts("a" * 1999) == states[-1].accept
+
+    machine.add_state(states[0])
+    assert len(machine.states) == 2000
+
+
+def test_builder_operations():
+    """
+    Test case for cross_union and determinize, which are built through the builder
+    """
+    left = Regex("a b*").automata().determinize()
+    right = Regex("b a*").automata().determinize()
+    union = left.cross_union(right)
+
+    for word in ["a", "abb", "b", "baa", "aba", "", "bab"]:
+        assert union.accepts(word) == (left.accepts(word) or right.accepts(word))
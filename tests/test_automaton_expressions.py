@@ -0,0 +1,60 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    Expression,
+)
+from autome.regex.regex import Regex
+from tests.helpers import words
+
+
+def test_automaton_expressions():
+    """
+    Test case for lazy expressions, which should agree with the operations run one by one
+    """
+    a = Regex("(a|b)* a").automata().determinize()
+    b = Regex("(a b)*").automata().determinize()
+    c = Regex("b (a|b)*").automata().determinize()
+    d = Regex("a a").automata().determinize()
+
+    expression = (a.expression() | b) & ~c - d
+    eager = (a | b) & ~c - d
+
+    assert isinstance(expression, Expression)
+    assert expression.explored == 0
+
+    for word in words("abc", 6):
+        assert expression.accepts(word) == eager.accepts(word)
+
+    materialized = expression.materialize()
+
+    assert isinstance(materialized, DeterministicFiniteAutomata)
+    assert materialized.equivalent(eager)
+    assert not expression.is_empty()
+    assert eager.accepts(expression.is_empty().counterexample)
+
+
+def test_expression_exploration():
+    """
+    Test case for queries on expressions, which should only expand the states they reach
+    """
+    n = 12
+    left = Regex("(a|b)* a" + " (a|b)" * (n - 1)).automata().determinize()
+    right = Regex("(a|b)* b").automata().determinize()
+
+    expression = left.expression() & right
+
+    # The full product has thousands of states, a word only goes through a few of them
+    assert expression.accepts("a" * (n - 1) + "b")
+    assert not expression.accepts("b" * (n - 1) + "a")
+    assert expression.explored <= 2 * n
+
+    same = left.expression() & ~left
+    verdict = same.is_empty()
+
+    assert verdict
+    assert verdict.counterexample is None
+    assert same.materialize().is_empty()
+
+    shared = left.expression()
+    assert (shared ^ shared).is_empty()
+    assert len((shared | right).leaves()) == 2
+    assert len((shared & shared).leaves()) == 1
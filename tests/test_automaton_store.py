@@ -0,0 +1,78 @@
+import pickle
+from random import Random
+
+from autome.automatas.finite_automata import (
+    AutomatonStore,
+    DeterministicFiniteAutomata,
+    NonDeterministicFiniteAutomata,
+)
+from autome.regex.regex import Regex
+
+
+def test_automaton_store():
+    """
+    Test case for the struct-of-arrays storage built from an automata given as objects
+    """
+    machine = Regex("(a|b)* a b").automata().determinize()
+    store = machine.store()
+
+    assert isinstance(store, AutomatonStore)
+    assert machine.store() is store
+    assert len(store) == len(machine.states)
+    assert len(store.destinies) == len(machine.transitions)
+    assert list(store.views) == machine.states
+    assert store.views[0] is machine.states[0]
+
+    for word in ["", "ab", "aab", "ba", "abab", "abc"]:
+        assert store.accepts(word) == machine.accepts(word)
+        assert store.compile().accepts(word) == machine.accepts(word)
+
+    machine.add_transition(machine.initial(), machine.initial(), "c")
+    assert machine.store() is not store
+
+
+def test_automaton_store_backed_machine():
+    """
+    Test case for automatas backed by a storage, whose objects are only built on demand
+    """
+    size = 5000
+    generator = Random(3)
+    origins = [state for state in range(size) for _ in range(2)]
+    symbols = [symbol for _ in range(size) for symbol in range(2)]
+    destinies = [generator.randrange(size) for _ in range(2 * size)]
+    accepting = [state for state in range(size) if generator.random() < 0.5]
+
+    store = AutomatonStore.from_arrays(
+        size, origins, symbols, destinies, ["a", "b"], accepting, 0
+    )
+    machine = DeterministicFiniteAutomata.from_store(store)
+
+    words = ["".join(generator.choice("ab") for _ in range(20)) for _ in range(200)]
+    expected = [machine.accepts(word) for word in words]
+
+    assert machine._states is None
+    assert store.nbytes < 100 * size
+    table = store.compile()
+    assert [table.accepts(word) for word in words] == expected
+
+    copy = pickle.loads(pickle.dumps(machine))
+    assert copy._states is None
+    assert [copy.accepts(word) for word in words] == expected
+
+    assert len(machine.states) == size
+    assert len(machine.transitions) == 2 * size
+    assert machine.states[0].initial
+    assert [machine.accepts(word) for word in words] == expected
+
+
+def test_automaton_store_nondeterministic():
+    """
+    Test case for storing NFAs, which keep every transition of each state
+    """
+    original = Regex("(a|b)* a (a|b)").automata()
+    machine = NonDeterministicFiniteAutomata.from_store(original.store())
+
+    assert isinstance(machine, NonDeterministicFiniteAutomata)
+
+    for word in ["aa", "ab", "ba", "bb", "abab", "baa"]:
+        assert machine.accepts(word) == original.accepts(word)
@@ -0,0 +1,37 @@
+from itertools import product
+from random import Random
+from autome.automatas.finite_automata import BitParallelNFA
+from autome.regex.regex import Regex
+
+
+def test_bit_parallel_nfa():
+    """
+    Test case for simulating NDFAs with bitsets, without determinization
+    """
+    machine = Regex("(a|b)* (c|d)*").automata()
+    target = machine.determinize()
+
+    words = [
+        "".join(word) for size in range(6) for word in product("abcd", repeat=size)
+    ]
+
+    for word in words:
+        assert machine.simulate(word) == target.accepts(word)
+
+    assert isinstance(machine.simulator(), BitParallelNFA)
+    assert not machine.simulate("&")
+    assert not machine.simulate("e")
+
+
+def test_bit_parallel_nfa_explosion():
+    """
+    Test case for an automata whose equivalent DFA has 2^n states
+    """
+    n = 40
+    machine = Regex("(a|b)* a" + " (a|b)" * (n - 1)).automata()
+    random = Random(3)
+
+    for _ in range(20):
+        word = "".join(random.choice("ab") for _ in range(random.randint(0, 300)))
+        expected = len(word) >= n and word[-n] == "a"
+        assert machine.simulate(word) == expected
@@ -0,0 +1,48 @@
+from autome.automatas.finite_automata import DeterministicFiniteAutomata
+from autome.regex.regex import Regex
+
+
+def test_canonical_form():
+    """
+    Test case for the canonical automata, which only depends on the language
+    """
+    first = Regex("(a b)* a").automata()
+    second = Regex("a (b a)*").automata().determinize()
+
+    canonical = first.canonical()
+
+    assert isinstance(canonical, DeterministicFiniteAutomata)
+    assert [state.name for state in canonical.states] == ["q0", "q1"]
+    assert canonical.states[0].initial
+    assert canonical.equivalent(first)
+
+    assert [
+        (transition.origin.name, transition.symbol, transition.destiny.name)
+        for transition in second.canonical().transitions
+    ] == [
+        (transition.origin.name, transition.symbol, transition.destiny.name)
+        for transition in canonical.transitions
+    ]
+
+
+def test_fingerprint():
+    """
+    Test case for language fingerprints, equal if and only if the languages are
+    """
+    first = Regex("(a b)* a").automata()
+    second = Regex("a (b a)*").automata().determinize()
+    third = Regex("(a b)* b").automata()
+
+    assert first.fingerprint() == second.fingerprint()
+    assert first.fingerprint() != third.fingerprint()
+    assert len(first.fingerprint()) == 64
+
+    # Symbols leading only to dead states don't change the language
+    empty = Regex("c a c a c").automata() - Regex("c (a|c)*").automata()
+
+    assert (first | empty).fingerprint() == first.fingerprint()
+
+    fingerprint = second.fingerprint()
+    second.add_transition(second.initial(), second.initial(), "c")
+
+    assert second.fingerprint() != fingerprint
@@ -0,0 +1,70 @@
+from pathlib import Path
+from autome.automatas.finite_automata import (
+    CompiledAutomata,
+    DeterministicFiniteAutomata,
+    JSONConverter,
+    State,
+    Transition,
+)
+
+
+def test_compiled_automata():
+    """
+    Test case for the compiled transition table, which should agree with the step by step computation
+    """
+    machine = JSONConverter.parse(
+        source=Path("./machines/deterministic-cross-machine.json")
+    )
+
+    table = machine.compile()
+
+    assert isinstance(table, CompiledAutomata)
+    assert len(table) == len(machine.states)
+    assert machine.compile() is table
+
+    for word in ["", "a", "ab", "aaaaaaaaaaaa", "abba", "b", "c", "aba"]:
+        assert table.accepts(word) == reference(machine, word)
+
+
+def test_compiled_automata_invalidation():
+    """
+    Test case for rebuilding the compiled table after the automata changes
+    """
+    states = [State("0", initial=True), State("1", accept=True)]
+    machine = DeterministicFiniteAutomata(
+        states=states, transitions=[Transition(states[0], states[1], "a")]
+    )
+
+    assert machine.accepts("a")
+    assert not machine.accepts("ab")
+
+    machine.add_transition(states[1], states[1], "b")
+
+    assert machine.accepts("ab")
+    assert machine.accepts("abbb")
+
+    extra = State("2", accept=True)
+    machine.add_state(extra)
+    machine.add_transition(states[0], extra, "c")
+
+    assert machine.accepts("c")
+    assert not machine.accepts("cb")
+
+
+def reference(machine: DeterministicFiniteAutomata, word: str) -> bool:
+    """Runs the computation by scanning the transition list, taking the first match on each step"""
+    state = machine.initial()
+
+    for character in word:
+        matches = [
+            transition
+            for transition in machine.transitions
+            if transition.origin == state and transition.symbol == character
+        ]
+
+        if len(matches) == 0:
+            return False
+
+        state = matches[0].destiny
+
+    return state.accept
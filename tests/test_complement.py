@@ -0,0 +1,94 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+from autome.automatas.finite_automata.compiled import DEAD
+from autome.regex.regex import Regex
+from tests.helpers import words
+
+
+def test_complement():
+    """
+    Test case for the complement relative to the alphabet, which also accepts words where the operand gets stuck
+    """
+    machine = Regex("a b*").automata().determinize()
+    complement = ~machine
+
+    assert isinstance(complement, DeterministicFiniteAutomata)
+
+    for word in words("ab", 5):
+        assert complement.accepts(word) != machine.accepts(word)
+
+    # Words with symbols outside of the alphabet are rejected by both
+    assert not complement.accepts("c")
+    assert not complement.accepts("bc")
+
+    assert (~complement).equivalent(machine)
+    assert (complement & machine).is_empty()
+
+    nondeterministic = ~Regex("(a|b)* a").automata()
+    assert nondeterministic.accepts("ab") and not nondeterministic.accepts("ba")
+
+
+def test_complement_sharing():
+    """
+    Test case for the copy free complement, which shares the rows of complete tables and builds objects on demand
+    """
+    states = [State("0", initial=True), State("1", accept=True)]
+    machine = DeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[1], states[0], "a"),
+        ],
+    )
+
+    complement = ~machine
+    table = machine.compile()
+
+    assert complement._states is None
+    assert complement.compile().rows[0] is table.rows[0]
+    assert complement.compile().complemented() is table
+    assert complement.accepts("aa") and not complement.accepts("a")
+
+    # Inspecting the complement builds its own objects, which may be changed freely
+    assert len(complement.states) == 2
+    assert [state.accept for state in complement.states] == [True, False]
+
+    complement.add_transition(complement.states[0], complement.states[0], "b")
+
+    assert complement.accepts("b") and complement.accepts("baa")
+    assert not machine.accepts("ba") and not machine.accepts("b")
+    assert states[1].accept
+
+    # Incomplete tables share their rows too, missing transitions are read as the trap
+    machine = Regex("a b*").automata().determinize()
+    table = machine.compile()
+    complemented = table.complemented()
+
+    assert len(complemented) == len(table) + 1
+    assert all(
+        row is shared
+        for row, shared in zip(complemented.layout.rows, table.layout.rows)
+    )
+    assert complemented.accepts("b") and complemented.accepts("aba")
+    assert not complemented.accepts("abb") and not complemented.accepts("c")
+    assert all(DEAD not in row for row in complemented.rows)
+
+
+def test_clone():
+    """
+    Test case for clones, which share the compiled table until they are changed
+    """
+    machine = Regex("a b*").automata().determinize()
+    clone = machine.clone()
+
+    assert clone.compile() is machine.compile()
+    assert clone.accepts("abb")
+
+    clone.add_transition(clone.initial(), clone.initial(), "c")
+
+    assert clone.accepts("cab")
+    assert not machine.accepts("cab")
+    assert clone.compile() is not machine.compile()
@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from pathlib import Path
+from autome.automatas.finite_automata import JSONConverter
+
+
+def test_concurrent_execution():
+    """
+    Test case for sharing a single automata between many threads
+    """
+    machine = JSONConverter.parse(
+        source=Path("./machines/deterministic-cross-machine.json")
+    )
+
+    words = ["".join(word) for size in range(8) for word in product("ab", repeat=size)]
+    expected = [machine.accepts(word) for word in words]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            assert list(pool.map(machine.accepts, words)) == expected
+
+    assert not hasattr(machine, "step_stack")
+
+
+def test_execution_trace():
+    """
+    Test case for the bounded transition history kept by a cursor
+    """
+    machine = JSONConverter.parse(
+        source=Path("./machines/deterministic-cross-machine.json")
+    )
+
+    cursor = machine.cursor(trace=3)
+
+    assert cursor.feed("aaaaab")
+    assert len(cursor.trace) == 3
+    assert [transition.symbol for transition in cursor.trace] == ["a", "a", "b"]
+    assert cursor.trace[-1].destiny == cursor.current_state
+
+    assert machine.cursor().trace is None
+    assert machine.accepts("aab", debug=True) == machine.accepts("aab")
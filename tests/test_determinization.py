@@ -0,0 +1,29 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    JSONConverter,
+)
+from autome.regex.regex import Regex
+
+
+def test_determinization():
+    """
+    Test case for the subset construction, which should only create subsets reachable from the initial state
+    """
+    # The n-th symbol from the end is an 'a', its minimal DFA has 2^n states
+    n = 5
+    machine = Regex("(a|b)* a" + " (a|b)" * (n - 1)).automata()
+
+    result = machine.determinize()
+
+    assert isinstance(result, DeterministicFiniteAutomata)
+    assert len(result.states) <= 2**n + 1
+    assert len([state for state in result.states if state.initial]) == 1
+    assert len(set(state.name for state in result.states)) == len(result.states)
+
+    for word in ["a" + "b" * (n - 1), "b" * n, "ab" * n, "ba" * n, "aaaa"]:
+        assert result.accepts(word) == (len(word) >= n and word[-n] == "a")
+
+    # Every transition points to a state of the automata, so it survives serialization
+    copy = JSONConverter.parse(JSONConverter.serialize(result))
+    assert copy.accepts("a" + "b" * (n - 1))
+    assert not copy.accepts("b" * n)
@@ -0,0 +1,39 @@
+from io import StringIO
+from pathlib import Path
+from autome.automatas.finite_automata import DFACursor, JSONConverter
+
+
+def test_dfa_cursor():
+    """
+    Test case for feeding a DFA chunk by chunk through a cursor
+    """
+    machine = JSONConverter.parse(
+        source=Path("./machines/deterministic-cross-machine.json")
+    )
+
+    cursor = machine.cursor()
+
+    assert isinstance(cursor, DFACursor)
+    assert not cursor.finish()
+
+    assert cursor.feed("aaa")
+    assert cursor.finish()
+    assert cursor.feed("aab")
+    assert cursor.finish()
+    assert cursor.position == 6
+
+    # Resuming from a saved state
+    resumed = DFACursor(machine.compile(), cursor.state, cursor.position)
+    assert not resumed.feed("b")
+    assert not resumed.alive
+    assert not resumed.feed("a")
+    assert not resumed.finish()
+
+    cursor.reset()
+    assert cursor.feed_all(iter(["a", "", "a", "ab"])) == machine.accepts("aaab")
+
+    cursor.reset()
+    stream = StringIO("a" * 10000 + "b")
+    assert cursor.feed_all(iter(lambda: stream.read(64), "")) == machine.accepts(
+        "a" * 10000 + "b"
+    )
@@ -0,0 +1,49 @@
+from autome.automatas.finite_automata import (
+    EpsilonClosureIndex,
+    NonDeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+
+
+def test_epsilon_closure():
+    """
+    Test case for the precomputed epsilon closures, including epsilon cycles
+    """
+    states = [State(f"{index}", initial=index == 0) for index in range(6)]
+    states[5].accept = True
+
+    transitions = [
+        # 0 -> 1 -> 2 -> 0 is a cycle, 2 -> 3 leaves it
+        Transition(states[0], states[1], "&"),
+        Transition(states[1], states[2], "&"),
+        Transition(states[2], states[0], "&"),
+        Transition(states[2], states[3], "&"),
+        Transition(states[3], states[4], "a"),
+        Transition(states[4], states[5], "&"),
+    ]
+
+    machine = NonDeterministicFiniteAutomata(states=states, transitions=transitions)
+    index = machine.closure_index()
+
+    assert isinstance(index, EpsilonClosureIndex)
+    assert machine.closure_index() is index
+
+    assert index.closure([states[1]]) == {states[0], states[1], states[2], states[3]}
+    assert index.closure([states[3]]) == {states[3]}
+    assert index.closure([states[4]]) == {states[4], states[5]}
+    assert index.closure([states[3], states[4]]) == {states[3], states[4], states[5]}
+
+    closure, accept = machine.e_closure([states[4]])
+    assert closure == {states[4], states[5]} and accept
+
+    # Reading 'a' from the initial closure reaches 4 and its closure
+    assert set(index.ids(index.step(index.closures[0], "a"))) == {4, 5}
+
+    assert machine.accepts("a")
+    assert not machine.accepts("")
+    assert not machine.accepts("aa")
+
+    machine.add_transition(states[5], states[0], "&")
+    assert machine.closure_index() is not index
+    assert machine.accepts("aa")
@@ -0,0 +1,88 @@
+import pytest
+from click.testing import CliRunner
+
+from autome.automatas.finite_automata import FileScanner
+from autome.cli import cli
+from autome.regex.regex import Regex
+
+
+def test_file_scanner(tmp_path):
+    """
+    Test case for running an automata over memory mapped files, including multi-byte characters
+    """
+    machine = Regex("(a|ç)* b").automata().determinize()
+    scanner = FileScanner(machine)
+
+    lines = ["aab", "çab", "", "abb", "çççb", "b", "aç"]
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    results = list(scanner.lines(path))
+
+    assert [accepted for _, _, accepted in results] == [
+        machine.accepts(line) for line in lines
+    ]
+
+    data = path.read_bytes()
+    for (start, end, _), line in zip(results, lines):
+        assert data[start:end].decode("utf-8") == line
+
+    matches = list(scanner.matches(path))
+    assert [data[start:end].decode("utf-8") for start, end in matches] == [
+        "aab",
+        "çab",
+        "çççb",
+        "b",
+    ]
+
+    whole = tmp_path / "whole.txt"
+    whole.write_text("ç" * 5000 + "a" * 5000 + "b", encoding="utf-8")
+    assert scanner.accepts(whole, chunk_size=777)
+
+    whole.write_text("ç" * 5000 + "b" + "a", encoding="utf-8")
+    assert not scanner.accepts(whole)
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert not scanner.accepts(empty)
+    assert list(scanner.lines(empty)) == []
+
+    # Byte order marks would be repeated on every character
+    with pytest.raises(ValueError):
+        FileScanner(machine, encoding="utf-16").table
+
+
+def test_scan_command(tmp_path):
+    """
+    Test case for the scan command line interface
+    """
+    path = "./machines/deterministic-cross-machine.json"
+
+    data = tmp_path / "data.txt"
+    data.write_text("aab\na\nabb\n")
+
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["scan", path, str(data), "--lines"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["1\taccepted", "2\taccepted", "3\trejected"]
+
+    result = runner.invoke(cli, ["scan", path, str(data), "--matches"])
+    assert result.output.splitlines() == ["0:3", "4:5"]
+
+    result = runner.invoke(cli, ["scan", path, str(data)])
+    assert result.exit_code == 1
+    assert result.output.strip() == "rejected"
+
+    data.write_text("aaab")
+
+    result = runner.invoke(cli, ["scan", path, str(data)])
+    assert result.exit_code == 0
+    assert result.output.strip() == "accepted"
+
+    result = runner.invoke(cli, ["scan", path, str(data), "--encoding", "utf-16"])
+    assert result.exit_code == 2
+    assert "utf-16" in result.output
+
+    result = runner.invoke(cli, ["scan", path, str(data), "--encoding", "latin-1"])
+    assert result.exit_code == 0
@@ -0,0 +1,96 @@
+from random import Random
+
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+from autome.regex.regex import Regex
+from tests.helpers import random_machine
+
+
+def test_language_equivalence():
+    """
+    Test case for the Hopcroft-Karp equivalence check, which compares languages instead of structure
+    """
+    machine = Regex("(a|b)* a b").automata()
+    determinized = machine.determinize()
+
+    assert machine.equivalent(determinized)
+    assert determinized.equivalent(determinized.minimize())
+    assert Regex("(a b)* a").automata().equivalent(Regex("a (b a)*").automata())
+
+    verdict = determinized.equivalent(Regex("(a|b)* b").automata())
+
+    assert not verdict
+    assert determinized.accepts(verdict.counterexample) != Regex(
+        "(a|b)* b"
+    ).automata().accepts(verdict.counterexample)
+
+
+def test_language_inclusion():
+    """
+    Test case for the inclusion check, whose counterexamples are accepted by the left side only
+    """
+    suffix = Regex("(a|b)* a b").automata()
+    everything = Regex("(a|b)*").automata()
+
+    assert suffix.is_subset(everything)
+    assert suffix.is_subset(suffix)
+
+    verdict = everything.is_subset(suffix)
+
+    assert not verdict
+    assert everything.accepts(verdict.counterexample)
+    assert not suffix.accepts(verdict.counterexample)
+
+    # Symbols unknown to the right side lead to its dead state
+    verdict = Regex("a c").automata().is_subset(everything)
+
+    assert not verdict
+    assert verdict.counterexample == "ac"
+
+
+def test_language_emptiness():
+    """
+    Test case for the emptiness check, which gives an accepted word when the language isn't empty
+    """
+    states = [State("0", initial=True), State("1"), State("2", accept=True)]
+    machine = DeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[1], states[0], "b"),
+            Transition(states[2], states[0], "a"),
+        ],
+    )
+
+    assert machine.is_empty()
+
+    machine.add_transition(states[1], states[2], "c")
+    verdict = machine.is_empty()
+
+    assert not verdict
+    assert verdict.counterexample == "ac"
+    assert (machine - machine).is_empty()
+
+
+def test_language_equivalence_random():
+    """
+    Test case comparing the equivalence check against minimization on random automatas
+    """
+    generator = Random(11)
+
+    for _ in range(50):
+        left, right = [
+            random_machine(generator, 6, accept=0.4, density=0.8) for _ in range(2)
+        ]
+        verdict = left.equivalent(right)
+
+        assert bool(verdict) == bool((left ^ right).is_empty())
+
+        if not verdict:
+            word = verdict.counterexample
+            assert left.accepts(word) != right.accepts(word)
+
+        assert left.equivalent(left.minimize(method="valmari"))
@@ -0,0 +1,44 @@
+from itertools import product
+from random import Random
+from autome.automatas.finite_automata import LazyDFA
+from autome.regex.regex import Regex
+
+
+def test_lazy_dfa():
+    """
+    Test case for running NDFAs through the lazy subset construction
+    """
+    machine = Regex("(a|b)* (c|d)*").automata()
+    target = machine.determinize()
+
+    words = [
+        "".join(word) for size in range(6) for word in product("abcd", repeat=size)
+    ]
+
+    for word in words:
+        assert machine.accepts(word) == target.accepts(word)
+
+    # The same lazy automata (and cache) is reused between calls
+    assert isinstance(machine.lazy(), LazyDFA)
+    assert machine.lazy() is machine.lazy()
+    assert not machine.accepts("&")
+
+
+def test_lazy_dfa_flush():
+    """
+    Test case for flushing the cache of a lazy DFA whose determinization is exponential
+    """
+    # The n-th symbol from the end is an 'a', the equivalent DFA has 2^n states
+    n = 10
+    machine = Regex("(a|b)* a" + " (a|b)" * (n - 1)).automata()
+
+    lazy = machine.lazy(cache_size=64)
+    random = Random(7)
+
+    for _ in range(50):
+        word = "".join(random.choice("ab") for _ in range(random.randint(0, 200)))
+        expected = len(word) >= n and word[-n] == "a"
+        assert lazy.accepts(word) == expected
+
+    assert lazy.flushes > 0
+    assert len(lazy.cache) <= 64
@@ -0,0 +1,108 @@
+from random import Random
+
+import pytest
+
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+from autome.regex.regex import Regex
+from tests.helpers import random_machine, words
+
+
+def test_minimization():
+    """
+    Test case for Hopcroft's minimization, which should merge equivalent states and keep the language
+    """
+    machine = Regex("(a|b)* (c|d)*").automata().determinize()
+
+    result = machine.minimize()
+
+    assert isinstance(result, DeterministicFiniteAutomata)
+    assert len(result.states) == 2
+    assert len(machine.minimize(complete=True).states) == 3
+
+    for word in words("abcd", 4):
+        assert result.accepts(word) == machine.accepts(word)
+
+
+def test_minimization_nth_from_end():
+    """
+    Test case for the minimal DFA of "the n-th symbol from the end is an 'a'", which has 2^n states
+    """
+    n = 4
+    machine = Regex("(a|b)* a" + " (a|b)" * (n - 1)).automata()
+
+    result = machine.minimize()
+
+    assert len(result.states) == 2**n
+    assert len(result.minimize().states) == 2**n
+
+    for word in words("ab", n + 2):
+        assert result.accepts(word) == machine.accepts(word)
+
+
+def test_minimization_trimming():
+    """
+    Test case for removing unreachable and dead states, always keeping the initial one
+    """
+    states = [
+        State("0", initial=True),
+        State("1", accept=True),
+        State("2"),
+        State("3", accept=True),
+    ]
+    machine = DeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[0], states[2], "b"),
+            Transition(states[2], states[2], "b"),
+            Transition(states[3], states[1], "a"),
+        ],
+    )
+
+    result = machine.minimize()
+
+    assert len(result.states) == 2
+    assert result.accepts("a")
+    assert not result.accepts("b")
+
+    empty = DeterministicFiniteAutomata(
+        states=[states[0], states[2]],
+        transitions=[Transition(states[0], states[2], "b")],
+    ).minimize()
+
+    assert len(empty.states) == 1
+    assert empty.initial() is not None
+    assert not empty.accepts("") and not empty.accepts("b")
+
+
+def test_minimization_methods():
+    """
+    Test case for the selectable algorithms, which should all find the same minimal automata
+    """
+    generator = Random(7)
+
+    for _ in range(30):
+        machine = random_machine(
+            generator, size=generator.randint(1, 12), alphabet="abc"
+        )
+        sizes = set()
+
+        for method in ["hopcroft", "valmari", "brzozowski"]:
+            result = machine.minimize(method=method)
+            sizes.add(len(result.states))
+
+            for word in words("abc", 5):
+                assert result.accepts(word) == machine.accepts(word)
+
+            assert len(machine.minimize(method=method, complete=True).states) >= len(
+                result.states
+            )
+
+        assert len(sizes) == 1
+
+    with pytest.raises(ValueError):
+        machine.minimize(method="unknown")
@@ -0,0 +1,114 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    NonDeterministicFiniteAutomata,
+    OperationCache,
+    State,
+    Transition,
+    operation_cache,
+)
+from autome.automatas.finite_automata.cache import active_cache
+from autome.regex.regex import Regex
+
+
+def test_operation_cache():
+    """
+    Test case for memoizing operations by the fingerprints of their operands
+    """
+    first = Regex("(a|b)* a").automata().determinize()
+    second = Regex("(a b)*").automata().determinize()
+
+    assert active_cache() is None
+
+    with operation_cache() as cache:
+        assert isinstance(cache, OperationCache)
+
+        union = first | second
+        assert cache.stats["misses"] == 1 and cache.hits == 0
+
+        # Operands built again from the same expressions have the same fingerprints
+        again = (
+            Regex("(a|b)* a").automata().determinize()
+            | Regex("(a b)*").automata().determinize()
+        )
+        assert cache.hits >= 1
+        assert again is not union
+        assert again.equivalent(union)
+
+        # Every call gets its own copy, so changing a result doesn't change the cache
+        hits = cache.hits
+        copy = first - second
+        copy.add_transition(copy.initial(), copy.initial(), "c")
+        assert not (first - second).accepts("ca")
+        assert cache.hits > hits
+
+        minimal = first.minimize()
+        assert first.minimize().equivalent(minimal)
+
+    assert active_cache() is None
+
+
+def test_operation_cache_eviction():
+    """
+    Test case for dropping the least recently used results once the cache is full
+    """
+    machines = [
+        Regex(" ".join("a" * size)).automata().determinize() for size in range(1, 5)
+    ]
+
+    with operation_cache(max_size=2) as cache:
+        for machine in machines:
+            machine.minimize()
+
+        assert len(cache) == 2
+        assert cache.evictions == 2
+
+        machines[-1].minimize()
+        assert cache.hits == 1
+
+        machines[0].minimize()
+        assert cache.misses == 5
+
+
+def test_operation_cache_structural_keys():
+    """
+    Test case for operations whose results depend on structure, like determinize and regex blocks
+    """
+    with operation_cache() as cache:
+        machine = Regex("a b").automata()
+        determinized = machine.determinize()
+
+        assert isinstance(determinized, DeterministicFiniteAutomata)
+        assert Regex("a b").automata().determinize().equivalent(determinized)
+        assert cache.hits >= 1
+
+        # Regex blocks are cached by expression, and stay nondeterministic
+        hits = cache.hits
+        assert isinstance(Regex("a b").automata(), NonDeterministicFiniteAutomata)
+        assert cache.hits > hits
+
+
+def test_operation_cache_alphabets():
+    """
+    Test case for operands with the same fingerprint but different alphabets, whose products
+    have different complements
+    """
+    states = [State("0", initial=True), State("1", accept=True), State("dead")]
+    with_dead_end = DeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[0], states[2], "c"),
+        ],
+    )
+    states = [State("0", initial=True), State("1", accept=True)]
+    without = DeterministicFiniteAutomata(
+        states=states, transitions=[Transition(states[0], states[1], "a")]
+    )
+    other = Regex("b").automata().determinize()
+
+    assert with_dead_end.fingerprint() == without.fingerprint()
+    assert not (~(without | other)).accepts("c")
+
+    with operation_cache():
+        assert (~(with_dead_end | other)).accepts("c")
+        assert not (~(without | other)).accepts("c")
@@ -0,0 +1,39 @@
+from random import Random
+from autome.automatas.finite_automata import FileScanner
+from autome.automatas.finite_automata.parallel import transfer
+from autome.regex.regex import Regex
+
+
+def test_transfer():
+    """
+    Test case for the speculative simulation of a chunk from every state
+    """
+    table = Regex("(a|b)* a b").automata().determinize().compile()
+
+    for chunk in ["", "a", "ab", "ba", "abab", "c", "bbbbba"]:
+        mapping = transfer(table, [chunk[:2], chunk[2:]])
+
+        for state in range(len(table)):
+            assert mapping[state] == table.advance(state, chunk)
+
+
+def test_parallel_scanning(tmp_path):
+    """
+    Test case for splitting the computation between processes
+    """
+    machine = Regex("(a|ç)* b (a|b)*").automata().determinize()
+    random = Random(42)
+
+    for _ in range(3):
+        word = "".join(random.choice("aç") for _ in range(3000)) + "b" + "ab" * 50
+        assert machine.accepts_parallel(word, workers=2)
+        assert not machine.accepts_parallel(word + "ç", workers=2)
+
+    path = tmp_path / "input.txt"
+    path.write_text(word, encoding="utf-8")
+
+    scanner = FileScanner(machine)
+    assert scanner.accepts(path, workers=2)
+
+    path.write_text(word + "ç", encoding="utf-8")
+    assert not scanner.accepts(path, workers=2)
@@ -0,0 +1,63 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+from autome.regex.regex import Regex
+from tests.helpers import words
+
+
+def test_product_construction():
+    """
+    Test case for the boolean operations built as a product of the compiled tables
+    """
+    # Words with an even number of a's, and words ending with "ab"
+    even = Regex("(b* a b* a)* b*").automata().determinize()
+    suffix = Regex("(a|b)* a b").automata().determinize()
+
+    operations = [
+        (even & suffix, lambda left, right: left and right),
+        (even | suffix, lambda left, right: left or right),
+        (even - suffix, lambda left, right: left and not right),
+        (even ^ suffix, lambda left, right: left != right),
+    ]
+
+    for result, expected in operations:
+        assert isinstance(result, DeterministicFiniteAutomata)
+        assert len(result.states) <= len(even.states) * len(suffix.states) + 1
+
+        for word in words("ab", 6):
+            assert result.accepts(word) == expected(
+                even.accepts(word), suffix.accepts(word)
+            )
+
+
+def test_product_incomplete_operands():
+    """
+    Test case for operands with missing transitions and different alphabets, where the missing side rejects
+    """
+    states = [State("0", initial=True), State("1", accept=True)]
+    only_a = DeterministicFiniteAutomata(
+        states=states, transitions=[Transition(states[0], states[1], "a")]
+    )
+    letters = Regex("(a|c) c*").automata()
+
+    intersection = only_a & letters
+    assert intersection.accepts("a")
+    assert not intersection.accepts("c")
+    assert not intersection.accepts("ac")
+
+    # Pairs that can't accept anymore are never created
+    assert len(intersection.states) == 2
+
+    union = only_a | letters
+    assert union.accepts("a") and union.accepts("c") and union.accepts("acc")
+    assert not union.accepts("") and not union.accepts("b")
+
+    difference = letters - only_a
+    assert difference.accepts("c") and difference.accepts("ac")
+    assert not difference.accepts("a")
+
+    empty = only_a - only_a
+    assert not any(state.accept for state in empty.states)
+    assert not empty.accepts("") and not empty.accepts("a")
@@ -0,0 +1,158 @@
+from autome.automatas.finite_automata import DeterministicFiniteAutomata
+from autome.automatas.finite_automata.layout import DEAD, DENSE_WIDTH
+from autome.regex.regex import Regex
+
+
+def test_row_layout():
+    """
+    Test case for the layout of compiled tables, which should keep small alphabets dense
+    """
+    machine = Regex("(a|b)* a b").automata().determinize()
+    table = machine.compile()
+    report = table.layout.report()
+
+    assert table.layout.dense
+    assert report["dense"] == len(table)
+    assert report["sorted"] == report["hash"] == 0
+    assert table.layout.kind(table.initial) == "dense"
+
+    # Bounds of sorted rows are only allocated for tables that have some
+    assert table.layout.lower is None and table.layout.upper is None
+
+
+def test_sparse_row_layout():
+    """
+    Test case for tables over large alphabets, whose sparse states get sparse rows
+    """
+    alphabet = [chr(0x400 + symbol) for symbol in range(4 * DENSE_WIDTH)]
+    words = [
+        "".join(alphabet[(start + step) % len(alphabet)] for step in range(5))
+        for start in range(len(alphabet))
+    ]
+
+    builder = DeterministicFiniteAutomata.builder()
+    root = builder.add_state(initial=True)
+    paths = {"": root}
+
+    for word in words:
+        for end in range(1, len(word) + 1):
+            if word[:end] not in paths:
+                paths[word[:end]] = builder.add_state(accept=end == len(word))
+                builder.add_transition(
+                    paths[word[: end - 1]], paths[word[:end]], word[end - 1]
+                )
+
+    table = builder.freeze().compile()
+    report = table.layout.report()
+
+    assert not table.layout.dense
+    assert table.layout.kind(table.initial) == "dense"
+    assert report["dense"] + report["sorted"] + report["hash"] == len(table)
+    assert report["sorted"] > 0
+    assert report["bytes"] < report["dense_bytes"]
+
+    candidates = (
+        words
+        + [word[:3] for word in words]
+        + [word[::-1] for word in words]
+        + ["", "x"]
+    )
+    expected = [word in words for word in candidates]
+
+    assert [table.accepts(word) for word in candidates] == expected
+
+    rows = table.rows
+
+    for state in range(len(table)):
+        assert list(table.edges(state)) == [
+            (column, destiny)
+            for column, destiny in enumerate(rows[state])
+            if destiny != DEAD
+        ]
+
+        for column in range(table.width):
+            assert table.destiny(state, column) == rows[state][column]
+
+    # Rows are rebuilt for the caller only, the table stays sparse
+    assert not table.layout.dense
+    assert [table.accepts(word) for word in candidates] == expected
+
+    # A state with a few more transitions gets a hashed row
+    wide = DeterministicFiniteAutomata.builder()
+    root = wide.add_state(initial=True)
+    children = [wide.add_state(accept=True) for _ in alphabet]
+
+    for symbol, child in zip(alphabet, children):
+        wide.add_transition(root, child, symbol)
+
+    for symbol, child in zip(alphabet[:10], children[1:]):
+        wide.add_transition(children[0], child, symbol)
+
+    table = wide.freeze().compile()
+
+    assert table.layout.kind(1) == "hash"
+    assert table.accepts(alphabet[0] + alphabet[3])
+    assert not table.accepts(alphabet[0] + alphabet[30])
+    assert not table.accepts(alphabet[1] + alphabet[3])
+
+
+def test_sparse_row_layout_algorithms():
+    """
+    Test case for algorithms over sparse tables, which should read them state by state instead of
+    rebuilding their dense rows
+    """
+    alphabet = [chr(0x400 + symbol) for symbol in range(4 * DENSE_WIDTH)]
+    words = [
+        "".join(alphabet[(start * 7 + step) % len(alphabet)] for step in range(4))
+        for start in range(len(alphabet))
+    ]
+
+    builder = DeterministicFiniteAutomata.builder()
+    root = builder.add_state(initial=True)
+    paths = {"": root}
+
+    for word in words:
+        for end in range(1, len(word) + 1):
+            if word[:end] not in paths:
+                paths[word[:end]] = builder.add_state(accept=end == len(word))
+                builder.add_transition(
+                    paths[word[: end - 1]], paths[word[:end]], word[end - 1]
+                )
+
+    machine = builder.freeze()
+    table = machine.compile()
+
+    assert not table.layout.dense
+
+    verdict = machine.is_empty()
+
+    assert not verdict
+    assert len(verdict.counterexample) == 4 and machine.accepts(verdict.counterexample)
+    assert (machine & machine).accepts(words[0])
+    assert not (machine - machine).accepts(words[0])
+    assert machine.fingerprint() == machine.minimize().fingerprint()
+
+    # Every minimizer agrees, with the sink left implicit or not
+    for complete in [False, True]:
+        results = [
+            machine.minimize(method, complete=complete)
+            for method in ["hopcroft", "valmari", "brzozowski"]
+        ]
+
+        assert len(set(len(result.states) for result in results)) == 1
+        assert len(results[0].states) == 3 * len(words) + 2 + complete
+
+        for result in results:
+            assert all(result.accepts(word) for word in words)
+            assert not any(result.accepts(word[:3]) for word in words)
+            assert not result.accepts(words[0][1:] + words[0][0])
+
+    complement = machine.complement()
+
+    assert not complement.accepts(words[0])
+    assert complement.accepts(words[0][:2])
+    assert not table.complemented().layout.dense
+
+    assert machine.compile() is table
+    assert not table.layout.dense
+    assert table._rows is None
@@ -0,0 +1,61 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    NonDeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+from autome.regex.regex import Regex
+
+
+def test_state_index():
+    """
+    Test case for the initial state, acceptance states and accept bitmap kept by the automata
+    """
+    states = [State("0", initial=True), State("1", accept=True), State("2")]
+    machine = DeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[1], states[2], "a"),
+        ],
+    )
+
+    assert machine.initial() is states[0]
+    assert machine.final() == [states[1]]
+    assert machine.final() is machine.final()
+    assert machine.accept_bitmap() == bytearray([0, 1, 0])
+    assert machine.compile().accept is machine.accept_bitmap()
+
+    extra = State("3", accept=True)
+    machine.add_state(extra)
+    machine.add_transition(states[2], extra, "b")
+
+    assert machine.final() == [states[1], extra]
+    assert machine.accept_bitmap() == bytearray([0, 1, 0, 1])
+    assert machine.accepts("aab")
+
+    states[1].accept = False
+    machine.invalidate()
+
+    assert machine.final() == [extra]
+    assert not machine.accepts("a")
+
+
+def test_state_index_closures():
+    """
+    Test case for the acceptance mask of the closure index, built from the accept bitmap
+    """
+    machine = Regex("(a|b)* a b").automata()
+
+    assert isinstance(machine, NonDeterministicFiniteAutomata)
+
+    index = machine.closure_index()
+    mask = 0
+
+    for position, state in enumerate(index.states):
+        if state.accept:
+            mask |= 1 << position
+
+    assert index.final == mask
+    assert machine.accepts("aab")
+    assert not machine.accepts("aba")
@@ -0,0 +1,41 @@
+import pickle
+
+from autome.automatas.finite_automata import State, Transition
+
+
+def test_state_records():
+    """
+    Test case for the compact State records, whose names and uids are only built when needed
+    """
+    state = State(accept=True)
+
+    assert not hasattr(state, "__dict__")
+    assert state._name is None and state._uid is None
+    assert state.name == f"q{state.id}"
+
+    uid = state.uid
+    assert state.uid == uid and len(uid) == 36
+
+    named = State("start", initial=True)
+    assert named.name == "start"
+    assert named == State("start") and hash(named) == hash(State("start"))
+    assert named != state
+
+    copy = pickle.loads(pickle.dumps(state))
+    assert copy == state and copy.uid == uid and copy.accept
+
+
+def test_transition_records():
+    """
+    Test case for Transition records, with tuple hashing and interned symbols
+    """
+    origin, destiny = State(), State()
+    symbol = "".join(["a", "b"])
+
+    first = Transition(origin, destiny, symbol)
+    second = Transition(origin, destiny, "ab")
+
+    assert not hasattr(first, "__dict__")
+    assert first.symbol is second.symbol
+    assert first == second and hash(first) == hash(second)
+    assert len({first, second, Transition(destiny, origin, "ab")}) == 2
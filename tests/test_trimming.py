@@ -0,0 +1,117 @@
+from autome.automatas.finite_automata import (
+    DeterministicFiniteAutomata,
+    NonDeterministicFiniteAutomata,
+    State,
+    Transition,
+)
+from autome.regex.regex import Regex
+
+
+def test_trimming():
+    """
+    Test case for removing unreachable states and states that can't reach an acceptance state
+    """
+    states = [
+        State("0", initial=True),
+        State("1", accept=True),
+        State("dead"),
+        State("unreachable", accept=True),
+    ]
+    machine = NonDeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[0], states[2], "a"),
+            Transition(states[2], states[2], "b"),
+            Transition(states[1], states[0], "&"),
+            Transition(states[3], states[1], "c"),
+        ],
+    )
+
+    words = ["", "a", "aa", "ab", "aab", "c"]
+    expected = [machine.accepts(word) for word in words]
+
+    assert machine.trim() is machine
+    assert machine.states == states[:2]
+    assert len(machine.transitions) == 2
+    assert set(machine.transition_map) == set(states[:2])
+    assert [machine.accepts(word) for word in words] == expected
+
+    # Nothing left to remove
+    compiled = machine.compile()
+    assert machine.trim().compile() is compiled
+
+
+def test_trimming_empty_language():
+    """
+    Test case for trimming an automata that accepts nothing, which keeps its initial state
+    """
+    states = [State("0", initial=True), State("1")]
+    machine = DeterministicFiniteAutomata(
+        states=states, transitions=[Transition(states[0], states[1], "a")]
+    )
+
+    machine.trim()
+
+    assert machine.states == [states[0]]
+    assert machine.transitions == []
+    assert machine.is_empty()
+
+
+def test_trimmed_constructions():
+    """
+    Test case for determinizations and regex automatas, which come out trimmed
+    """
+    states = [State("0", initial=True), State("1", accept=True), State("2")]
+    machine = NonDeterministicFiniteAutomata(
+        states=states,
+        transitions=[
+            Transition(states[0], states[1], "a"),
+            Transition(states[0], states[2], "b"),
+            Transition(states[2], states[2], "b"),
+        ],
+    )
+
+    deterministic = machine.determinize()
+
+    assert len(deterministic.states) == 2
+    assert deterministic.accepts("a")
+    assert not deterministic.accepts("b")
+
+    for expression in ["(a|b)* a b", "(a b c)|a", "(a b)* c*", "a* (b|c)"]:
+        automata = Regex(expression).automata()
+        size = len(automata.states)
+
+        assert len(automata.trim().states) == size
+        assert len(automata.determinize().trim().states) == len(
+            automata.determinize().states
+        )
+
+    left = Regex("a b*").automata().determinize()
+    right = Regex("b a*").automata().determinize()
+    union = left.cross_union(right)
+
+    assert len(union.trim().states) == len(union.states)
+
+
+def test_trimming_dangling_transitions():
+    """
+    Test case for transitions touching states outside the automata, which are always dropped
+    """
+    states = [State("0", initial=True), State("1", accept=True)]
+    outside = State("outside", accept=True)
+
+    for last in [states[1], State("2")]:
+        machine = NonDeterministicFiniteAutomata(
+            states=states + [last],
+            transitions=[
+                Transition(states[0], states[1], "a"),
+                Transition(outside, states[1], "b"),
+                Transition(states[0], outside, "c"),
+            ],
+        )
+
+        machine.trim()
+
+        assert machine.states == states
+        assert machine.transitions == [Transition(states[0], states[1], "a")]